@@ -1,6 +1,19 @@
 import { createApi, fetchBaseQuery } from "@reduxjs/toolkit/query/react";
 import type { Project } from "../../types/project";
 
+export interface FacetCount {
+  value: string;
+  count: number;
+}
+
+export interface ProjectFacets {
+  count: number;
+  status: FacetCount[];
+  health: FacetCount[];
+  owner: FacetCount[];
+  tags: FacetCount[];
+}
+
 export interface PaginatedProjects {
   count: number;
   limit: number;
@@ -8,6 +21,27 @@ export interface PaginatedProjects {
   results: Project[];
 }
 
+export type BatchOperation =
+  | { op: "create"; data: Partial<Project> }
+  | { op: "update"; id: number; version?: number; data: Partial<Project> }
+  | { op: "delete" | "restore"; id: number; version?: number };
+
+export interface BatchResult {
+  index: number;
+  op: BatchOperation["op"];
+  status: number; // 424: undone because a later item failed an atomic batch
+  id?: number;
+  etag?: string;
+  project?: Project;
+  errors?: Record<string, string[]>;
+  current_version?: number;
+}
+
+export interface BatchResponse {
+  committed: boolean;
+  results: BatchResult[];
+}
+
 // tiny helper to read a cookie by name
 function getCookie(name: string): string | undefined {
   const match = document.cookie
@@ -52,6 +86,12 @@ export const projectApi = createApi({
       query: () => "projects/filters/health/",
     }),
 
+    // Counts per status/health/owner/tag for the current filters, in one call
+    getFacets: builder.query<ProjectFacets, Record<string, any>>({
+      query: (params) => ({ url: "projects/facets/", params }),
+      providesTags: [{ type: "Project", id: "LIST" }],
+    }),
+
     // List with filters
     getProjects: builder.query<
       PaginatedProjects,
@@ -177,6 +217,22 @@ export const projectApi = createApi({
       invalidatesTags: [{ type: "Project", id: "LIST" }],
     }),
 
+    // Mixed create/update/delete/restore in one request, each with its own version
+    batchProjects: builder.mutation<
+      BatchResponse,
+      { operations: BatchOperation[]; atomic?: boolean }
+    >({
+      query: (body) => ({
+        url: "projects/batch/",
+        method: "POST",
+        body,
+      }),
+      invalidatesTags: [
+        { type: "Project", id: "LIST" },
+        { type: "Project", id: "DELETED_LIST" },
+      ],
+    }),
+
     // List deleted projects (paginated like normal list)
     getDeletedProjects: builder.query<
       PaginatedProjects,
@@ -231,12 +287,14 @@ export const {
   useGetTagsQuery,
   useGetStatusesQuery,
   useGetHealthsQuery,
+  useGetFacetsQuery,
   useGetProjectsQuery,
   useGetProjectByIdQuery,
   useCreateProjectMutation,
   useUpdateProjectMutation,
   useDeleteProjectMutation,
   useBulkUpdateProjectsMutation,
+  useBatchProjectsMutation,
   useGetDeletedProjectsQuery,
   useRecoverProjectMutation,
   useBulkRecoverProjectsMutation,
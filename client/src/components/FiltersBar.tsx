@@ -6,12 +6,7 @@ import {
   TagInput,
   ClearButton,
 } from "../assets/styles/theme";
-import {
-  useGetHealthsQuery,
-  useGetOwnersQuery,
-  useGetStatusesQuery,
-  useGetTagsQuery,
-} from "../app/api/projectApi";
+import { useGetFacetsQuery } from "../app/api/projectApi";
 import type { Filters } from "../types/filters";
 
 interface FiltersBarProps {
@@ -22,10 +17,12 @@ interface FiltersBarProps {
 export const FiltersBar = ({ filters, onChange }: FiltersBarProps) => {
   const [localFilters, setLocalFilters] = useState(filters);
 
-  const { data: owners } = useGetOwnersQuery();
-  const { data: tags } = useGetTagsQuery();
-  const { data: statuses } = useGetStatusesQuery();
-  const { data: healths } = useGetHealthsQuery();
+  // one request for every dropdown, counted against the active filters
+  const { data: facets } = useGetFacetsQuery({ ...filters, is_deleted: "false" });
+  const statuses = facets?.status;
+  const healths = facets?.health;
+  const tags = facets?.tags;
+  const owners = facets?.owner;
 
   const handleChange = (key: keyof Filters, value: string) => {
     const updated = { ...localFilters, [key]: value };
@@ -74,9 +71,9 @@ export const FiltersBar = ({ filters, onChange }: FiltersBarProps) => {
         onChange={(e) => handleChange("status", e.target.value)}
       >
         <option value="">All Statuses</option>
-        {statuses?.map((s) => (
-          <option key={s} value={s}>
-            {s}
+        {statuses?.map(({ value, count }) => (
+          <option key={value} value={value}>
+            {value} ({count})
           </option>
         ))}
       </Select>
@@ -86,9 +83,9 @@ export const FiltersBar = ({ filters, onChange }: FiltersBarProps) => {
         onChange={(e) => handleChange("health", e.target.value)}
       >
         <option value="">All Health</option>
-        {healths?.map((h) => (
-          <option key={h} value={h}>
-            {h}
+        {healths?.map(({ value, count }) => (
+          <option key={value} value={value}>
+            {value} ({count})
           </option>
         ))}
       </Select>
@@ -98,9 +95,9 @@ export const FiltersBar = ({ filters, onChange }: FiltersBarProps) => {
         onChange={(e) => handleChange("tags", e.target.value)}
       >
         <option value="">All Tags</option>
-        {tags?.map((t) => (
-          <option key={t} value={t}>
-            {t}
+        {tags?.map(({ value, count }) => (
+          <option key={value} value={value}>
+            {value} ({count})
           </option>
         ))}
       </Select>
@@ -112,8 +109,8 @@ export const FiltersBar = ({ filters, onChange }: FiltersBarProps) => {
         list="owners-list"
       />
       <datalist id="owners-list">
-        {owners?.map((o) => (
-          <option key={o} value={o} />
+        {owners?.map(({ value }) => (
+          <option key={value} value={value} />
         ))}
       </datalist>
 
@@ -1,23 +1,63 @@
 import { useEffect, useRef } from "react";
 import { projectApi } from "../app/api/projectApi";
 
-export function useProjectSSE(dispatch: any) {
+// Optional list filters; the server then only streams events for matching
+// projects (status, owner, health, tags, ids, is_deleted).
+export type StreamFilters = Record<string, string | undefined>;
+
+export function streamQuery(filters?: StreamFilters): URLSearchParams {
+  const params = new URLSearchParams();
+  for (const [key, value] of Object.entries(filters ?? {})) {
+    if (value) params.set(key, value);
+  }
+  return params;
+}
+
+export function useProjectSSE(dispatch: any, filters?: StreamFilters) {
+  const filterKey = streamQuery(filters).toString();
   const esRef = useRef<EventSource | null>(null);
   const backoffRef = useRef(1000); // ms
+  const lastEventIdRef = useRef<string | null>(null);
 
   useEffect(() => {
     let closed = false;
 
     const connect = () => {
       // goes through Vite proxy because of /api prefix
-      const es = new EventSource("/api/v1/projects/stream/");
+      // resume after the last seen event so the server only replays the gap
+      const params = new URLSearchParams(filterKey);
+      if (lastEventIdRef.current) {
+        params.set("last_event_id", lastEventIdRef.current);
+      }
+      const qs = params.toString();
+      const es = new EventSource(`/api/v1/projects/stream/${qs ? `?${qs}` : ""}`);
       esRef.current = es;
 
       es.onmessage = (ev) => {
         backoffRef.current = 1000; // reset backoff on any message
+        if (ev.lastEventId) lastEventIdRef.current = ev.lastEventId;
         try {
           const msg = JSON.parse(ev.data);
-          if (
+          if (msg.type === "resync" || msg.type === "projects_imported") {
+            // missed events are no longer buffered server-side, or a bulk
+            // import added rows in one go: refetch lists
+            dispatch(
+              projectApi.util.invalidateTags([
+                { type: "Project", id: "LIST" },
+                { type: "Project", id: "DELETED_LIST" },
+              ])
+            );
+          } else if (msg.type === "projects_batch") {
+            // one event for a whole bulk operation
+            const ids: number[] = msg.ids ?? [];
+            dispatch(
+              projectApi.util.invalidateTags([
+                ...ids.map((id) => ({ type: "Project" as const, id })),
+                { type: "Project", id: "LIST" },
+                { type: "Project", id: "DELETED_LIST" },
+              ])
+            );
+          } else if (
             msg.type === "project_updated" ||
             msg.type === "project_created"
           ) {
@@ -59,5 +99,5 @@ export function useProjectSSE(dispatch: any) {
       closed = true;
       esRef.current?.close();
     };
-  }, [dispatch]);
+  }, [dispatch, filterKey]);
 }
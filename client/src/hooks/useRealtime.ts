@@ -1,11 +1,14 @@
 import { useEffect } from "react";
+import { streamQuery, type StreamFilters } from "./useProjectSSE";
 
-export const useRealtime = (onMessage: () => void) => {
+export const useRealtime = (onMessage: () => void, filters?: StreamFilters) => {
+  const filterKey = streamQuery(filters).toString();
   useEffect(() => {
     const API_PREFIX = import.meta.env.VITE_API_PREFIX ?? "/api";
-    const source = new EventSource(`${API_PREFIX}/v1/projects/stream`);
+    const qs = filterKey ? `?${filterKey}` : "";
+    const source = new EventSource(`${API_PREFIX}/v1/projects/stream/${qs}`);
     source.onmessage = () => onMessage();
     source.onerror = () => source.close();
     return () => source.close();
-  }, [onMessage]);
+  }, [onMessage, filterKey]);
 };
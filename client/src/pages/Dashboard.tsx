@@ -15,7 +15,6 @@ const PAGE_SIZE = 9;
 
 export const Dashboard = () => {
   const dispatch = useDispatch();
-  useProjectSSE(dispatch);
 
   const [filters, setFilters] = useState<Record<string, any>>({});
   const [page, setPage] = useState(1);
@@ -36,12 +35,25 @@ export const Dashboard = () => {
     };
   }, [page, filters, ordering]);
 
+  // only stream events for projects this view could be showing
+  const streamFilters = useMemo(
+    () => ({
+      status: filters.status,
+      owner: filters.owner,
+      health: filters.health,
+      tags: filters.tags,
+      is_deleted: "false",
+    }),
+    [filters]
+  );
+  useProjectSSE(dispatch, streamFilters);
+
   const {
     data: projects,
     isLoading,
     refetch,
   } = useGetProjectsQuery(queryParams);
-  useRealtime(refetch);
+  useRealtime(refetch, streamFilters);
 
   const [selected, setSelected] = useState<(string | number)[]>([]);
   const [isAddOpen, setIsAddOpen] = useState(false);
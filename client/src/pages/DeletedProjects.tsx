@@ -12,7 +12,7 @@ const PAGE_SIZE = 9;
 
 export const DeletedProjects = () => {
   const dispatch = useDispatch();
-  useProjectSSE(dispatch);
+  useProjectSSE(dispatch, { is_deleted: "true" });
   const [page, setPage] = useState(1);
   const query = useMemo(() => {
     const offset = (page - 1) * PAGE_SIZE;
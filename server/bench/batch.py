@@ -0,0 +1,100 @@
+"""
+Batch endpoint benchmark: N mixed edits (versioned partial updates, a few
+deletes and restores) sent as N individual requests against one POST to
+/projects/batch, atomic and per-item. Runs on a SQLite file so each
+request's commit is paid for, and counts the realtime events published.
+
+    python bench/batch.py --rows 5000 --ops 200
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import tempfile
+import time
+
+from common import synthetic_projects, use_database
+
+from django.test import Client
+
+from projects import realtime
+from projects.models import Project
+
+
+def operations(projects, round_no):
+    ops = []
+    for i, p in enumerate(projects):
+        if i % 10 == 9:
+            ops.append({"op": "restore" if p.is_deleted else "delete", "id": p.id, "version": p.version})
+        else:
+            ops.append({"op": "update", "id": p.id, "version": p.version,
+                        "data": {"progress": float(round_no % 100), "status": "paused" if round_no % 2 else "active"}})
+    return ops
+
+
+def individually(client, ops):
+    for op in ops:
+        if_match = {"HTTP_IF_MATCH": f'W/"{op["version"]}"'}
+        if op["op"] == "update":
+            resp = client.patch(f"/api/v1/projects/{op['id']}/", json.dumps(op["data"]),
+                                content_type="application/json", **if_match)
+        elif op["op"] == "delete":
+            resp = client.delete(f"/api/v1/projects/{op['id']}/")
+        else:
+            resp = client.post("/api/v1/projects/bulk-recover/", json.dumps({"ids": [op["id"]]}),
+                               content_type="application/json")
+        assert resp.status_code < 300, (op, resp.status_code)
+
+
+def batched(atomic):
+    def run(client, ops):
+        resp = client.post("/api/v1/projects/batch/", json.dumps({"atomic": atomic, "operations": ops}),
+                           content_type="application/json")
+        assert resp.status_code == 200 and resp.json()["committed"], resp.content[:200]
+    return run
+
+
+def measure(client, ids, send, round_no, repeat):
+    published = []
+    realtime.publish, original = published.append, realtime.publish
+    elapsed = 0.0
+    try:
+        for i in range(repeat):
+            ops = operations(list(Project.objects.filter(id__in=ids).order_by("id")), round_no + i)
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                send(client, ops)
+            elapsed += time.perf_counter() - started
+    finally:
+        realtime.publish = original
+    n = len(ids) * repeat
+    return {"ops_per_sec": round(n / elapsed), "ms_per_op": round(elapsed / n * 1000, 3),
+            "events_per_run": len(published) / repeat}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--ops", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        use_database(os.path.join(tmp, "bench.sqlite3"))
+        Project.objects.bulk_create(synthetic_projects(args.rows), batch_size=2000)
+        ids = list(Project.objects.order_by("id").values_list("id", flat=True)[:args.ops])
+        client = Client(SERVER_NAME="localhost")
+        results = {"ops": args.ops}
+        for round_no, (name, send) in enumerate((("individual_requests", individually),
+                                                  ("batch_atomic", batched(True)),
+                                                  ("batch_per_item", batched(False)))):
+            results[name] = measure(client, ids, send, round_no * args.repeat, args.repeat)
+        base = results["individual_requests"]["ops_per_sec"]
+        for name in ("batch_atomic", "batch_per_item"):
+            results[name]["speedup"] = round(results[name]["ops_per_sec"] / base, 1)
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
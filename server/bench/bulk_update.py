@@ -0,0 +1,51 @@
+"""
+bulk-update benchmark: query count and latency of POST /projects/bulk-update/
+for growing id sets, run through the Django test client against a throwaway
+in-memory database.
+
+    python bench/bulk_update.py --sizes 10 1000 50000
+"""
+import argparse
+import json
+import time
+
+from common import setup_database, synthetic_projects
+
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from projects.models import Project
+
+
+def run(size, client):
+    Project.objects.all().delete()
+    Project.objects.bulk_create(synthetic_projects(size), batch_size=2000)
+    ids = list(Project.objects.values_list("id", flat=True))
+    body = json.dumps({"ids": ids, "status": "paused", "tag": "bulk"})
+
+    with CaptureQueriesContext(connection) as queries:
+        started = time.perf_counter()
+        resp = client.post("/api/v1/projects/bulk-update/", body, content_type="application/json")
+        elapsed = time.perf_counter() - started
+    assert resp.status_code == 200, resp.content
+    return {
+        "ids": size,
+        "queries": len(queries),
+        "latency_ms": round(elapsed * 1000, 1),
+        "updated_count": resp.json()["updated_count"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 50000])
+    args = parser.parse_args()
+
+    setup_database()
+    client = Client(SERVER_NAME="localhost")
+    print(json.dumps([run(size, client) for size in args.sizes], indent=2))
+
+
+if __name__ == "__main__":
+    main()
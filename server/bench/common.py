@@ -0,0 +1,32 @@
+"""Shared setup for the benchmark scripts: Django bootstrap and a throwaway database."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "server.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+
+# unsaved projects with seed_projects' owner, tag and status distributions
+from projects.management.commands.seed_projects import generate as synthetic_projects  # noqa: E402,F401
+
+
+def setup_database():
+    """Migrate a fresh test database (in-memory for SQLite) and switch to it."""
+    setup_test_environment()
+    connection.settings_dict["TEST"]["NAME"] = None  # the test suite's file: not here
+    connection.creation.create_test_db(verbosity=0)
+
+
+def use_database(path):
+    """Switch to a persistent SQLite file (created and migrated if needed)."""
+    from django.core.management import call_command
+
+    connection.close()
+    connection.settings_dict["NAME"] = str(path)
+    call_command("migrate", verbosity=0)
@@ -0,0 +1,83 @@
+"""
+Export memory benchmark: peak Python heap (tracemalloc) while downloading
+/projects/export/ through the WSGI test client, through the ASGI one, and
+through ASGI with the plain sync iterator (what Django 5.0 buffers whole).
+RSS is not used: SQLite's mmap counts the database file's pages into it.
+
+    python bench/export.py --rows 200000
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+MODES = ("wsgi", "asgi", "asgi_sync_iterator")
+
+
+def seed(path, rows):
+    from common import synthetic_projects, use_database
+
+    from projects.models import Project
+
+    use_database(path)
+    Project.objects.bulk_create(synthetic_projects(rows), batch_size=2000)
+
+
+def run(mode, path):
+    from common import use_database
+
+    from django.conf import settings
+    from django.test import AsyncClient, Client
+
+    from projects import views
+    from projects.models import Project
+
+    use_database(path)
+    Project.objects.exists()  # connect and warm up outside the measurement
+    settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, "testserver"]  # AsyncClient's host
+    if mode == "asgi_sync_iterator":
+        views.streamed = lambda chunks: chunks
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    if mode == "wsgi":
+        size = sum(map(len, Client(SERVER_NAME="localhost").get("/api/v1/projects/export/").streaming_content))
+    else:
+        async def download():
+            resp = await AsyncClient().get("/api/v1/projects/export/")
+            return sum([len(chunk) async for chunk in aiter(resp)])
+
+        size = asyncio.run(download())
+    return {"mb": round(size / 2**20, 1), "seconds": round(time.perf_counter() - started, 2),
+            "peak_heap_mb": round(tracemalloc.get_traced_memory()[1] / 2**20, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--db", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run(args.mode, args.db)))
+        return
+    # each mode in a fresh interpreter, so peak RSS is its own
+    results = {"rows": args.rows}
+    with tempfile.TemporaryDirectory() as tmp:
+        db = os.path.join(tmp, "export.sqlite3")
+        seed(db, args.rows)
+        for mode in MODES:
+            out = subprocess.run([sys.executable, __file__, "--mode", mode, "--db", db],
+                                 check=True, capture_output=True, text=True).stdout
+            results[mode] = json.loads(out.strip().splitlines()[-1])
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Ingestion benchmark: CI agents reporting progress for P projects every tick,
+sent as one PATCH per sample against one POST /projects/ingest per tick,
+flushed every --ticks-per-flush ticks. Reports samples/sec (request and
+flush time included), rows written and realtime events.
+
+    python bench/ingest.py --projects 300 --ticks 20 --ticks-per-flush 5
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import tempfile
+import time
+
+from common import synthetic_projects, use_database
+
+from django.conf import settings
+from django.test import Client
+
+from projects import ingest, realtime
+from projects.models import Project
+
+
+def samples(ids, tick):
+    rnd = random.Random(tick)
+    return [{"id": pk, "progress": round(rnd.uniform(0, 100), 1),
+             "health": rnd.choice(("good", "good", "good", "warning"))} for pk in ids]
+
+
+def by_patch(client, ids, ticks, _):
+    for tick in range(ticks):
+        for sample in samples(ids, tick):
+            pk = sample.pop("id")
+            client.patch(f"/api/v1/projects/{pk}/", json.dumps(sample), content_type="application/json")
+
+
+def by_ingest(client, ids, ticks, per_flush):
+    for tick in range(ticks):
+        resp = client.post("/api/v1/projects/ingest/", json.dumps({"samples": samples(ids, tick)}),
+                           content_type="application/json")
+        assert resp.status_code == 202, resp.content[:200]
+        if (tick + 1) % per_flush == 0:
+            ingest.flush()  # what the flush thread does every interval
+    ingest.flush()
+
+
+def measure(send, client, ids, ticks, per_flush):
+    published = []
+    realtime.publish, original = published.append, realtime.publish
+    versions_before = sum(Project.objects.filter(id__in=ids).values_list("version", flat=True))
+    started = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            send(client, ids, ticks, per_flush)
+    finally:
+        realtime.publish = original
+    elapsed = time.perf_counter() - started
+    versions_after = sum(Project.objects.filter(id__in=ids).values_list("version", flat=True))
+    n = len(ids) * ticks
+    return {"samples_per_sec": round(n / elapsed), "seconds": round(elapsed, 2),
+            "row_writes": versions_after - versions_before, "events": len(published)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--projects", type=int, default=300)
+    parser.add_argument("--ticks", type=int, default=20)
+    parser.add_argument("--ticks-per-flush", type=int, default=5,
+                        help="Agent pushes per flush interval (e.g. 2 s pushes, 10 s flushes: 5).")
+    args = parser.parse_args()
+
+    settings.INGEST_FLUSH_INTERVAL_SECS = 3600  # flushed explicitly, no background thread
+    with tempfile.TemporaryDirectory() as tmp:
+        use_database(os.path.join(tmp, "bench.sqlite3"))
+        Project.objects.bulk_create(synthetic_projects(args.projects * 2), batch_size=2000)
+        ids = list(Project.objects.order_by("id").values_list("id", flat=True)[:args.projects])
+        client = Client(SERVER_NAME="localhost")
+        results = {"projects": args.projects, "ticks": args.ticks, "ticks_per_flush": args.ticks_per_flush,
+                   "patch_per_sample": measure(by_patch, client, ids, args.ticks, args.ticks_per_flush),
+                   "ingest": measure(by_ingest, client, ids, args.ticks, args.ticks_per_flush)}
+        results["speedup"] = round(results["ingest"]["samples_per_sec"]
+                                   / results["patch_per_sample"]["samples_per_sec"], 1)
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+List serialization benchmark: the values_list() + compiled converter read
+path against ProjectSerializer, in rows/sec and per-request latency. That
+both render identical bytes is covered by projects/tests/test_rows.py.
+
+    python bench/list_serialization.py --rows 20000 --limit 200
+"""
+import argparse
+import json
+import time
+
+from common import setup_database, synthetic_projects
+
+from django.test import Client
+from rest_framework.renderers import JSONRenderer
+
+from projects.models import Project
+from projects.rows import PROJECT_FIELDS, to_dicts
+from projects.serializers import ProjectSerializer
+
+
+def rate(fn, rows, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = time.perf_counter() - started
+    return {"rows_per_sec": round(rows * repeat / elapsed), "ms_per_page": round(elapsed / repeat * 1000, 2)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--limit", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    setup_database()
+    Project.objects.bulk_create(synthetic_projects(args.rows), batch_size=2000)
+    client = Client(SERVER_NAME="localhost")
+
+    renderer = JSONRenderer()
+    page = Project.objects.order_by("-last_updated", "-id")[:args.limit]
+    rows = page.values_list(*PROJECT_FIELDS)
+    url = f"/api/v1/projects/?limit={args.limit}"
+    results = {
+        "serializer": rate(lambda: renderer.render(ProjectSerializer(list(page), many=True).data),
+                           args.limit, args.repeat),
+        "values_list": rate(lambda: renderer.render(to_dicts(list(rows))), args.limit, args.repeat),
+        "list_endpoint": rate(lambda: client.get(url), args.limit, args.repeat),
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
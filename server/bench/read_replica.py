@@ -0,0 +1,94 @@
+"""
+Read replica benchmark: list/facet latency while another thread keeps
+running bulk-update over most of the table, with reads on the primary and
+then on a replica (a second SQLite file copied by replicate_sqlite).
+
+    python bench/read_replica.py --rows 20000 --reads 300
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+from common import synthetic_projects, use_database
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connections
+from django.test import Client
+
+from projects.models import Project
+
+URLS = ("/api/v1/projects/?limit=50", "/api/v1/projects/?status=active&limit=50",
+        "/api/v1/projects/facets/")
+
+
+def writer(ids, stop, counts):
+    client = Client(SERVER_NAME="localhost")
+    i = 0
+    while not stop.is_set():
+        body = {"ids": ids, "status": ("paused", "active")[i % 2]}
+        with contextlib.redirect_stdout(io.StringIO()):
+            client.post("/api/v1/projects/bulk-update/", json.dumps(body), content_type="application/json")
+        counts["writes"] += 1
+        i += 1
+    connections.close_all()
+
+
+def read_latencies(reads):
+    client = Client(SERVER_NAME="localhost")
+    samples = []
+    for i in range(reads):
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            resp = client.get(URLS[i % len(URLS)])
+        samples.append((time.perf_counter() - started) * 1000)
+        assert resp.status_code == 200, resp.status_code
+    samples.sort()
+    return {"p50_ms": round(statistics.median(samples), 2),
+            "p95_ms": round(samples[int(len(samples) * 0.95) - 1], 2),
+            "max_ms": round(samples[-1], 2)}
+
+
+def scenario(ids, reads, read_alias):
+    settings.DATABASE_READ_ALIAS = read_alias
+    stop, counts = threading.Event(), {"writes": 0}
+    thread = threading.Thread(target=writer, args=(ids, stop, counts))
+    thread.start()
+    try:
+        result = read_latencies(reads)
+    finally:
+        stop.set()
+        thread.join()
+    return {**result, "concurrent_bulk_updates": counts["writes"]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--reads", type=int, default=300)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.DATABASES["replica"] = {**settings.DATABASES["default"],
+                                         "NAME": os.path.join(tmp, "replica.sqlite3")}
+        connections.settings = connections.configure_settings(settings.DATABASES)
+        use_database(os.path.join(tmp, "primary.sqlite3"))
+        Project.objects.bulk_create(synthetic_projects(args.rows), batch_size=2000)
+        ids = list(Project.objects.values_list("id", flat=True)[: args.rows * 3 // 4])
+        call_command("replicate_sqlite", stdout=io.StringIO())
+
+        results = {"rows": args.rows, "bulk_update_ids": len(ids),
+                   "idle_primary": read_latencies(args.reads)}
+        results["primary_under_writes"] = scenario(ids, args.reads, None)
+        results["replica_under_writes"] = scenario(ids, args.reads, "replica")
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Search benchmark: latency of GET /projects/?q= served from the FTS5 index
+versus the LIKE fallback, at a given table size.
+
+    python bench/search.py --rows 100000 1000000
+"""
+import argparse
+import contextlib
+import io
+import json
+import statistics
+import time
+
+from common import setup_database, synthetic_projects
+
+from django.test import Client
+
+from projects import search
+from projects.models import Project
+
+QUERIES = ["dashboard", "pay", "billing sync", "work item 4242", "nomatch"]
+
+
+def timed(client, q, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            resp = client.get("/api/v1/projects/", {"q": q, "limit": 20})
+        samples.append(time.perf_counter() - started)
+        assert resp.status_code == 200, resp.content
+    return round(statistics.median(samples) * 1000, 2), resp.json()["count"]
+
+
+def run(rows, client, repeat):
+    have = Project.objects.count()
+    if rows > have:
+        Project.objects.bulk_create(synthetic_projects(rows - have, seed=have), batch_size=5000)
+
+    result = {"rows": rows, "queries": {}}
+    for q in QUERIES:
+        search._fts_available = None
+        fts_ms, count = timed(client, q, repeat)
+        search._fts_available = False
+        like_ms, _ = timed(client, q, repeat)
+        result["queries"][q] = {"matches": count, "fts_ms": fts_ms, "like_ms": like_ms}
+    search._fts_available = None
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100000, 1000000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    setup_database()
+    client = Client(SERVER_NAME="localhost")
+    print(json.dumps([run(rows, client, args.repeat) for rows in sorted(args.rows)], indent=2))
+
+
+if __name__ == "__main__":
+    main()
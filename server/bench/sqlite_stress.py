@@ -0,0 +1,143 @@
+"""
+SQLite concurrency stress test: several worker processes (like gunicorn
+sync workers) hammer one database file with list reads, PATCHes,
+bulk-updates and batches for a fixed time. Reports requests that failed with "database
+is locked", and p50/p99 latency per kind, for Django's stock SQLite setup
+(rollback journal, deferred BEGIN), for the pragmas alone, and for this
+project's setup (WAL, busy timeout, BEGIN IMMEDIATE with retry, persistent
+connections).
+
+    python bench/sqlite_stress.py --workers 6 --seconds 20
+"""
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+MODES = ("stock", "wal_deferred", "hardened")
+
+
+def configure(mode, path):
+    """Point the default database at path, before any connection is opened."""
+    from django.conf import settings
+
+    db = settings.DATABASES["default"]
+    db["NAME"] = path
+    if mode == "stock":
+        db.update(ENGINE="django.db.backends.sqlite3", CONN_MAX_AGE=0)
+        settings.SQLITE_PRAGMAS = {}
+    elif mode == "wal_deferred":
+        # the pragmas without BEGIN IMMEDIATE: shows what write_transaction() is for
+        db.update(ENGINE="django.db.backends.sqlite3")
+
+
+def worker(args):
+    mode, path, seconds, ids, seed = args
+    configure(mode, path)
+    from django.test import Client
+
+    rnd = random.Random(seed)
+    client = Client(SERVER_NAME="localhost", raise_request_exception=False)
+    samples = {"read": [], "patch": [], "bulk_update": [], "batch": []}
+    errors = {kind: 0 for kind in samples}
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        roll = rnd.random()
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            if roll < 0.55:
+                kind = "read"
+                resp = client.get(f"/api/v1/projects/?status={rnd.choice(('active', 'paused'))}&limit=50")
+            elif roll < 0.8:
+                kind = "patch"
+                resp = client.patch(f"/api/v1/projects/{rnd.choice(ids)}/",
+                                    json.dumps({"progress": rnd.randrange(100)}),
+                                    content_type="application/json")
+            elif roll < 0.9:
+                kind = "bulk_update"
+                resp = client.post("/api/v1/projects/bulk-update/",
+                                   json.dumps({"ids": rnd.sample(ids, 50),
+                                               "status": rnd.choice(("active", "paused"))}),
+                                   content_type="application/json")
+            else:
+                kind = "batch"
+                ops = [{"op": "update", "id": pk, "data": {"progress": rnd.randrange(100)}}
+                       for pk in rnd.sample(ids, 20)]
+                resp = client.post("/api/v1/projects/batch/", json.dumps({"operations": ops}),
+                                   content_type="application/json")
+        elapsed = (time.perf_counter() - started) * 1000
+        if resp.status_code >= 500:
+            errors[kind] += 1
+        else:
+            samples[kind].append(elapsed)
+    return samples, errors
+
+
+def run(mode, workers, seconds, rows):
+    """One mode, in this (fresh) process."""
+    from common import synthetic_projects  # noqa: F401  (sets up Django)
+
+    tmp = tempfile.mkdtemp()
+    path = os.path.join(tmp, "stress.sqlite3")
+    configure(mode, path)
+    from django.core.management import call_command
+    from django.db import connections
+
+    from projects.models import Project
+
+    call_command("migrate", verbosity=0)
+    Project.objects.bulk_create(synthetic_projects(rows), batch_size=2000)
+    ids = list(Project.objects.values_list("id", flat=True))
+    connections.close_all()
+    if mode == "stock":
+        sqlite3.connect(path).execute("PRAGMA journal_mode = DELETE").close()
+
+    with multiprocessing.get_context("fork").Pool(workers) as pool:
+        results = pool.map(worker, [(mode, path, seconds, ids, i) for i in range(workers)])
+
+    report = {}
+    for kind in ("read", "patch", "bulk_update", "batch"):
+        samples = sorted(s for r, _ in results for s in r[kind])
+        failed = sum(e[kind] for _, e in results)
+        report[kind] = {
+            "ok": len(samples),
+            "locked_errors": failed,
+            "p50_ms": round(statistics.median(samples), 1) if samples else None,
+            "p99_ms": round(samples[max(int(len(samples) * 0.99) - 1, 0)], 1) if samples else None,
+        }
+    report["requests_per_sec"] = round(sum(v["ok"] for v in report.values()) / seconds)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=6)
+    parser.add_argument("--seconds", type=float, default=20)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run(args.mode, args.workers, args.seconds, args.rows)))
+        return
+    # each mode in its own interpreter, so the database backend is chosen before Django connects
+    results = {"workers": args.workers, "seconds": args.seconds}
+    for mode in MODES:
+        out = subprocess.run([sys.executable, __file__, "--mode", mode, "--workers", str(args.workers),
+                              "--seconds", str(args.seconds), "--rows", str(args.rows)],
+                             check=True, capture_output=True, text=True).stdout
+        results[mode] = json.loads(out.strip().splitlines()[-1])
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
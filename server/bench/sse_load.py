@@ -0,0 +1,104 @@
+"""
+SSE load test: open N concurrent /projects/stream/ connections against a
+running server, then measure publish-to-delivery latency and, if the server
+pid is given, resident memory per connection.
+
+    uvicorn server.asgi:application --port 8000 &
+    python bench/sse_load.py --connections 2000 --project 1 --server-pid $!
+
+Publishing is triggered with a PATCH on --project, so it exercises the real
+save -> signal -> realtime path.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import urllib.request
+
+
+def rss_kb(pid):
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+async def open_stream(host, port, path):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(
+        f"GET {path} HTTP/1.1\r\nHost: {host}\r\nAccept: text/event-stream\r\n\r\n".encode()
+    )
+    await writer.drain()
+    # headers + hello frame
+    await reader.readuntil(b"\r\n\r\n")
+    await reader.readuntil(b"\n\n")
+    return reader, writer
+
+
+async def wait_for_event(reader, started):
+    while True:
+        frame = await reader.readuntil(b"\n\n")
+        if b'"heartbeat"' not in frame:
+            return time.perf_counter() - started
+
+
+def patch_project(base, project_id, progress):
+    req = urllib.request.Request(
+        f"{base}/api/v1/projects/{project_id}/",
+        data=json.dumps({"progress": progress}).encode(),
+        headers={"Content-Type": "application/json"},
+        method="PATCH",
+    )
+    urllib.request.urlopen(req).read()
+
+
+async def main(args):
+    path = "/api/v1/projects/stream/"
+    base = f"http://{args.host}:{args.port}"
+
+    rss_before = rss_kb(args.server_pid) if args.server_pid else None
+    streams = []
+    for start in range(0, args.connections, args.batch):
+        n = min(args.batch, args.connections - start)
+        streams += await asyncio.gather(*(open_stream(args.host, args.port, path) for _ in range(n)))
+    await asyncio.sleep(1.0)
+    rss_after = rss_kb(args.server_pid) if args.server_pid else None
+
+    latencies = []
+    for i in range(args.rounds):
+        started = time.perf_counter()
+        waiters = [asyncio.create_task(wait_for_event(r, started)) for r, _ in streams]
+        await asyncio.to_thread(patch_project, base, args.project, float(i % 100))
+        latencies += await asyncio.gather(*waiters)
+
+    for _, w in streams:
+        w.close()
+
+    latencies.sort()
+    result = {
+        "connections": len(streams),
+        "rounds": args.rounds,
+        "latency_ms": {
+            "p50": round(latencies[len(latencies) // 2] * 1000, 2),
+            "p99": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 2),
+            "mean": round(statistics.mean(latencies) * 1000, 2),
+        },
+    }
+    if rss_before is not None:
+        result["server_rss_kb"] = {"before": rss_before, "after": rss_after}
+        result["kb_per_connection"] = round((rss_after - rss_before) / len(streams), 2)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--connections", type=int, default=500)
+    parser.add_argument("--batch", type=int, default=200, help="connections opened concurrently")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--project", type=int, required=True, help="project id to PATCH")
+    parser.add_argument("--server-pid", type=int)
+    asyncio.run(main(parser.parse_args()))
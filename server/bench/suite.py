@@ -0,0 +1,239 @@
+"""
+Benchmark suite: seed a synthetic dataset (seed_projects) and drive the real
+endpoints through the Django test client, writing p50/p95/p99 latency,
+queries per request and RSS per scenario as JSON.
+
+    python bench/suite.py --rows 10000 --output before.json
+    python bench/suite.py --rows 10000 --output after.json --compare before.json
+
+--db keeps the seeded dataset in a file between runs, which matters for 1M
+rows; scenarios that write (PATCH, bulk ops) change a few hundred rows of it.
+Queries per request come from the Server-Timing header.
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import re
+import resource
+import sqlite3
+import subprocess
+import time
+
+from common import setup_database, use_database
+
+from django.core.management import call_command
+from django.test import Client
+
+from projects import realtime
+from projects.models import Project
+from projects.realtime import ProjectFilter
+
+QUERIES = re.compile(r'desc="(\d+) queries"')
+
+
+def rss_kb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return None
+    k = min(len(sorted_values) - 1, max(0, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+
+class Runner:
+    def __init__(self, client, repeat):
+        self.client = client
+        self.repeat = repeat
+        self.results = {}
+
+    def run(self, name, request, repeat=None, setup=None):
+        """request(i) performs one call and returns the response."""
+        latencies, queries = [], []
+        for i in range(repeat or self.repeat):
+            if setup is not None:
+                setup(i)
+            started = time.perf_counter()
+            resp = request(i)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if resp.status_code >= 400:
+                raise RuntimeError(f"{name}: HTTP {resp.status_code} {resp.content[:200]!r}")
+            match = QUERIES.search(resp.get("Server-Timing", ""))
+            if match:
+                queries.append(int(match.group(1)))
+        latencies.sort()
+        self.results[name] = {
+            "n": len(latencies),
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+            "mean_ms": round(sum(latencies) / len(latencies), 2),
+            "queries_per_request": round(sum(queries) / len(queries), 2) if queries else None,
+            "rss_kb": rss_kb(),
+        }
+
+    def get(self, name, url, **headers):
+        urls = url if isinstance(url, list) else [url]
+        self.run(name, lambda i: self.client.get(urls[i % len(urls)], **headers))
+
+
+def run_scenarios(runner, rng, subscribers):
+    client = runner.client
+    live = list(Project.objects.filter(is_deleted=False).values_list("id", flat=True))
+    top_owner = (Project.objects.values_list("owner", flat=True)
+                 .order_by("owner").first() or "a").split()[0].lower()
+    count = len(live)
+
+    base = "/api/v1/projects/?is_deleted=false"
+    runner.get("list", base)
+    runner.get("list_status", base + "&status=active")
+    runner.get("list_health", base + "&health=critical")
+    runner.get("list_owner", base + f"&owner={top_owner}")
+    runner.get("list_tags", base + "&tags=react")
+    runner.get("list_tags_all", base + "&tags=react,django&tags_match=all")
+    runner.get("list_min_progress", base + "&health_min=50")
+    runner.get("list_ordering_title", base + "&ordering=title")
+    runner.get("list_offset_deep", base + f"&offset={max(count // 2, 0)}")
+    runner.get("list_cursor", base + "&pagination=cursor")
+    runner.get("list_deleted", "/api/v1/projects/deleted/")
+    etag = client.get(base + "&status=active")["ETag"]
+    runner.get("list_not_modified", base + "&status=active", HTTP_IF_NONE_MATCH=etag)
+    runner.get("search", [base + f"&q={w}" for w in ("dashboard", "pay", "crm onboarding", "zzz")])
+    runner.get("facets", [base, base + "&status=active", base + "&tags=react"])
+    runner.get("retrieve", [f"/api/v1/projects/{pk}/" for pk in rng.sample(live, min(50, count))])
+
+    versions = dict(Project.objects.filter(id__in=live[:200]).values_list("id", "version"))
+    patch_ids = list(versions)
+
+    def patch(i):
+        pk = patch_ids[i % len(patch_ids)]
+        resp = client.patch(f"/api/v1/projects/{pk}/", {"progress": i % 100},
+                            content_type="application/json", HTTP_IF_MATCH=f'W/"{versions[pk]}"')
+        versions[pk] += 1
+        return resp
+    runner.run("patch_if_match", patch)
+
+    def bulk_update(i):
+        ids = rng.sample(live, min(100, count))
+        body = {"ids": ids, "status": ("paused", "active")[i % 2], "tag": "bench"}
+        return client.post("/api/v1/projects/bulk-update/", body, content_type="application/json")
+    runner.run("bulk_update_100", bulk_update, repeat=max(runner.repeat // 10, 5))
+
+    recover_ids = []
+
+    def soft_delete_batch(_):
+        recover_ids[:] = rng.sample(live, min(100, count))
+        Project.objects.filter(id__in=recover_ids).update(is_deleted=True)
+    runner.run(
+        "bulk_recover_100",
+        lambda i: client.post("/api/v1/projects/bulk-recover/", {"ids": recover_ids},
+                              content_type="application/json"),
+        repeat=max(runner.repeat // 10, 5), setup=soft_delete_batch,
+    )
+
+    # SSE fan-out: PATCH with many in-process subscribers (mixed filters);
+    # the inprocess backend delivers on commit, inside the request
+    filters = [None, ProjectFilter.from_params({"status": "active"}),
+               ProjectFilter.from_params({"owner": top_owner}),
+               ProjectFilter.from_params({"tags": "react", "is_deleted": "false"})]
+    queues = [realtime.subscribe(flt=filters[i % len(filters)]) for i in range(subscribers)]
+    # the bulk scenarios bumped some versions
+    versions.update(Project.objects.filter(id__in=patch_ids).values_list("id", "version"))
+    try:
+        def drain(_):
+            for q in queues:
+                while not q.empty():
+                    q.get_nowait()
+        runner.run("sse_fanout_patch", patch, setup=drain)
+        delivered = sum(1 for q in queues if not q.empty())
+        runner.results["sse_fanout_patch"].update(subscribers=subscribers, delivered_last=delivered)
+    finally:
+        for q in queues:
+            realtime.unsubscribe(q)
+
+
+def compare(current, baseline_path):
+    with open(baseline_path) as f:
+        baseline = json.load(f)["results"]
+    print(f"{'scenario':24} {'p50 ms':>18} {'p99 ms':>18} {'queries':>12}")
+    for name, now in current.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+
+        def delta(key):
+            a, b = before.get(key), now.get(key)
+            if a is None or b is None:
+                return "-"
+            pct = f" ({(b - a) / a * 100:+.0f}%)" if a else ""
+            return f"{a:g}->{b:g}{pct}"
+        print(f"{name:24} {delta('p50_ms'):>18} {delta('p99_ms'):>18} {delta('queries_per_request'):>12}")
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10000, help="e.g. 10000, 100000, 1000000")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--subscribers", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--db", help="SQLite file to keep the seeded dataset in")
+    parser.add_argument("--output", help="write JSON here (default: stdout)")
+    parser.add_argument("--compare", help="previous JSON output to diff against")
+    args = parser.parse_args()
+
+    if args.db:
+        use_database(args.db)
+    else:
+        setup_database()
+
+    started = time.perf_counter()
+    existing = Project.objects.count()
+    if existing == 0:
+        with contextlib.redirect_stdout(io.StringIO()):
+            call_command("seed_projects", args.rows, seed=args.seed)
+    elif existing != args.rows:
+        print(f"note: reusing {existing} rows from {args.db}")
+    seed_secs = time.perf_counter() - started
+
+    runner = Runner(Client(SERVER_NAME="localhost"), args.repeat)
+    run_scenarios(runner, random.Random(args.seed), args.subscribers)
+
+    output = {
+        "meta": {
+            "commit": git_commit(),
+            "rows": Project.objects.count(),
+            "repeat": args.repeat,
+            "seed_secs": round(seed_secs, 1),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        },
+        "results": runner.results,
+    }
+    text = json.dumps(output, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.compare:
+        compare(runner.results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,18 @@
 from django.contrib import admin
-from .models import Project
-from django.contrib import admin
-from .models import Project
+from django.db.models import Count
+from .models import Project, ProjectTag
 
 class TagsFilter(admin.SimpleListFilter):
     title = 'Tags'
     parameter_name = 'tag'
 
     def lookups(self, request, model_admin):
-
-        all_tags = set()
-        for project in Project.objects.all():
-            if isinstance(project.tags, list):
-                all_tags.update(project.tags)
-            else:
-                all_tags.add(project.tags)
-
-        return [(tag, tag) for tag in sorted(all_tags)]
+        counts = ProjectTag.objects.values('name').annotate(n=Count('project')).order_by('name')
+        return [(row['name'], f"{row['name']} ({row['n']})") for row in counts]
 
     def queryset(self, request, queryset):
         if self.value():
-            return queryset.filter(tags__contains=[self.value()])
+            return queryset.filter(tag_rows__name=self.value())
         return queryset
 
 
@@ -5,4 +5,9 @@ class ProjectsConfig(AppConfig):
     name = 'projects'
     
     def ready(self):
-        from . import signals
\ No newline at end of file
+        from django.db.backends.signals import connection_created
+        from . import checks, signals
+        from .metrics import install_db_wrapper
+        from .sqlite import configure_connection
+        connection_created.connect(configure_connection)
+        connection_created.connect(install_db_wrapper)
\ No newline at end of file
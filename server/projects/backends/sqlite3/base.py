@@ -0,0 +1,14 @@
+"""
+Django's SQLite backend, opening transactions through projects.sqlite.begin()
+so write_transaction() can start them with BEGIN IMMEDIATE (Django 5.0 has
+no transaction_mode option).
+"""
+from django.db.backends.sqlite3 import base
+
+from projects.sqlite import begin
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+
+    def _start_transaction_under_autocommit(self):
+        begin(self)
@@ -0,0 +1,56 @@
+"""
+System check for the SQLite triggers the migrations create. Django does not
+know about them, so a migration that rebuilds projects_project (SQLite's
+ALTER TABLE fallback: create, copy, drop, rename) drops them silently and
+tags, search and the changes feed go stale without an error.
+
+    python manage.py check --database default
+"""
+from django.core.checks import Error, Tags, register
+from django.db import connections
+from django.db.migrations.recorder import MigrationRecorder
+
+# migration -> triggers it creates
+TRIGGERS = {
+    "0002_project_fts": ("projects_project_fts_ai", "projects_project_fts_ad", "projects_project_fts_au"),
+    "0003_projecttag": ("projects_projecttag_ai", "projects_projecttag_au", "projects_projecttag_ad"),
+    "0006_project_change_seq": ("projects_project_seq_ai", "projects_project_seq_au", "projects_project_seq_ad"),
+}
+# 0002 skips the FTS index on SQLite builds without FTS5
+FTS_TABLE = "projects_project_fts"
+
+
+def missing_triggers(connection):
+    """Triggers that applied migrations created but the database lacks."""
+    recorder = MigrationRecorder(connection)
+    if not recorder.has_table():
+        return []
+    applied = {name for app, name in recorder.applied_migrations() if app == "projects"}
+    with connection.cursor() as cur:
+        cur.execute("SELECT type, name FROM sqlite_master WHERE type IN ('table', 'trigger')")
+        present = {(kind, name) for kind, name in cur.fetchall()}
+    missing = []
+    for migration, names in TRIGGERS.items():
+        if migration not in applied:
+            continue
+        if migration == "0002_project_fts" and ("table", FTS_TABLE) not in present:
+            continue
+        missing += [name for name in names if ("trigger", name) not in present]
+    return missing
+
+
+@register(Tags.database)
+def check_triggers(app_configs, databases=None, **kwargs):
+    errors = []
+    for alias in databases or ():
+        connection = connections[alias]
+        if connection.vendor != "sqlite":
+            continue
+        for name in missing_triggers(connection):
+            errors.append(Error(
+                f"Trigger {name} is missing from the {alias!r} database.",
+                hint="A table rebuild drops triggers; recreate them with the SQL in the migration "
+                     "that added them, or migrate projects back before it and forward again.",
+                id="projects.E001",
+            ))
+    return errors
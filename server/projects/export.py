@@ -0,0 +1,78 @@
+"""Row encoders for the streaming export (GET /projects/export/)."""
+import csv
+import io
+import json
+
+from asgiref.sync import sync_to_async
+
+from .rows import PROJECT_FIELDS, iso, row_converter
+
+EXPORT_FIELDS = PROJECT_FIELDS
+
+# rows are joined into chunks of about this many bytes before being yielded
+CHUNK_BYTES = 64 * 1024
+
+
+def ndjson_lines(rows):
+    """values_list(*EXPORT_FIELDS) tuples -> one retrieve-shaped JSON object per line."""
+    convert = row_converter(EXPORT_FIELDS)
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    for row in rows:
+        # escaped like DRF's JSONRenderer, so lines match API bytes
+        yield dumps(convert(row)).replace("\u2028", "\\u2028").replace("\u2029", "\\u2029") + "\n"
+
+
+def csv_lines(rows):
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    tags_at = EXPORT_FIELDS.index("tags")
+    updated_at = EXPORT_FIELDS.index("last_updated")
+
+    def take():
+        line = buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+        return line
+
+    writer.writerow(EXPORT_FIELDS)
+    yield take()
+    for row in rows:
+        row = list(row)
+        row[updated_at] = iso(row[updated_at])
+        # a JSON array, which import_projects reads back even when a tag has a comma
+        row[tags_at] = json.dumps(row[tags_at] or [], ensure_ascii=False)
+        writer.writerow(row)
+        yield take()
+
+
+def chunked(lines):
+    """Join encoded lines into ~CHUNK_BYTES pieces, as bytes."""
+    parts, size = [], 0
+    for line in lines:
+        parts.append(line)
+        size += len(line)
+        if size >= CHUNK_BYTES:
+            yield "".join(parts).encode("utf-8")
+            parts, size = [], 0
+    if parts:
+        yield "".join(parts).encode("utf-8")
+
+
+async def streamed(chunks):
+    """
+    Async iterator over a sync one, for StreamingHttpResponse under ASGI.
+    Given a sync iterator, Django 5.0 collects it with sync_to_async(list)
+    before sending a byte; here each chunk is pulled on the request's sync
+    thread (thread_sensitive), so a transaction opened by the iterator
+    stays on one connection and only one chunk is held at a time.
+    """
+    step = sync_to_async(next, thread_sensitive=True)
+    try:
+        while True:
+            chunk = await step(chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+    finally:
+        # client gone or done: leave the transaction on the thread that opened it
+        await sync_to_async(chunks.close, thread_sensitive=True)()
@@ -0,0 +1,127 @@
+"""
+Row parsing and validation for import_projects. Plain functions over plain
+data, with no ORM access, so batches can be validated in worker processes.
+"""
+import json
+from typing import Iterable, List, Optional, Tuple
+
+# Project.STATUS_CHOICES / HEALTH_CHOICES, spelled out: importing .models
+# needs configured settings, which spawned pool workers do not have
+# (tests check the two agree)
+STATUSES = frozenset(("active", "paused", "completed", "planning"))
+HEALTHS = frozenset(("good", "warning", "critical"))
+DEFAULT_STATUS = "active"
+DEFAULT_HEALTH = "good"
+MAX_CHARS = 255
+
+# (line number, NDJSON line or CSV row dict)
+RawRow = Tuple[int, object]
+
+
+def _tags(value) -> List[str]:
+    if value is None or value == "":
+        return []
+    if isinstance(value, str):
+        value = value.strip()
+        # CSV cells hold a JSON array or a comma-separated list
+        value = json.loads(value) if value.startswith("[") else value.split(",")
+    if not isinstance(value, list) or not all(isinstance(t, str) for t in value):
+        raise ValueError("tags must be a list of strings")
+    return [t.strip() for t in value if t.strip()]
+
+
+def _text(raw: dict, name: str) -> str:
+    value = raw.get(name)
+    if value is None:
+        return ""
+    if not isinstance(value, str):
+        raise ValueError(f"{name} must be a string")
+    return value
+
+
+def _bool(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("1", "true", "yes")
+
+
+def clean_row(raw) -> dict:
+    """Validated Project field values for one row; raises ValueError."""
+    if isinstance(raw, str):
+        raw = json.loads(raw)
+    if not isinstance(raw, dict):
+        raise ValueError("row must be an object")
+
+    title = _text(raw, "title").strip()
+    owner = _text(raw, "owner").strip()
+    if not title:
+        raise ValueError("title is required")
+    if not owner:
+        raise ValueError("owner is required")
+    if len(title) > MAX_CHARS or len(owner) > MAX_CHARS:
+        raise ValueError(f"title and owner are limited to {MAX_CHARS} characters")
+
+    status = _text(raw, "status") or DEFAULT_STATUS
+    if status not in STATUSES:
+        raise ValueError(f"status must be one of {sorted(STATUSES)}")
+    health = _text(raw, "health") or DEFAULT_HEALTH
+    if health not in HEALTHS:
+        raise ValueError(f"health must be one of {sorted(HEALTHS)}")
+
+    progress = raw.get("progress")
+    progress = float(progress) if progress not in (None, "") else 0.0
+    if not 0 <= progress <= 100:
+        raise ValueError("progress must be between 0 and 100")
+
+    return {
+        "title": title,
+        "description": _text(raw, "description"),
+        "owner": owner,
+        "tags": _tags(raw.get("tags")),
+        "status": status,
+        "health": health,
+        "progress": progress,
+        "is_deleted": _bool(raw.get("is_deleted") or False),
+    }
+
+
+def validate_batch(rows: Iterable[RawRow]) -> Tuple[List[dict], List[Tuple[int, str]]]:
+    """(valid field dicts, [(line, error)]) for one batch."""
+    valid, errors = [], []
+    for line, raw in rows:
+        try:
+            valid.append(clean_row(raw))
+        except (ValueError, TypeError) as exc:
+            errors.append((line, str(exc)))
+    return valid, errors
+
+
+def read_rows(stream, fmt: str) -> Iterable[RawRow]:
+    """Yield (line, raw) pairs lazily from an NDJSON or CSV text stream."""
+    if fmt == "csv":
+        import csv
+
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+        return
+    for line, text in enumerate(stream, start=1):
+        if text.strip():
+            yield line, text
+
+
+def batched(rows: Iterable[RawRow], size: int) -> Iterable[List[RawRow]]:
+    batch: List[RawRow] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def detect_format(path: str, fmt: Optional[str]) -> str:
+    if fmt:
+        return fmt
+    return "csv" if path.lower().endswith(".csv") else "ndjson"
@@ -0,0 +1,205 @@
+"""
+Write-behind buffer for high-frequency progress/health samples.
+
+Samples are validated, then kept in memory per worker, latest value per
+project. A background thread flushes them every
+INGEST_FLUSH_INTERVAL_SECS in one transaction. Per chunk of FLUSH_CHUNK
+projects the flush reads the targets' current values, drops samples that
+change nothing and writes the rest with one CASE UPDATE; the whole flush
+sends one projects_batch event.
+
+Durability: samples accepted but not yet flushed live only in this
+process. A crash loses at most one interval; a clean shutdown flushes
+(atexit). INGEST_FLUSH_INTERVAL_SECS = 0 writes every request through
+before answering.
+"""
+import atexit
+import logging
+import threading
+import time
+from typing import Dict, List, Tuple
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Case, CharField, F, FloatField, Value, When
+from django.utils import timezone
+
+from .models import Project
+from .realtime import coalesce
+from .signals import emit_rows_changed
+from .sqlite import write_transaction
+
+logger = logging.getLogger(__name__)
+
+HEALTHS = frozenset(c[0] for c in Project.HEALTH_CHOICES)
+FLUSH_CHUNK = 500
+
+# project id -> {"progress": float, "health": str}, either key optional
+Sample = Dict[str, object]
+
+
+def clean_sample(raw) -> Tuple[int, Sample]:
+    """(project id, fields) for one sample; raises ValueError."""
+    if not isinstance(raw, dict):
+        raise ValueError("sample must be an object")
+    try:
+        pk = int(raw["id"])
+    except (KeyError, TypeError, ValueError):
+        raise ValueError("id must be an integer")
+    fields = {}
+    if raw.get("progress") is not None:
+        try:
+            progress = float(raw["progress"])
+        except (TypeError, ValueError):
+            raise ValueError("progress must be a number")
+        if not 0 <= progress <= 100:
+            raise ValueError("progress must be between 0 and 100")
+        fields["progress"] = progress
+    if raw.get("health") is not None:
+        if raw["health"] not in HEALTHS:
+            raise ValueError(f"health must be one of {sorted(HEALTHS)}")
+        fields["health"] = raw["health"]
+    if not fields:
+        raise ValueError("sample needs progress or health")
+    return pk, fields
+
+
+def _case(pending: Dict[int, Sample], field: str, output_field):
+    whens = [When(id=pk, then=Value(s[field])) for pk, s in pending.items() if field in s]
+    return Case(*whens, default=F(field), output_field=output_field) if whens else None
+
+
+def apply(pending: Dict[int, Sample]) -> int:
+    """Write one flush's samples; returns the number of projects changed."""
+    changed = 0
+    now = timezone.now()
+    ids = list(pending)
+    with coalesce(), write_transaction():
+        # chunked reads, writes and events: a buffer can hold more ids than
+        # SQLite binds variables in one statement
+        for start in range(0, len(ids), FLUSH_CHUNK):
+            chunk_ids = ids[start:start + FLUSH_CHUNK]
+            current = {pk: (progress, health) for pk, progress, health in Project.objects.filter(
+                id__in=chunk_ids, is_deleted=False).values_list("id", "progress", "health")}
+            chunk = {
+                pk: pending[pk] for pk in chunk_ids if pk in current
+                and (pending[pk].get("progress", current[pk][0]),
+                     pending[pk].get("health", current[pk][1])) != current[pk]
+            }
+            if not chunk:
+                continue
+            changes = {name: case for name, case in (
+                ("progress", _case(chunk, "progress", FloatField())),
+                ("health", _case(chunk, "health", CharField())),
+            ) if case is not None}
+            changed += Project.objects.filter(id__in=list(chunk)).update(
+                **changes, version=F("version") + 1, last_updated=now,
+            )
+            emit_rows_changed(Project.objects.filter(id__in=list(chunk), last_updated=now),
+                              ["progress", "health"])
+    return changed
+
+
+class _Buffer:
+    """Per-process latest-sample-wins buffer with a lazily started flush thread."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: Dict[int, Sample] = {}
+        self._thread = None
+        self._wake = threading.Event()
+        self.samples_total = 0
+        self.flushes_total = 0
+        self.written_total = 0
+        self.failed_flushes_total = 0
+
+    def add(self, samples: List[Tuple[int, Sample]]) -> int:
+        """Buffer samples (later ones win); returns the number of buffered projects."""
+        with self._lock:
+            for pk, fields in samples:
+                self._pending.setdefault(pk, {}).update(fields)
+            self.samples_total += len(samples)
+            size = len(self._pending)
+        if size >= getattr(settings, "INGEST_MAX_BUFFERED", 10000):
+            self._wake.set()
+        self._ensure_thread()
+        return size
+
+    def flush(self) -> int:
+        """Write everything buffered so far; on failure it is put back (newer samples win)."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        try:
+            written = apply(pending)
+        except Exception:
+            with self._lock:
+                for pk, fields in pending.items():
+                    self._pending[pk] = {**fields, **self._pending.get(pk, {})}
+                self.failed_flushes_total += 1
+            raise
+        with self._lock:
+            self.flushes_total += 1
+            self.written_total += written
+        return written
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "buffered": len(self._pending),
+                "samples_total": self.samples_total,
+                "flushes_total": self.flushes_total,
+                "written_total": self.written_total,
+                "failed_flushes_total": self.failed_flushes_total,
+            }
+
+    def _ensure_thread(self):
+        if self._thread is not None or interval() <= 0:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ingest-flush", daemon=True)
+                self._thread.start()
+                atexit.register(self._flush_quietly)
+
+    def _run(self):
+        while True:
+            self._wake.wait(interval())
+            self._wake.clear()
+            # no request cycle here to retire the thread's connection after CONN_MAX_AGE
+            close_old_connections()
+            if not self._flush_quietly():
+                time.sleep(min(interval(), 1))
+
+    def _flush_quietly(self) -> bool:
+        try:
+            self.flush()
+            return True
+        except Exception:
+            logger.exception("ingest flush failed; samples kept for the next one")
+            return False
+
+
+def interval() -> float:
+    return getattr(settings, "INGEST_FLUSH_INTERVAL_SECS", 2.0)
+
+
+_buffer = _Buffer()
+
+
+def submit(samples: List[Tuple[int, Sample]]) -> int:
+    """Buffer cleaned samples, or write them now when write-behind is off."""
+    size = _buffer.add(samples)
+    if interval() <= 0:
+        _buffer.flush()
+        return 0
+    return size
+
+
+def flush() -> int:
+    return _buffer.flush()
+
+
+def stats() -> dict:
+    return _buffer.stats()
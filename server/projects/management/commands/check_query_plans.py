@@ -0,0 +1,123 @@
+import contextlib
+import io
+import json
+import re
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+# sorts of the whole result ("... FOR ORDER BY") and partial ones ("... FOR
+# RIGHT PART OF ORDER BY", "... FOR LAST TERM OF ORDER BY"), which sort a
+# whole group of an index prefix, e.g. every active project by id
+TEMP_SORT = "USE TEMP B-TREE FOR"
+
+# hot read endpoints as the dashboard calls them, with the plan steps each may use
+ENDPOINTS = [
+    ("/api/v1/projects/?is_deleted=false", ()),
+    ("/api/v1/projects/?is_deleted=false&ordering=-last_updated", ()),
+    ("/api/v1/projects/?is_deleted=false&status=active", ()),
+    ("/api/v1/projects/?is_deleted=false&health=warning", ()),
+    ("/api/v1/projects/?is_deleted=false&status=active&health=good&ordering=-last_updated", ()),
+    # driven from the (name, project) tag index; sorting the matches beats
+    # walking every live project in last_updated order
+    ("/api/v1/projects/?is_deleted=false&tags=react", (TEMP_SORT,)),
+    ("/api/v1/projects/?is_deleted=false&pagination=cursor", ()),
+    ("/api/v1/projects/?ordering=last_updated", ()),
+    ("/api/v1/projects/deleted/", ()),
+    ("/api/v1/projects/deleted/?pagination=cursor", ()),
+    ("/api/v1/projects/changes/?since=100", ()),
+    # search ranks the FTS matches, so the matches are sorted, never the table;
+    # with an explicit ordering SQLite either walks the ordering's index or
+    # sorts the matches, depending on how many it expects
+    ("/api/v1/projects/?is_deleted=false&q=dashboard", (TEMP_SORT,)),
+    ("/api/v1/projects/?is_deleted=false&q=dash&ordering=-last_updated", (TEMP_SORT,)),
+    # a filter plus a sort on another column sorts the filtered rows: an index
+    # per (filter, sort) pair would cost every write more than the sort costs
+    ("/api/v1/projects/?is_deleted=false&health=warning&ordering=title", (TEMP_SORT,)),
+    ("/api/v1/projects/?is_deleted=false&owner=owner1", ()),
+    ("/api/v1/projects/?is_deleted=false&health_min=50", ()),
+    ("/api/v1/projects/facets/?is_deleted=false", ()),
+    ("/api/v1/projects/facets/?is_deleted=false&status=active&tags=react", ()),
+    ("/api/v1/projects/filters/owners/", ()),
+    ("/api/v1/projects/filters/tags/", ()),
+    ("/api/v1/projects/export/", ()),
+]
+# the dashboard's sort menu (client/src/pages/Dashboard.tsx), as offset pages
+# and as cursor pages (the next page is fetched too)
+DASHBOARD_ORDERINGS = ("last_updated", "title", "owner", "progress", "status", "health")
+for _field in DASHBOARD_ORDERINGS:
+    for _ordering in (_field, f"-{_field}"):
+        ENDPOINTS += [
+            (f"/api/v1/projects/?is_deleted=false&ordering={_ordering}", ()),
+            (f"/api/v1/projects/?is_deleted=false&ordering={_ordering}&pagination=cursor", ()),
+        ]
+
+TABLE = "projects_project"
+
+
+def plan_problems(cur, sql, allowed=()):
+    """Full scans of the project table and temp sorts in sql's query plan."""
+    # subqueries name the table by its alias ("projects_project" U0), and
+    # plans show the alias
+    names = {TABLE, *re.findall(rf'"{TABLE}" (U\d+)\b', sql)}
+    cur.execute("EXPLAIN QUERY PLAN " + sql)
+    problems = []
+    for row in cur.fetchall():
+        detail = row[-1]
+        scanned = re.match(r"SCAN (?:TABLE )?(\w+)", detail)
+        # "SCAN t USING [COVERING] INDEX i" walks an index in order; anything
+        # else that scans the table reads every row
+        if scanned and scanned.group(1) in names and "INDEX" not in detail:
+            problems.append(detail)
+        elif detail.startswith(TEMP_SORT) and detail.endswith("ORDER BY"):
+            problems.append(detail)
+    return [p for p in problems if not any(a in p for a in allowed)]
+
+
+class Command(BaseCommand):
+    help = (
+        "Run the hot list endpoints, EXPLAIN QUERY PLAN every query they issue "
+        "and fail if one does a full scan of projects_project or a temp sort."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--verbose-plans", action="store_true",
+                            help="Print each query and its plan.")
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite":
+            raise CommandError("check_query_plans reads SQLite query plans only.")
+
+        client = Client(SERVER_NAME="localhost")
+        failures = 0
+        for url, allowed in ENDPOINTS:
+            with CaptureQueriesContext(connection) as queries, contextlib.redirect_stdout(io.StringIO()):
+                resp = client.get(url)
+                if resp.status_code != 200:
+                    raise CommandError(f"{url} returned {resp.status_code}")
+                if resp.streaming:
+                    b"".join(resp.streaming_content)  # the export runs its queries as it streams
+                    cursor = None
+                else:
+                    cursor = json.loads(resp.content).get("next_cursor") if "cursor" in url else None
+                if cursor:
+                    # later pages add the keyset range to the query
+                    client.get(f"{url}&cursor={cursor}")
+
+            with connection.cursor() as cur:
+                for query in queries.captured_queries:
+                    sql = query["sql"]
+                    if not sql.lstrip().upper().startswith("SELECT") or TABLE not in sql:
+                        continue
+                    problems = plan_problems(cur, sql, allowed)
+                    if options["verbose_plans"]:
+                        self.stdout.write(f"{url}\n  {sql}\n  -> {problems or 'ok'}")
+                    if problems:
+                        failures += 1
+                        self.stderr.write(f"{url}: {'; '.join(problems)}\n  {sql}")
+
+        if failures:
+            raise CommandError(f"{failures} queries regressed to a full scan or temp sort.")
+        self.stdout.write(self.style.SUCCESS(f"{len(ENDPOINTS)} endpoints use indexed plans."))
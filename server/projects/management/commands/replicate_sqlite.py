@@ -0,0 +1,47 @@
+import sqlite3
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = (
+        "Replication stand-in for local read-replica testing: copy the primary "
+        "SQLite database onto the replica's file with SQLite's online backup API, "
+        "once or every --interval seconds. Each copy replaces the replica in one "
+        "transaction, so readers see either the old or the new snapshot."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default="replica",
+                            help="Alias of the replica in DATABASES (default: replica).")
+        parser.add_argument("--interval", type=float, default=0,
+                            help="Seconds between copies; 0 copies once and exits.")
+
+    def handle(self, database, interval, **options):
+        if database not in settings.DATABASES:
+            raise CommandError(f"No database alias {database!r}; set DATABASE_REPLICA_PATH.")
+        source = str(settings.DATABASES["default"]["NAME"])
+        target = str(settings.DATABASES[database]["NAME"])
+        if source == target:
+            raise CommandError("The replica must be a different file from the primary.")
+
+        while True:
+            started = time.perf_counter()
+            self._copy(source, target)
+            elapsed = time.perf_counter() - started
+            self.stdout.write(f"Copied {source} -> {target} in {elapsed * 1000:.0f} ms")
+            if interval <= 0:
+                return
+            time.sleep(max(interval - elapsed, 0))
+
+    @staticmethod
+    def _copy(source, target):
+        src = sqlite3.connect(source)
+        dst = sqlite3.connect(target, timeout=30)
+        try:
+            src.backup(dst)
+        finally:
+            dst.close()
+            src.close()
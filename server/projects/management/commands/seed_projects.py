@@ -0,0 +1,115 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from projects import vocab
+from projects.models import Project
+from projects.sqlite import write_transaction
+
+WORDS = (
+    "dashboard api mobile analytics platform payments search billing auth sync "
+    "migration cloud infra portal reporting crm onboarding chat export import "
+    "inventory logistics pricing catalog checkout notifications identity audit"
+).split()
+TAGS = (
+    "react django python mobile backend frontend data devops ai security api "
+    "ecommerce crm analytics infra cloud ios android design qa ml payments "
+    "search reporting integration legacy compliance performance ux docs"
+).split()
+FIRST_NAMES = (
+    "Alex Amelia Ava Emma Gregoris Liam Mia Nina Noah Olivia Sophia Lucas "
+    "Eleni Nikos Maria Jonas Yuki Priya Omar Sara Leo Chloe Ivan Zoe"
+).split()
+
+# weights roughly as seen on a busy dashboard
+STATUSES = (("active", 55), ("planning", 15), ("paused", 15), ("completed", 15))
+HEALTHS = (("good", 70), ("warning", 20), ("critical", 10))
+DELETED_RATIO = 0.03
+SPREAD_SECS = 2 * 365 * 24 * 3600
+
+
+def _zipf_weights(n, s=1.0):
+    return [1 / (rank ** s) for rank in range(1, n + 1)]
+
+
+def generate(n, seed=0, owners=500):
+    """
+    Yield n unsaved projects: owners and tags Zipf-distributed (a few very
+    common, a long tail), weighted status/health, progress that follows
+    status, and a few percent soft-deleted.
+    """
+    rnd = random.Random(seed)
+    owner_names = [f"{rnd.choice(FIRST_NAMES)} {i}" for i in range(owners)]
+    owner_weights = _zipf_weights(owners)
+    tag_weights = _zipf_weights(len(TAGS))
+    statuses, status_weights = zip(*STATUSES)
+    healths, health_weights = zip(*HEALTHS)
+
+    for i in range(n):
+        words = rnd.sample(WORDS, 3)
+        status = rnd.choices(statuses, status_weights)[0]
+        tags = set(rnd.choices(TAGS, tag_weights, k=rnd.choice((0, 1, 2, 2, 3, 3, 4, 5))))
+        if status == "completed":
+            progress = 100.0
+        elif status == "planning":
+            progress = round(rnd.uniform(0, 10), 1)
+        else:
+            progress = round(rnd.uniform(5, 95), 1)
+        yield Project(
+            title=" ".join(w.capitalize() for w in words[:2]) + f" {i}",
+            description=f"{words[0]} {words[2]} work item {i} " + " ".join(rnd.sample(WORDS, 8)),
+            owner=rnd.choices(owner_names, owner_weights)[0],
+            tags=sorted(tags),
+            status=status,
+            health=rnd.choices(healths, health_weights)[0],
+            progress=progress,
+            is_deleted=rnd.random() < DELETED_RATIO,
+        )
+
+
+class Command(BaseCommand):
+    help = "Insert synthetic projects with realistic owner, tag and status distributions."
+
+    def add_arguments(self, parser):
+        parser.add_argument("count", type=int, help="Number of projects to insert.")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--owners", type=int, default=500)
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--clear", action="store_true", help="Delete existing projects first.")
+
+    def handle(self, count, seed, owners, batch_size, clear, **options):
+        started = time.perf_counter()
+        with write_transaction():
+            if clear:
+                Project.objects.all().delete()
+            first_id = (Project.objects.order_by("-id").values_list("id", flat=True).first() or 0) + 1
+            batch = []
+            for project in generate(count, seed=seed, owners=owners):
+                batch.append(project)
+                if len(batch) >= batch_size:
+                    Project.objects.bulk_create(batch)
+                    batch = []
+            if batch:
+                Project.objects.bulk_create(batch)
+            self._spread_last_updated(first_id, seed)
+            # bulk_create sends no post_save; cached owner/tag lists are stale
+            vocab.invalidate()
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f"Inserted {count} projects in {elapsed:.1f}s ({count / max(elapsed, 1e-9):.0f} rows/s).")
+
+    @staticmethod
+    def _spread_last_updated(first_id, seed):
+        # auto_now stamps every row with the same instant; spread them over two
+        # years (deterministically per id) so ordering and ranges look real
+        now = int(time.time())
+        if connection.vendor == "sqlite":
+            with connection.cursor() as cur:
+                cur.execute(
+                    "UPDATE projects_project SET last_updated = "
+                    "strftime('%%Y-%%m-%%d %%H:%%M:%%S', %s - ((id * 7919 + %s) %% %s), 'unixepoch') || '.000000' "
+                    "WHERE id >= %s",
+                    [now, seed, SPREAD_SECS, first_id],
+                )
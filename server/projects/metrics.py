@@ -0,0 +1,353 @@
+import atexit
+import bisect
+import contextvars
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Stats for the request being served, visible to DB wrappers, serializers and
+# renderers; asgiref copies the context into sync_to_async threads, so this
+# also works when sync views run under ASGI.
+_current: contextvars.ContextVar[Optional["RequestStats"]] = contextvars.ContextVar(
+    "request_stats", default=None
+)
+
+
+class RequestStats:
+    """Per-request counters, filled in while the request is served."""
+
+    __slots__ = ("queries", "db_seconds", "serialize_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.serialize_seconds = 0.0
+
+
+def start_request() -> Tuple[RequestStats, contextvars.Token]:
+    stats = RequestStats()
+    return stats, _current.set(stats)
+
+
+def end_request(token: contextvars.Token):
+    _current.reset(token)
+
+
+def db_wrapper(execute, sql, params, many, context):
+    """connection.execute_wrappers entry: counts and times every query."""
+    stats = _current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.queries += 1
+        stats.db_seconds += time.perf_counter() - started
+
+
+def install_db_wrapper(sender, connection, **kwargs):
+    """connection_created receiver."""
+    if db_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(db_wrapper)
+
+
+@contextmanager
+def serializing():
+    """Time a serializer/renderer step into the current request's stats."""
+    stats = _current.get()
+    if stats is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.serialize_seconds += time.perf_counter() - started
+
+
+class Histogram:
+    """Prometheus-style cumulative histogram keyed by one label."""
+
+    def __init__(self, name: str, help_text: str, label: str, buckets):
+        self.name = name
+        self.help = help_text
+        self.label = label
+        self.buckets = tuple(buckets)
+        self._series: Dict[str, list] = {}  # value -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, label_value: str, value: float):
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_value)
+            if series is None:
+                series = self._series[label_value] = [0] * (len(self.buckets) + 2)
+            if i < len(self.buckets):
+                series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def snapshot(self) -> Dict[str, list]:
+        with self._lock:
+            return {k: list(v) for k, v in self._series.items()}
+
+    def render(self, series: Dict[str, list] = None):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        if series is None:
+            series = self.snapshot()
+        for label_value, counts in sorted(series.items()):
+            lbl = f'{self.label}="{label_value}"'
+            cumulative = 0
+            for bound, n in zip(self.buckets, counts):
+                cumulative += n
+                lines.append(f'{self.name}_bucket{{{lbl},le="{bound:g}"}} {cumulative}')
+            lines.append(f'{self.name}_bucket{{{lbl},le="+Inf"}} {counts[-1]}')
+            lines.append(f"{self.name}_sum{{{lbl}}} {counts[-2]:.6f}")
+            lines.append(f"{self.name}_count{{{lbl}}} {counts[-1]}")
+        return lines
+
+
+SECONDS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+REQUEST_SECONDS = Histogram("projects_request_duration_seconds",
+                            "Total time per request, by view action.", "action", SECONDS)
+DB_SECONDS = Histogram("projects_request_db_seconds",
+                       "Time spent in SQL per request, by view action.", "action", SECONDS)
+SERIALIZE_SECONDS = Histogram("projects_request_serialize_seconds",
+                              "Serializer and renderer time per request, by view action.",
+                              "action", SECONDS)
+DB_QUERIES = Histogram("projects_request_db_queries",
+                       "SQL queries per request, by view action.", "action",
+                       (0, 1, 2, 3, 5, 10, 20, 50, 100, 500))
+
+HISTOGRAMS = (REQUEST_SECONDS, DB_SECONDS, SERIALIZE_SECONDS, DB_QUERIES)
+
+
+def record(action: str, stats: RequestStats, total_seconds: float):
+    _ensure_flusher()
+    REQUEST_SECONDS.observe(action, total_seconds)
+    DB_SECONDS.observe(action, stats.db_seconds)
+    SERIALIZE_SECONDS.observe(action, stats.serialize_seconds)
+    DB_QUERIES.observe(action, stats.queries)
+
+
+def server_timing(stats: RequestStats, total_seconds: float) -> str:
+    return (
+        f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.queries} queries", '
+        f"serialize;dur={stats.serialize_seconds * 1000:.1f}, "
+        f"total;dur={total_seconds * 1000:.1f}"
+    )
+
+
+# (name, help, kind, [(labels, stats key)]); the key's prefix names the
+# stats() dict it is read from
+_SAMPLES = (
+    ("projects_sse_subscribers", "Open SSE subscribers, by kind.", "gauge",
+     [('kind="sync"', "realtime.sync_subscribers"), ('kind="async"', "realtime.async_subscribers")]),
+    ("projects_sse_queue_depth", "Events queued for SSE subscribers (sum and max over subscribers).",
+     "gauge", [('stat="sum"', "realtime.queue_depth_sum"), ('stat="max"', "realtime.queue_depth_max")]),
+    ("projects_sse_dropped_subscribers_total", "SSE subscribers dropped for falling behind.",
+     "counter", [("", "realtime.dropped_total")]),
+    ("projects_sse_events_total", "Events delivered to worker hubs (once per worker).",
+     "counter", [("", "realtime.events_total")]),
+    ("projects_sse_replay_buffer_events", "Events held for Last-Event-ID replay (largest worker buffer).",
+     "gauge", [("", "realtime.replay_events")]),
+    ("projects_ingest_buffered", "Projects with samples waiting for the next ingest flush.",
+     "gauge", [("", "ingest.buffered")]),
+    ("projects_ingest_samples_total", "Samples accepted by the ingest endpoint.",
+     "counter", [("", "ingest.samples_total")]),
+    ("projects_ingest_flushes_total", "Ingest flushes, by outcome.",
+     "counter", [('outcome="ok"', "ingest.flushes_total"),
+                 ('outcome="failed"', "ingest.failed_flushes_total")]),
+    ("projects_ingest_written_total", "Projects changed by ingest flushes.",
+     "counter", [("", "ingest.written_total")]),
+)
+# gauges combined across workers with max; the rest are summed
+_MAX_GAUGES = frozenset(('projects_sse_queue_depth\tstat="max"', "projects_sse_replay_buffer_events\t"))
+
+
+def _collect() -> Tuple[Dict[str, float], Dict[str, float]]:
+    """
+    This process' (counters, gauges) as flat {key: value} dicts, keyed by
+    tab-joined name and labels; histogram keys are name, label value and
+    slot (bucket index, then sum and count).
+    """
+    from .ingest import stats as ingest_stats
+    from .realtime import stats as realtime_stats
+
+    counters, gauges = {}, {}
+    for histogram in HISTOGRAMS:
+        for label_value, series in histogram.snapshot().items():
+            for slot, value in enumerate(series):
+                counters[f"{histogram.name}\t{label_value}\t{slot}"] = value
+    stats = {"realtime": realtime_stats(), "ingest": ingest_stats()}
+    for name, _help, kind, samples in _SAMPLES:
+        for labels, key in samples:
+            source, field = key.split(".")
+            (counters if kind == "counter" else gauges)[f"{name}\t{labels}"] = stats[source][field]
+    return counters, gauges
+
+
+class SQLiteMetricsStore:
+    """
+    Totals for every worker on the host, in one SQLite file (like the
+    realtime SQLite log), so a scrape that lands on any worker sees them all.
+
+    Each worker adds what its counters and histograms gained since its last
+    flush, so totals keep counting across worker restarts; gauges are one
+    row per worker, and rows not refreshed for three flush intervals (dead
+    workers) are left out and pruned.
+    """
+
+    def __init__(self, path, interval: float):
+        self.path = str(path)
+        self.interval = interval
+        self.worker = f"{os.getpid()}-{time.time_ns()}"
+        self._flushed: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        conn = self._conn()
+        conn.execute("CREATE TABLE IF NOT EXISTS totals (key TEXT PRIMARY KEY, value REAL NOT NULL)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS gauges ("
+            " worker TEXT PRIMARY KEY,"
+            " ts REAL NOT NULL,"
+            " data TEXT NOT NULL)"
+        )
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def flush(self, counters: Dict[str, float], gauges: Dict[str, float]):
+        """Add this worker's counter increments and replace its gauges."""
+        now = time.time()
+        with self._lock:
+            delta = [(k, v - self._flushed.get(k, 0)) for k, v in counters.items()
+                     if v != self._flushed.get(k, 0)]
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(
+                    "INSERT INTO totals (key, value) VALUES (?, ?)"
+                    " ON CONFLICT (key) DO UPDATE SET value = value + excluded.value",
+                    delta,
+                )
+                conn.execute("INSERT OR REPLACE INTO gauges (worker, ts, data) VALUES (?, ?, ?)",
+                             (self.worker, now, json.dumps(gauges)))
+                conn.execute("DELETE FROM gauges WHERE ts < ?", (now - 3 * self.interval,))
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            self._flushed = dict(counters)
+
+    def read(self) -> Tuple[Dict[str, float], List[Dict[str, float]]]:
+        """(summed counters, [gauges of each live worker])."""
+        conn = self._conn()
+        totals = {k: int(v) if v.is_integer() else v for k, v in conn.execute("SELECT key, value FROM totals")}
+        rows = conn.execute("SELECT data FROM gauges WHERE ts >= ?", (time.time() - 3 * self.interval,))
+        return totals, [json.loads(data) for (data,) in rows]
+
+
+_store = None
+_store_pid = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> Optional[SQLiteMetricsStore]:
+    """The shared store when METRICS_BACKEND is "sqlite", else None."""
+    global _store, _store_pid
+    if getattr(settings, "METRICS_BACKEND", "inprocess") != "sqlite":
+        return None
+    if _store_pid != os.getpid():  # created before a fork: the child is its own worker
+        with _store_lock:
+            if _store_pid != os.getpid():
+                _store = SQLiteMetricsStore(
+                    getattr(settings, "METRICS_SQLITE_PATH", settings.BASE_DIR / "metrics.sqlite3"),
+                    getattr(settings, "METRICS_FLUSH_SECS", 5.0),
+                )
+                _store_pid = os.getpid()
+                threading.Thread(target=_flush_loop, args=(_store,), name="metrics-flush", daemon=True).start()
+                atexit.register(_flush_quietly, _store)
+    return _store
+
+
+def _ensure_flusher():
+    if _store_pid != os.getpid():
+        get_store()
+
+
+def _flush_quietly(store: SQLiteMetricsStore) -> bool:
+    try:
+        store.flush(*_collect())
+        return True
+    except Exception:
+        logger.exception("metrics flush failed; increments kept for the next one")
+        return False
+
+
+def _flush_loop(store: SQLiteMetricsStore):
+    while True:
+        time.sleep(store.interval)
+        _flush_quietly(store)
+
+
+def _combine(rows: List[Dict[str, float]]) -> Dict[str, float]:
+    combined: Dict[str, float] = {}
+    for row in rows:
+        for key, value in row.items():
+            if key not in combined:
+                combined[key] = value
+            elif key in _MAX_GAUGES:
+                combined[key] = max(combined[key], value)
+            else:
+                combined[key] += value
+    return combined
+
+
+def render() -> str:
+    """
+    Prometheus text exposition of the request, realtime and ingest metrics:
+    of every worker with METRICS_BACKEND = "sqlite", else of this process.
+    """
+    counters, gauges = _collect()
+    store = get_store()
+    if store is not None:
+        store.flush(counters, gauges)  # this worker's numbers as of now
+        counters, rows = store.read()
+        gauges = _combine(rows)
+
+    lines = []
+    for histogram in HISTOGRAMS:
+        series: Dict[str, list] = {}
+        prefix = histogram.name + "\t"
+        for key, value in counters.items():
+            if key.startswith(prefix):
+                _name, label_value, slot = key.split("\t")
+                series.setdefault(label_value, [0] * (len(histogram.buckets) + 2))[int(slot)] = value
+        lines.extend(histogram.render(series))
+
+    for name, help_text, kind, samples in _SAMPLES:
+        values = counters if kind == "counter" else gauges
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, _key in samples:
+            value = values.get(f"{name}\t{labels}", 0)
+            lines.append(f"{name}{{{labels}}} {value}" if labels else f"{name} {value}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,61 @@
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from . import metrics
+
+
+def _action(request) -> str:
+    """View action label: the viewset action (list, bulk_update, ...) or the view name."""
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "unmatched"
+    actions = getattr(match.func, "actions", None)
+    if actions:
+        return actions.get(request.method.lower(), request.method.lower())
+    return match.url_name or getattr(match.func, "__name__", "view")
+
+
+class PerformanceMiddleware:
+    """
+    Counts and times SQL, serialization and the whole request, reports them
+    in a Server-Timing header and feeds the /metrics histograms. Streaming
+    responses (SSE) are passed through untimed.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        stats, token = metrics.start_request()
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            metrics.end_request(token)
+        return self._finish(request, response, stats, started)
+
+    async def __acall__(self, request):
+        stats, token = metrics.start_request()
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            metrics.end_request(token)
+        return self._finish(request, response, stats, started)
+
+    def _finish(self, request, response, stats, started):
+        if response.streaming:
+            return response
+        total = time.perf_counter() - started
+        response["Server-Timing"] = metrics.server_timing(stats, total)
+        metrics.record(_action(request), stats, total)
+        return response
@@ -0,0 +1,72 @@
+from django.db import migrations, OperationalError
+
+# FTS5 index over title/description/tags, kept in sync by triggers so that
+# every write path (save, QuerySet.update, bulk_create) updates it.
+FTS_SQL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS projects_project_fts USING fts5(
+        title, description, tags,
+        content='projects_project', content_rowid='id',
+        tokenize='unicode61', prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS projects_project_fts_ai AFTER INSERT ON projects_project BEGIN
+        INSERT INTO projects_project_fts(rowid, title, description, tags)
+        VALUES (new.id, new.title, new.description, new.tags);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS projects_project_fts_ad AFTER DELETE ON projects_project BEGIN
+        INSERT INTO projects_project_fts(projects_project_fts, rowid, title, description, tags)
+        VALUES ('delete', old.id, old.title, old.description, old.tags);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS projects_project_fts_au
+    AFTER UPDATE OF title, description, tags ON projects_project BEGIN
+        INSERT INTO projects_project_fts(projects_project_fts, rowid, title, description, tags)
+        VALUES ('delete', old.id, old.title, old.description, old.tags);
+        INSERT INTO projects_project_fts(rowid, title, description, tags)
+        VALUES (new.id, new.title, new.description, new.tags);
+    END
+    """,
+    "INSERT INTO projects_project_fts(projects_project_fts) VALUES ('rebuild')",
+]
+
+DROP_SQL = [
+    "DROP TRIGGER IF EXISTS projects_project_fts_ai",
+    "DROP TRIGGER IF EXISTS projects_project_fts_ad",
+    "DROP TRIGGER IF EXISTS projects_project_fts_au",
+    "DROP TABLE IF EXISTS projects_project_fts",
+]
+
+
+def create_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    try:
+        for sql in FTS_SQL:
+            schema_editor.execute(sql)
+    except OperationalError:
+        # SQLite built without FTS5: search falls back to LIKE
+        for sql in DROP_SQL:
+            schema_editor.execute(sql)
+
+
+def drop_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    for sql in DROP_SQL:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fts, drop_fts),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 5.0.7 on 2026-10-18 04:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Keep projects_projecttag in step with projects_project.tags on every write
+# path, including QuerySet.update() and bulk_create.
+TAG_SQL = [
+    """
+    CREATE TRIGGER IF NOT EXISTS projects_projecttag_ai AFTER INSERT ON projects_project BEGIN
+        INSERT OR IGNORE INTO projects_projecttag(project_id, name)
+        SELECT new.id, value FROM json_each(new.tags) WHERE type = 'text';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS projects_projecttag_au
+    AFTER UPDATE OF tags ON projects_project BEGIN
+        DELETE FROM projects_projecttag WHERE project_id = new.id;
+        INSERT OR IGNORE INTO projects_projecttag(project_id, name)
+        SELECT new.id, value FROM json_each(new.tags) WHERE type = 'text';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS projects_projecttag_ad AFTER DELETE ON projects_project BEGIN
+        DELETE FROM projects_projecttag WHERE project_id = old.id;
+    END
+    """,
+    """
+    INSERT OR IGNORE INTO projects_projecttag(project_id, name)
+    SELECT p.id, j.value FROM projects_project p, json_each(p.tags) j WHERE j.type = 'text'
+    """,
+]
+
+DROP_SQL = [
+    "DROP TRIGGER IF EXISTS projects_projecttag_ai",
+    "DROP TRIGGER IF EXISTS projects_projecttag_au",
+    "DROP TRIGGER IF EXISTS projects_projecttag_ad",
+]
+
+
+def create_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    for sql in TAG_SQL:
+        schema_editor.execute(sql)
+
+
+def drop_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    for sql in DROP_SQL:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0002_project_fts'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='project',
+            name='status',
+            field=models.CharField(choices=[('active', 'Active'), ('paused', 'Paused'), ('completed', 'Completed'), ('planning', 'Planning')], default='active', max_length=32),
+        ),
+        migrations.CreateModel(
+            name='ProjectTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tag_rows', to='projects.project')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='projecttag',
+            constraint=models.UniqueConstraint(fields=('name', 'project'), name='projecttag_name_project_uniq'),
+        ),
+        migrations.RunPython(create_triggers, drop_triggers),
+    ]
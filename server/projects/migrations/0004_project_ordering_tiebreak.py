@@ -0,0 +1,17 @@
+# Generated by Django 5.0.7 on 2026-10-18 04:24
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_projecttag'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='project',
+            options={'ordering': ['-last_updated', '-id']},
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.0.7 on 2026-10-18 04:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0004_project_ordering_tiebreak'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['last_updated', 'id'], name='project_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['last_updated', 'id'], name='project_live_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['status', 'last_updated', 'id'], name='project_live_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['health', 'last_updated', 'id'], name='project_live_health_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_deleted', True)), fields=['last_updated', 'id'], name='project_deleted_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,92 @@
+# Generated by Django 5.0.7 on 2026-10-18 04:55
+
+from django.db import migrations, models
+
+# One global counter, bumped by every insert, update and delete of a project;
+# the row's change_seq (or its tombstone) takes the new value. SQLite runs one
+# writer at a time, so sequence order is commit order: a reader that has seen
+# change_seq N can never later find a commit with a smaller one.
+SEQ_SQL = [
+    "CREATE TABLE IF NOT EXISTS projects_changeseq (id INTEGER PRIMARY KEY CHECK (id = 1), value INTEGER NOT NULL)",
+    # existing rows, oldest change first
+    """
+    UPDATE projects_project SET change_seq = o.n
+    FROM (SELECT id, ROW_NUMBER() OVER (ORDER BY last_updated, id) AS n FROM projects_project) AS o
+    WHERE o.id = projects_project.id
+    """,
+    "INSERT OR REPLACE INTO projects_changeseq (id, value) SELECT 1, COALESCE(MAX(change_seq), 0) FROM projects_project",
+    """
+    CREATE TRIGGER IF NOT EXISTS projects_project_seq_ai AFTER INSERT ON projects_project BEGIN
+        UPDATE projects_changeseq SET value = value + 1 WHERE id = 1;
+        UPDATE projects_project SET change_seq = (SELECT value FROM projects_changeseq WHERE id = 1)
+        WHERE id = new.id;
+    END
+    """,
+    # skips only the triggers' own stamping (change_seq moved to the counter's
+    # value); a full Model.save() writing back a stale change_seq still counts
+    """
+    CREATE TRIGGER IF NOT EXISTS projects_project_seq_au AFTER UPDATE ON projects_project
+    WHEN new.change_seq IS old.change_seq
+      OR new.change_seq IS NOT (SELECT value FROM projects_changeseq WHERE id = 1) BEGIN
+        UPDATE projects_changeseq SET value = value + 1 WHERE id = 1;
+        UPDATE projects_project SET change_seq = (SELECT value FROM projects_changeseq WHERE id = 1)
+        WHERE id = new.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS projects_project_seq_ad AFTER DELETE ON projects_project BEGIN
+        UPDATE projects_changeseq SET value = value + 1 WHERE id = 1;
+        INSERT INTO projects_projecttombstone (project_id, change_seq)
+        SELECT old.id, value FROM projects_changeseq WHERE id = 1;
+    END
+    """,
+]
+
+DROP_SQL = [
+    "DROP TRIGGER IF EXISTS projects_project_seq_ai",
+    "DROP TRIGGER IF EXISTS projects_project_seq_au",
+    "DROP TRIGGER IF EXISTS projects_project_seq_ad",
+    "DROP TABLE IF EXISTS projects_changeseq",
+]
+
+
+def create_sequence(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    for sql in SEQ_SQL:
+        schema_editor.execute(sql)
+
+
+def drop_sequence(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    for sql in DROP_SQL:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0005_project_list_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('project_id', models.BigIntegerField()),
+                ('change_seq', models.BigIntegerField(unique=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='change_seq',
+            field=models.BigIntegerField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_sequence, drop_sequence),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['change_seq'], name='project_change_seq_idx'),
+        ),
+    ]
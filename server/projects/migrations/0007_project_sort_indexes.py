@@ -0,0 +1,33 @@
+# Generated by Django 5.0.7 on 2026-10-18 05:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0006_project_change_seq'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['title', 'id'], name='project_live_title_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['owner', 'id'], name='project_live_owner_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['progress', 'id'], name='project_live_progress_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['status', 'id'], name='project_live_status_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['health', 'id'], name='project_live_health_id_idx'),
+        ),
+    ]
@@ -37,17 +37,81 @@ class Project(models.Model):
     last_updated = models.DateTimeField(auto_now=True)
     is_deleted = models.BooleanField(default=False)
     version = models.IntegerField(default=1)
+    # position in the global change sequence (GET /projects/changes/); set by
+    # triggers on every insert and update (migration 0006), never by Django
+    change_seq = models.BigIntegerField(null=True, editable=False)
 
     class Meta:
-        ordering = ['-last_updated']
+        ordering = ['-last_updated', '-id']
+        # list queries filter live or deleted rows, optionally by status or
+        # health, and page by (last_updated, id); Django renders the
+        # is_deleted filter as NOT "is_deleted", so split on it with partial
+        # indexes rather than leading with the column
+        indexes = [
+            models.Index(fields=['last_updated', 'id'], name='project_updated_idx'),
+            models.Index(fields=['last_updated', 'id'], name='project_live_updated_idx',
+                         condition=models.Q(is_deleted=False)),
+            models.Index(fields=['status', 'last_updated', 'id'], name='project_live_status_idx',
+                         condition=models.Q(is_deleted=False)),
+            models.Index(fields=['health', 'last_updated', 'id'], name='project_live_health_idx',
+                         condition=models.Q(is_deleted=False)),
+            models.Index(fields=['last_updated', 'id'], name='project_deleted_updated_idx',
+                         condition=models.Q(is_deleted=True)),
+            # the dashboard's other sort orders, each made total with id
+            # (pagination.with_tiebreak), read forwards or backwards
+            models.Index(fields=['title', 'id'], name='project_live_title_idx',
+                         condition=models.Q(is_deleted=False)),
+            models.Index(fields=['owner', 'id'], name='project_live_owner_idx',
+                         condition=models.Q(is_deleted=False)),
+            models.Index(fields=['progress', 'id'], name='project_live_progress_idx',
+                         condition=models.Q(is_deleted=False)),
+            models.Index(fields=['status', 'id'], name='project_live_status_id_idx',
+                         condition=models.Q(is_deleted=False)),
+            models.Index(fields=['health', 'id'], name='project_live_health_id_idx',
+                         condition=models.Q(is_deleted=False)),
+            models.Index(fields=['change_seq'], name='project_change_seq_idx'),
+        ]
 
     def soft_delete(self):
         self.is_deleted = True
-        self.save(update_fields=['is_deleted', 'last_updated'])
+        self.version = (self.version or 0) + 1
+        self.save(update_fields=['is_deleted', 'version', 'last_updated'])
 
     def restore(self):
         self.is_deleted = False
-        self.save(update_fields=['is_deleted', 'last_updated'])
+        self.version = (self.version or 0) + 1
+        self.save(update_fields=['is_deleted', 'version', 'last_updated'])
 
     def __str__(self):
         return self.title
+
+
+class ProjectTag(models.Model):
+    """
+    One row per (project, tag): an index over Project.tags, which stays the
+    source of truth. On SQLite it is maintained by triggers (migration 0003),
+    so every write path keeps it current.
+    """
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="tag_rows")
+    name = models.CharField(max_length=255)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["name", "project"], name="projecttag_name_project_uniq"),
+        ]
+
+    def __str__(self):
+        return self.name
+
+
+class ProjectTombstone(models.Model):
+    """
+    A hard-deleted project (admin delete), so the changes feed can report
+    it; soft deletes stay in Project with is_deleted set. Written by the
+    delete trigger from migration 0006.
+    """
+    project_id = models.BigIntegerField()
+    change_seq = models.BigIntegerField(unique=True)
+
+    def __str__(self):
+        return f"{self.project_id} @ {self.change_seq}"
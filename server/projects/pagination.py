@@ -1,6 +1,28 @@
+import base64
+import json
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
 from rest_framework import pagination
+from rest_framework.exceptions import ParseError
 from rest_framework.response import Response
 
+# orderings clients may ask for; each is made total with an id tie-breaker,
+# and each (field, id) pair has a partial index on live projects (migrations
+# 0005 and 0007; id is the primary key)
+ORDERING_FIELDS = ("last_updated", "title", "owner", "status", "health", "progress", "id")
+DEFAULT_ORDERING = "-last_updated"
+# JSON type of the ordering value in a cursor (last_updated as ISO text)
+CURSOR_VALUE_TYPES = {"progress": (int, float), "id": int}
+
+
+def with_tiebreak(ordering):
+    """order_by() arguments for ordering plus id in the same direction."""
+    if ordering.lstrip("-") == "id":
+        return (ordering,)
+    return (ordering, "-id" if ordering.startswith("-") else "id")
+
+
 class LimitOffsetPaginationWithCount(pagination.LimitOffsetPagination):
     default_limit = 9
     max_limit = 200
@@ -12,3 +34,108 @@ class LimitOffsetPaginationWithCount(pagination.LimitOffsetPagination):
             'offset': self.offset,
             'results': data
         })
+
+
+class KeysetPagination(pagination.BasePagination):
+    """
+    Opt-in cursor pagination (?cursor= or ?pagination=cursor). Pages are
+    keyed on (ordering field, id) and start after the last row of the
+    previous one, so inserts and deletes do not shift later pages the way
+    they shift offsets. For live projects (is_deleted=false) every ordering
+    is an index range scan; other filters may sort their matches.
+
+    The key is the row's current value, so a row whose ordering field
+    changes mid-scroll can cross the cursor: an unseen row that moves to
+    the pages already read is skipped, a row already read that moves past
+    the cursor comes again. Under the default -last_updated
+    every edit moves a row to the front, so unseen edited rows are skipped
+    (they are the newest, and a reload starts with them); seen ones are not
+    repeated. Cursors are opaque; the total is only counted when asked for
+    with ?count=exact.
+    """
+    default_limit = LimitOffsetPaginationWithCount.default_limit
+    max_limit = LimitOffsetPaginationWithCount.max_limit
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        self.limit = self._limit(params.get("limit"))
+        ordering = params.get("ordering") or DEFAULT_ORDERING
+        field = ordering.lstrip("-")
+        if field not in ORDERING_FIELDS:
+            raise ParseError(f"Cursor pagination cannot order by `{ordering}`.")
+        desc = ordering.startswith("-")
+
+        self.count = queryset.count() if params.get("count") == "exact" else None
+        qs = queryset.order_by(*with_tiebreak(ordering))
+        cursor = params.get("cursor")
+        if cursor:
+            value, pk = self._decode(cursor, ordering, field)
+            op = "lt" if desc else "gt"
+            if field == "id":
+                qs = qs.filter(**{f"id__{op}": pk})
+            else:
+                # the outer range keeps the scan on the index
+                qs = qs.filter(
+                    Q(**{f"{field}__{op}e": value}),
+                    Q(**{f"{field}__{op}": value}) | Q(**{f"id__{op}": pk}),
+                )
+
+        rows = list(qs[:self.limit + 1])
+        page = rows[:self.limit]
+        self.next_cursor = None
+        if len(rows) > self.limit:
+            value, pk = self._position(qs, page[-1], field)
+            self.next_cursor = self._encode(ordering, value, pk)
+        return page
+
+    def get_paginated_response(self, data):
+        return Response({
+            'count': self.count,
+            'limit': self.limit,
+            'next_cursor': self.next_cursor,
+            'results': data
+        })
+
+    @staticmethod
+    def _position(qs, row, field):
+        """(field value, id) of a model instance or a values_list() tuple."""
+        if isinstance(row, tuple):
+            names = qs.query.values_select
+            return row[names.index(field)], row[names.index("id")]
+        return getattr(row, field), row.pk
+
+    def _limit(self, raw):
+        try:
+            limit = int(raw) if raw else self.default_limit
+        except ValueError:
+            raise ParseError("`limit` must be an integer.")
+        return max(1, min(limit, self.max_limit))
+
+    @staticmethod
+    def _encode(ordering, value, pk):
+        if hasattr(value, "isoformat"):
+            value = value.isoformat()
+        raw = json.dumps([ordering, value, pk], separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def _decode(cursor, ordering, field):
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            cursor_ordering, value, pk = json.loads(raw)
+            pk = int(pk)
+        except (ValueError, TypeError):
+            raise ParseError("Invalid cursor.")
+        if cursor_ordering != ordering:
+            raise ParseError("Cursor was issued for a different ordering.")
+        expected = CURSOR_VALUE_TYPES.get(field, str)
+        if not isinstance(value, expected) or isinstance(value, bool):
+            raise ParseError("Invalid cursor.")
+        if field == "last_updated":
+            try:
+                value = parse_datetime(value)
+            except ValueError:
+                value = None
+            if value is None:
+                raise ParseError("Invalid cursor.")
+        return value, pk
@@ -1,32 +1,572 @@
+import asyncio
+import itertools
 import json
 import queue
+import sqlite3
 import threading
-from typing import Set
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Set, Tuple
 
-# Thread-safe subscriber registry
-_subscribers: Set[queue.Queue] = set()
-_lock = threading.Lock()
+from django.conf import settings
+from django.db import transaction
 
 # Each subscriber gets a bounded, thread-safe queue
-def subscribe() -> queue.Queue:
-    q = queue.Queue(maxsize=1000)
-    with _lock:
-        _subscribers.add(q)
-    return q
+SUBSCRIBER_QUEUE_SIZE = 1000
+
+# Queue items are (event_id, json) pairs
+Event = Tuple[int, str]
+
+
+class ProjectFilter:
+    """
+    Compiled predicate over event project payloads. Accepts the same
+    parameters as the project list and matches the same way, so a
+    filtered dashboard only hears about projects it could be showing.
+    """
+
+    PARAMS = ("status", "owner", "health", "tags", "tags_match", "ids", "is_deleted")
+
+    def __init__(self, key: tuple):
+        self.key = key
+        # changes to these fields can move a project out of the filtered set
+        self.fields = frozenset(name for name, _ in key if name not in ("ids", "tags_match"))
+        self.ids = dict(key).get("ids")
+        checks = []
+        options = dict(key)
+        for name, value in key:
+            if name == "status":
+                checks.append(lambda p, v=value: p.get("status") == v)
+            elif name == "health":
+                checks.append(lambda p, v=value: p.get("health") == v)
+            elif name == "owner":
+                checks.append(lambda p, v=value: v in (p.get("owner") or "").lower())
+            elif name == "tags":
+                # exact tag names, any (default) or all of them
+                combine = all if options.get("tags_match") == "all" else any
+                checks.append(
+                    lambda p, v=value, combine=combine: combine(t in (p.get("tags") or ()) for t in v)
+                )
+            elif name == "ids":
+                checks.append(lambda p, v=value: p.get("id") in v)
+            elif name == "is_deleted":
+                checks.append(lambda p, v=value: bool(p.get("is_deleted")) is v)
+        self._checks = tuple(checks)
+
+    @classmethod
+    def from_params(cls, params) -> Optional["ProjectFilter"]:
+        """Build from query params; None when nothing is filtered."""
+        key = []
+        for name in cls.PARAMS:
+            raw = params.get(name)
+            if not raw:
+                continue
+            if name == "owner":
+                value = raw.lower()
+            elif name == "tags":
+                value = tuple(sorted({t.strip() for t in raw.split(",") if t.strip()}))
+            elif name == "ids":
+                value = frozenset(int(i) for i in raw.split(",") if i.strip().isdigit())
+            elif name == "is_deleted":
+                value = raw == "true"
+            else:
+                value = raw
+            key.append((name, value))
+        return cls(tuple(key)) if key else None
+
+    def match(self, project: dict) -> bool:
+        for check in self._checks:
+            if not check(project):
+                return False
+        return True
+
+    def relevant(self, project: dict, changed) -> bool:
+        """Matches now, or may have just stopped matching."""
+        if self.match(project):
+            return True
+        if self.ids is not None and project.get("id") not in self.ids:
+            return False
+        return not self.fields.isdisjoint(changed)
+
+
+def _view(flt: Optional[ProjectFilter], data: str, parsed) -> Optional[str]:
+    """
+    What a subscriber with this filter should receive for one published event,
+    or None to skip it. Batch events carry per-project data for matching only;
+    it is stripped before anything goes on the wire.
+    """
+    if flt is None and '"projects_batch"' not in data:
+        return data
+    event = parsed()
+    kind = event.get("type")
+    if kind == "projects_batch":
+        projects = event.get("projects") or []
+        if flt is not None:
+            changed = event.get("fields", ())
+            projects = [p for p in projects if flt.relevant(p, changed)]
+            if not projects:
+                return None
+        return json.dumps({
+            "type": kind,
+            "ids": [p["id"] for p in projects] if projects else event.get("ids", []),
+            "fields": event.get("fields", []),
+        })
+    if flt is not None and "project" in event:
+        if kind == "project_created":
+            # a new project cannot have just left the filtered set
+            return data if flt.match(event["project"]) else None
+        return data if flt.relevant(event["project"], event.get("fields", ())) else None
+    return data
+
+
+def _lazy_json(data: str):
+    cache = []
+
+    def parsed():
+        if not cache:
+            cache.append(json.loads(data))
+        return cache[0]
+    return parsed
+
+
+class AsyncSubscriber:
+    """asyncio-side subscriber; only ever touched from its own event loop."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, flt: Optional[ProjectFilter] = None):
+        self.loop = loop
+        self.flt = flt
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.dropped = False
+
+    async def get(self):
+        """Next event, or None once this subscriber has been dropped."""
+        return await self.queue.get()
+
+    def _put(self, event: Event) -> bool:
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            # Too slow: discard the backlog and wake the reader with a sentinel
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+            self.dropped = True
+            return False
+
+
+def _filter_key(flt: Optional[ProjectFilter]):
+    return flt.key if flt is not None else None
+
+
+class _Hub:
+    """
+    Per-process subscriber registry. Backends feed it; it fans out locally.
+
+    Subscribers are grouped by filter key, so each published event is matched
+    once per distinct filter rather than once per connection. The hub also
+    keeps a ring buffer of recent events, capped by count and by bytes, so
+    reconnecting clients can be replayed what they missed.
+    """
+
+    def __init__(self, replay_events=1000, replay_bytes=1024 * 1024):
+        self._subscribers: Dict[Optional[tuple], Set[queue.Queue]] = {}
+        # async subscribers grouped per event loop: one wakeup per loop per event
+        self._async_subscribers: Dict[
+            asyncio.AbstractEventLoop, Dict[Optional[tuple], Set[AsyncSubscriber]]
+        ] = {}
+        self._lock = threading.Lock()
+
+        self.replay_events = replay_events
+        self.replay_bytes = replay_bytes
+        self._buffer: deque = deque()
+        self._buffer_bytes = 0
+        # highest id evicted (or never seen by this process) and highest id delivered
+        self._floor = 0
+        self.last_id = 0
+        # totals exposed on /metrics
+        self.events_total = 0
+        self.dropped_total = 0
+
+    def reset(self, last_id: int):
+        """Start the id space at last_id; anything at or below it is unknown here."""
+        with self._lock:
+            self._buffer.clear()
+            self._buffer_bytes = 0
+            self._floor = self.last_id = last_id
+
+    def _replay(self, last_event_id: Optional[int], flt: Optional[ProjectFilter]) -> List[Event]:
+        """Events after last_event_id, or a single resync event if there is a gap."""
+        if last_event_id is None or last_event_id == self.last_id:
+            return []
+        if last_event_id < self._floor or last_event_id > self.last_id:
+            return [(self.last_id, json.dumps({"type": "resync"}))]
+        replay = []
+        for event_id, data in self._buffer:
+            if event_id > last_event_id:
+                view = _view(flt, data, _lazy_json(data))
+                if view is not None:
+                    replay.append((event_id, view))
+        return replay
+
+    def subscribe(self, last_event_id: Optional[int] = None,
+                  flt: Optional[ProjectFilter] = None) -> queue.Queue:
+        q = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        q.flt = flt
+        with self._lock:
+            for event in self._replay(last_event_id, flt)[-SUBSCRIBER_QUEUE_SIZE:]:
+                q.put_nowait(event)
+            self._subscribers.setdefault(_filter_key(flt), set()).add(q)
+        return q
+
+    def unsubscribe(self, q: queue.Queue):
+        with self._lock:
+            key = _filter_key(getattr(q, "flt", None))
+            group = self._subscribers.get(key)
+            if group is not None:
+                group.discard(q)
+                if not group:
+                    del self._subscribers[key]
+
+    def subscribe_async(self, last_event_id: Optional[int] = None,
+                        flt: Optional[ProjectFilter] = None) -> AsyncSubscriber:
+        loop = asyncio.get_running_loop()
+        sub = AsyncSubscriber(loop, flt)
+        with self._lock:
+            for event in self._replay(last_event_id, flt)[-SUBSCRIBER_QUEUE_SIZE:]:
+                sub.queue.put_nowait(event)
+            groups = self._async_subscribers.setdefault(loop, {})
+            groups.setdefault(_filter_key(flt), set()).add(sub)
+        return sub
+
+    def unsubscribe_async(self, sub: AsyncSubscriber):
+        with self._lock:
+            groups = self._async_subscribers.get(sub.loop)
+            if groups is None:
+                return
+            key = _filter_key(sub.flt)
+            group = groups.get(key)
+            if group is not None:
+                group.discard(sub)
+                if not group:
+                    del groups[key]
+            if not groups:
+                del self._async_subscribers[sub.loop]
+
+    def _remember(self, event: Event):
+        self._buffer.append(event)
+        self._buffer_bytes += len(event[1])
+        while self._buffer and (
+            len(self._buffer) > self.replay_events or self._buffer_bytes > self.replay_bytes
+        ):
+            evicted_id, evicted = self._buffer.popleft()
+            self._buffer_bytes -= len(evicted)
+            self._floor = evicted_id
+
+    def deliver(self, event_id: int, data: str):
+        """Deliver to all matching local subscribers. Drop slow ones."""
+        parsed = _lazy_json(data)
+        views: Dict[Optional[tuple], Optional[str]] = {}
+
+        def view_for(key, subs):
+            if key not in views:
+                views[key] = _view(next(iter(subs)).flt, data, parsed)
+            return views[key]
+
+        with self._lock:
+            self.last_id = event_id
+            self.events_total += 1
+            self._remember((event_id, data))
+            dead = []
+            for key, group in self._subscribers.items():
+                view = view_for(key, group)
+                if view is None:
+                    continue
+                for q in group:
+                    try:
+                        q.put_nowait((event_id, view))
+                    except queue.Full:
+                        dead.append((key, q))
+            self.dropped_total += len(dead)
+            for key, q in dead:
+                self._subscribers[key].discard(q)
+                if not self._subscribers[key]:
+                    del self._subscribers[key]
+
+            loops = []
+            for loop, groups in self._async_subscribers.items():
+                batches = []
+                for key, group in groups.items():
+                    view = view_for(key, group)
+                    if view is not None:
+                        batches.append((tuple(group), (event_id, view)))
+                if batches:
+                    loops.append((loop, batches))
+
+        for loop, batches in loops:
+            try:
+                loop.call_soon_threadsafe(self._fan_out_async, batches)
+            except RuntimeError:
+                # loop already closed; its subscribers are gone with it
+                pass
+
+    def _fan_out_async(self, batches):
+        for subs, event in batches:
+            for sub in subs:
+                if not sub.dropped and not sub._put(event):
+                    self.unsubscribe_async(sub)
+                    with self._lock:
+                        self.dropped_total += 1
+
+    def stats(self) -> dict:
+        """Subscriber counts, queue depths and totals for this process."""
+        with self._lock:
+            sync_queues = [q for group in self._subscribers.values() for q in group]
+            async_queues = [
+                sub.queue for groups in self._async_subscribers.values()
+                for group in groups.values() for sub in group
+            ]
+            depths = [q.qsize() for q in sync_queues] + [q.qsize() for q in async_queues]
+            return {
+                "sync_subscribers": len(sync_queues),
+                "async_subscribers": len(async_queues),
+                "queue_depth_sum": sum(depths),
+                "queue_depth_max": max(depths, default=0),
+                "dropped_total": self.dropped_total,
+                "events_total": self.events_total,
+                "replay_events": len(self._buffer),
+            }
+
+
+class InProcessBackend:
+    """Single-worker default: publish goes straight to this process' hub."""
+
+    def __init__(self, hub: _Hub):
+        self.hub = hub
+        # Seed ids from the clock so they keep increasing across restarts
+        self._ids = itertools.count(int(time.time() * 1000) + 1)
+        self._lock = threading.Lock()
+        hub.reset(int(time.time() * 1000))
+
+    def publish(self, data: str):
+        with self._lock:
+            self.hub.deliver(next(self._ids), data)
+
+
+class SQLiteLogBackend:
+    """
+    Cross-process backend with no outside service.
+
+    Every worker appends published events to a shared SQLite log file and runs
+    a daemon thread that tails the log, handing new rows to its local hub.
+    Old rows are pruned by whichever worker publishes.
+    """
+
+    def __init__(self, hub: _Hub, path, poll_interval=0.1, retention_secs=300):
+        self.hub = hub
+        self.path = str(path)
+        self.poll_interval = poll_interval
+        self.retention_secs = retention_secs
+        self._local = threading.local()
+        self._last_prune = 0.0
+
+        conn = self._conn()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS events ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " ts REAL NOT NULL,"
+            " data TEXT NOT NULL)"
+        )
+        row = conn.execute("SELECT COALESCE(MAX(id), 0) FROM events").fetchone()
+        self._cursor = row[0]
+        hub.reset(self._cursor)
+
+        t = threading.Thread(target=self._tail, name="realtime-sqlite-tail", daemon=True)
+        t.start()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def publish(self, data: str):
+        now = time.time()
+        conn = self._conn()
+        conn.execute("INSERT INTO events (ts, data) VALUES (?, ?)", (now, data))
+        if now - self._last_prune > self.retention_secs:
+            self._last_prune = now
+            conn.execute("DELETE FROM events WHERE ts < ?", (now - self.retention_secs,))
+
+    def _tail(self):
+        while True:
+            try:
+                rows = self._conn().execute(
+                    "SELECT id, data FROM events WHERE id > ? ORDER BY id",
+                    (self._cursor,),
+                ).fetchall()
+            except sqlite3.Error:
+                rows = []
+            for event_id, data in rows:
+                self._cursor = event_id
+                self.hub.deliver(event_id, data)
+            time.sleep(self.poll_interval)
+
+
+_hub = _Hub(
+    replay_events=getattr(settings, "REALTIME_REPLAY_EVENTS", 1000),
+    replay_bytes=getattr(settings, "REALTIME_REPLAY_BYTES", 1024 * 1024),
+)
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def _create_backend():
+    name = getattr(settings, "REALTIME_BACKEND", "inprocess")
+    if name == "inprocess":
+        return InProcessBackend(_hub)
+    if name == "sqlite":
+        return SQLiteLogBackend(
+            _hub,
+            getattr(settings, "REALTIME_SQLITE_PATH", settings.BASE_DIR / "realtime.sqlite3"),
+            poll_interval=getattr(settings, "REALTIME_SQLITE_POLL_SECS", 0.1),
+        )
+    raise ValueError(f"Unknown REALTIME_BACKEND {name!r}")
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = _create_backend()
+    return _backend
+
+
+def subscribe(last_event_id: Optional[int] = None,
+              flt: Optional[ProjectFilter] = None) -> queue.Queue:
+    """
+    Subscribe to (event_id, json) pairs, optionally only for projects
+    matching flt. With last_event_id, the queue starts with the events missed
+    since then, or a single resync event if they are no longer buffered.
+    """
+    # Make sure a tailing backend is running before anyone listens
+    get_backend()
+    return _hub.subscribe(last_event_id, flt)
+
 
 def unsubscribe(q: queue.Queue):
-    with _lock:
-        _subscribers.discard(q)
+    _hub.unsubscribe(q)
+
+
+def subscribe_async(last_event_id: Optional[int] = None,
+                    flt: Optional[ProjectFilter] = None) -> AsyncSubscriber:
+    """Subscribe from inside a running event loop (ASGI)."""
+    get_backend()
+    return _hub.subscribe_async(last_event_id, flt)
+
+
+def unsubscribe_async(sub: AsyncSubscriber):
+    _hub.unsubscribe_async(sub)
+
+
+def stats() -> dict:
+    """This process' subscriber and delivery counters (see _Hub.stats)."""
+    return _hub.stats()
+
 
 def publish(event: dict):
-    """Publish to all subscribers. Drop slow ones."""
-    data = json.dumps(event)
-    with _lock:
-        dead = []
-        for q in list(_subscribers):
-            try:
-                q.put_nowait(data)
-            except queue.Full:
-                dead.append(q)
-        for q in dead:
-            _subscribers.discard(q)
+    """Publish to all subscribers on every worker sharing the backend."""
+    get_backend().publish(json.dumps(event))
+
+
+# ---------------- coalescing ---------------------------------------------
+#
+# Project events go through emit_project_event() rather than publish().
+# Inside a coalesce() block (bulk operations) or within the optional
+# REALTIME_COALESCE_WINDOW_SECS window they are merged into one
+# "projects_batch" event; either way nothing is sent before commit.
+
+_batch_local = threading.local()
+_window_lock = threading.Lock()
+_window_batch: Optional["_Batch"] = None
+
+
+class _Batch:
+    def __init__(self):
+        self.ids: Dict[int, dict] = {}
+        self.fields: Set[str] = set()
+        self.events: List[dict] = []
+
+    def add(self, event: dict, fields):
+        # latest payload per project wins
+        self.ids[event["project"]["id"]] = event["project"]
+        self.fields.update(fields)
+        self.events.append(event)
+
+    def to_event(self) -> dict:
+        if len(self.events) == 1:
+            return self.events[0]
+        return {
+            "type": "projects_batch",
+            "ids": list(self.ids),
+            "fields": sorted(self.fields),
+            # used by the hub to match filtered subscribers, never sent as-is
+            "projects": list(self.ids.values()),
+        }
+
+
+@contextmanager
+def coalesce():
+    """Merge project events emitted inside the block into one event sent after commit."""
+    depth = getattr(_batch_local, "depth", 0)
+    if depth == 0:
+        _batch_local.batch = _Batch()
+    _batch_local.depth = depth + 1
+    try:
+        yield
+    except BaseException:
+        if depth == 0:
+            _batch_local.batch = None
+        raise
+    finally:
+        _batch_local.depth = depth
+    if depth == 0:
+        batch, _batch_local.batch = _batch_local.batch, None
+        if batch.events:
+            transaction.on_commit(lambda: publish(batch.to_event()))
+
+
+def _flush_window():
+    global _window_batch
+    with _window_lock:
+        batch, _window_batch = _window_batch, None
+    if batch is not None and batch.events:
+        publish(batch.to_event())
+
+
+def _add_to_window(event: dict, fields):
+    global _window_batch
+    with _window_lock:
+        if _window_batch is None:
+            _window_batch = _Batch()
+            timer = threading.Timer(settings.REALTIME_COALESCE_WINDOW_SECS, _flush_window)
+            timer.daemon = True
+            timer.start()
+        _window_batch.add(event, fields)
+
+
+def emit_project_event(event: dict, fields=()):
+    """Queue a single-project event; fields names what changed."""
+    event["fields"] = sorted(fields)
+    batch = getattr(_batch_local, "batch", None)
+    if batch is not None:
+        batch.add(event, fields)
+    elif getattr(settings, "REALTIME_COALESCE_WINDOW_SECS", 0) > 0:
+        transaction.on_commit(lambda: _add_to_window(event, fields))
+    else:
+        transaction.on_commit(lambda: publish(event))
@@ -0,0 +1,44 @@
+import csv
+import io
+import json
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+from .metrics import serializing
+
+
+class TimedJSONRenderer(JSONRenderer):
+    """JSONRenderer whose time counts as serialization in request metrics."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with serializing():
+            return super().render(data, accepted_media_type, renderer_context)
+
+
+class NDJSONRenderer(BaseRenderer):
+    """Format for /projects/export/?format=ndjson; rows are streamed by the view."""
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        # only reached for error bodies
+        return json.dumps(data).encode() + b"\n"
+
+
+class CSVRenderer(BaseRenderer):
+    """Format for /projects/export/?format=csv; rows are streamed by the view."""
+
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        # only reached for error bodies: one header row, one value row
+        data = data if isinstance(data, dict) else {"detail": data}
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(data.keys())
+        writer.writerow(data.values())
+        return buf.getvalue().encode()
@@ -0,0 +1,87 @@
+"""
+Read/write splitting. Writes, and anything read inside a write request, go
+to the primary ("default"). Safe-method requests on views using
+ReadReplicaMixin read from settings.DATABASE_READ_ALIAS, unless the client
+wrote within the last READ_AFTER_WRITE_SECS (read-your-writes stickiness,
+carried in a cookie so it works across workers).
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from django.conf import settings
+from rest_framework.permissions import SAFE_METHODS
+
+PRIMARY = "default"
+STICKY_COOKIE = "db_primary_until"
+
+_read_alias: ContextVar[Optional[str]] = ContextVar("read_alias", default=None)
+
+
+def read_alias() -> str:
+    return _read_alias.get() or PRIMARY
+
+
+@contextmanager
+def reading_from(alias: Optional[str]):
+    token = _read_alias.set(alias)
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+def primary():
+    """Block whose reads must see the latest commit (e.g. values cached by generation)."""
+    return reading_from(PRIMARY)
+
+
+def _sticky(request) -> bool:
+    try:
+        return float(request.COOKIES.get(STICKY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+class ReadReplicaRouter:
+    """Reads follow the current request's read alias; everything else is the primary's."""
+
+    def db_for_read(self, model, **hints):
+        return read_alias()
+
+    def db_for_write(self, model, **hints):
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # replicas get their schema with the data
+        return db == PRIMARY
+
+
+class ReadReplicaMixin:
+    """
+    ViewSet mixin: GET/HEAD/OPTIONS read from the replica, unsafe methods
+    read and write on the primary and make the client sticky to it.
+    Querysets evaluated after the view returns (streamed responses) must be
+    pinned with .using(qs.db) while the view runs.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        alias = getattr(settings, "DATABASE_READ_ALIAS", None)
+        if alias and request.method in SAFE_METHODS and not _sticky(request):
+            self._read_token = _read_alias.set(alias)
+        super().initial(request, *args, **kwargs)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        token = getattr(self, "_read_token", None)
+        if token is not None:
+            _read_alias.reset(token)
+            self._read_token = None
+        window = getattr(settings, "READ_AFTER_WRITE_SECS", 0)
+        if request.method not in SAFE_METHODS and response.status_code < 400 and window:
+            response.set_cookie(STICKY_COOKIE, f"{time.time() + window:.3f}", max_age=window,
+                                httponly=True, samesite="Lax")
+        return super().finalize_response(request, response, *args, **kwargs)
@@ -0,0 +1,58 @@
+"""
+Read path that skips ModelSerializer: rows are fetched as values_list()
+tuples and turned into the exact dicts ProjectSerializer would produce by a
+converter compiled once per field list.
+"""
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from django.utils import timezone
+
+from .serializers import ProjectSerializer
+
+# same fields, same order as the serializer, so rendered bytes match
+PROJECT_FIELDS: Tuple[str, ...] = tuple(ProjectSerializer.Meta.fields)
+
+# fields whose serializer representation differs from the DB value
+_CONVERSIONS = {"last_updated": "iso"}
+
+_converters: Dict[Tuple[tuple, tuple], Callable[[tuple], dict]] = {}
+
+
+def iso(value):
+    """Datetime as DRF's DateTimeField renders it (local time, 'Z' for UTC)."""
+    if value is None:
+        return None
+    value = timezone.localtime(value).isoformat()
+    return value[:-6] + "Z" if value.endswith("+00:00") else value
+
+
+def row_converter(fields: Tuple[str, ...], output: Tuple[str, ...] = None) -> Callable[[tuple], dict]:
+    """
+    Function turning a values_list(*fields) tuple into a serializer-shaped
+    dict with the keys in output (default: all of fields), e.g.
+    lambda r: {"id": r[0], ..., "last_updated": iso(r[8]), ...}.
+    """
+    output = tuple(output or fields)
+    key = (tuple(fields), output)
+    convert = _converters.get(key)
+    if convert is None:
+        items = []
+        for name in output:
+            expr = f"r[{fields.index(name)}]"
+            if name in _CONVERSIONS:
+                expr = f"{_CONVERSIONS[name]}({expr})"
+            items.append(f"{name!r}: {expr}")
+        namespace = {}
+        exec(f"def convert(r):\n    return {{{', '.join(items)}}}", {"iso": iso}, namespace)
+        convert = _converters[key] = namespace["convert"]
+    return convert
+
+
+def to_dicts(rows: Iterable[tuple], fields: Tuple[str, ...] = PROJECT_FIELDS,
+             output: Tuple[str, ...] = None) -> List[dict]:
+    return list(map(row_converter(fields, output), rows))
+
+
+def instance_dict(instance, output: Tuple[str, ...] = PROJECT_FIELDS) -> dict:
+    """Serializer-shaped dict for a model instance, without a serializer."""
+    return row_converter(output)(tuple(getattr(instance, name) for name in output))
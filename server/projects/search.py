@@ -0,0 +1,59 @@
+import re
+
+from django.db import OperationalError, connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = "projects_project_fts"
+
+_fts_available = None
+
+
+def fts_available() -> bool:
+    """Whether the FTS5 index from migration 0002 exists (checked once per process)."""
+    global _fts_available
+    if _fts_available is None:
+        if connection.vendor != "sqlite":
+            _fts_available = False
+        else:
+            try:
+                with connection.cursor() as cur:
+                    cur.execute(
+                        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [FTS_TABLE]
+                    )
+                    _fts_available = cur.fetchone() is not None
+            except OperationalError:
+                _fts_available = False
+    return _fts_available
+
+
+def match_expression(q: str) -> str:
+    """Every word must match, each as a prefix: 'dash fro' -> '"dash"* "fro"*'."""
+    return " ".join(f'"{token}"*' for token in re.findall(r"\w+", q))
+
+
+def search(qs, q: str, rank: bool = True):
+    """
+    Restrict qs to projects matching q. Served from the FTS5 index, ordered by
+    relevance when rank is set (top-level querysets only, as it joins by table
+    name); falls back to LIKE scans without FTS.
+    """
+    expr = match_expression(q)
+    if not expr or not fts_available():
+        return qs.filter(
+            Q(title__icontains=q) |
+            Q(description__icontains=q) |
+            Q(tags__icontains=q)
+        )
+
+    if not rank:
+        # alias-free form, safe to nest inside other queries
+        return qs.filter(id__in=RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [expr]))
+
+    # join the virtual table so SQLite drives the query from the index
+    return qs.extra(
+        tables=[FTS_TABLE],
+        where=[f"{FTS_TABLE}.rowid = projects_project.id", f"{FTS_TABLE} MATCH %s"],
+        params=[expr],
+        order_by=[f"{FTS_TABLE}.rank", "-last_updated", "-id"],
+    )
@@ -1,10 +1,19 @@
 from rest_framework import serializers
+from .metrics import serializing
 from .models import Project
 
+class TimedListSerializer(serializers.ListSerializer):
+
+    @property
+    def data(self):
+        with serializing():
+            return super().data
+
 class ProjectSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Project
+        list_serializer_class = TimedListSerializer
         fields = [
             "id",
             "title",
@@ -20,6 +29,18 @@ class ProjectSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "last_updated", "is_deleted", "version"]
 
+    def __init__(self, *args, fields=None, **kwargs):
+        # fields: optional subset to output (sparse fieldsets)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @property
+    def data(self):
+        with serializing():
+            return super().data
+
     # Update method to increment version on each update
     def update(self, instance, validated_data):
         for k, v in validated_data.items():
@@ -1,20 +1,43 @@
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from .models import Project
-from .realtime import publish
+from .realtime import emit_project_event
+from . import vocab
+
+# fields clients care about when an update doesn't say what it touched
+_EVENT_FIELDS = ("title", "owner", "status", "health", "progress", "is_deleted", "tags")
+_PAYLOAD_FIELDS = ("id", "title", "owner", "tags", "status", "health", "progress",
+                   "last_updated", "is_deleted")
+
+def _payload(instance: Project) -> dict:
+    return {
+        "id": instance.id,
+        "title": instance.title,
+        "owner": instance.owner,
+        "tags": instance.tags,
+        "status": instance.status,
+        "health": instance.health,
+        "progress": instance.progress,
+        "last_updated": instance.last_updated.isoformat(),
+        "is_deleted": instance.is_deleted,
+    }
 
 @receiver(post_save, sender=Project)
-def on_project_saved(sender, instance: Project, created, **kwargs):
-    publish({
+def on_project_saved(sender, instance: Project, created, update_fields=None, **kwargs):
+    emit_project_event({
         "type": "project_created" if created else "project_updated",
-        "project": {
-            "id": instance.id,
-            "title": instance.title,
-            "owner": instance.owner,
-            "status": instance.status,
-            "health": instance.health,
-            "progress": instance.progress,
-            "last_updated": instance.last_updated.isoformat(),
-            "is_deleted": instance.is_deleted,
-        },
-    })
+        "project": _payload(instance),
+    }, fields=update_fields or _EVENT_FIELDS)
+    vocab.invalidate(None if created else update_fields)
+
+def emit_instance_updated(instance: Project, fields):
+    """Event for an instance written with QuerySet.update() (no post_save)."""
+    emit_project_event({"type": "project_updated", "project": _payload(instance)}, fields=fields)
+    vocab.invalidate(fields)
+
+def emit_rows_changed(qs, fields):
+    """Events for rows written with QuerySet.update(), which skips post_save."""
+    vocab.invalidate(fields)
+    for row in qs.values(*_PAYLOAD_FIELDS):
+        row["last_updated"] = row["last_updated"].isoformat()
+        emit_project_event({"type": "project_updated", "project": row}, fields=fields)
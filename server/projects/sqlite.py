@@ -0,0 +1,66 @@
+"""
+SQLite tuning for several workers sharing one database file.
+
+configure_connection (a connection_created receiver) applies
+settings.SQLITE_PRAGMAS: WAL so readers never wait for writers, a busy
+timeout so writers queue instead of failing, and cache/mmap sizes.
+
+write_transaction() is atomic() that opens with BEGIN IMMEDIATE. A
+deferred BEGIN only asks for the write lock at the first write; if another
+writer committed since this transaction's first read, SQLite fails it at
+once with "database is locked" and the busy timeout cannot help. Taking the
+lock up front makes the wait happen at BEGIN, where it is safe to retry.
+"""
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import OperationalError, transaction
+
+_begin_mode: ContextVar[str] = ContextVar("sqlite_begin_mode", default="")
+
+
+def configure_connection(sender, connection, **kwargs):
+    """connection_created receiver."""
+    if connection.vendor != "sqlite":
+        return
+    pragmas = getattr(settings, "SQLITE_PRAGMAS", {})
+    with connection.cursor() as cursor:
+        for name, value in pragmas.items():
+            if name == "journal_mode" and connection.is_in_memory_db():
+                continue
+            cursor.execute(f"PRAGMA {name} = {value}")
+
+
+def begin(connection):
+    """
+    BEGIN in the mode write_transaction() asked for (plain BEGIN otherwise),
+    retried with jittered exponential backoff while the database is locked.
+    """
+    mode = _begin_mode.get()
+    retries = getattr(settings, "SQLITE_BEGIN_RETRIES", 0) if mode else 0
+    backoff = getattr(settings, "SQLITE_BEGIN_BACKOFF_SECS", 0.01)
+    for attempt in range(retries + 1):
+        try:
+            connection.cursor().execute(f"BEGIN {mode}".strip())
+            return
+        except OperationalError as exc:
+            if "locked" not in str(exc) or attempt == retries:
+                raise
+            time.sleep(backoff * 2 ** attempt * random.uniform(0.5, 1.5))
+
+
+@contextmanager
+def write_transaction(using=None):
+    """
+    transaction.atomic() for blocks that write, taking SQLite's write lock
+    at BEGIN. Inside an outer atomic block it is an ordinary savepoint.
+    """
+    token = _begin_mode.set("IMMEDIATE")
+    try:
+        with transaction.atomic(using=using):
+            yield
+    finally:
+        _begin_mode.reset(token)
@@ -0,0 +1,83 @@
+import json
+from unittest import mock
+
+from django.db import OperationalError
+from django.test import TestCase
+
+from projects import views
+from projects.models import Project
+
+URL = "/api/v1/projects/batch/"
+
+
+class BatchTests(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(title="t", owner="o")
+
+    def _post(self, operations, **extra):
+        return self.client.post(URL, json.dumps({"operations": operations, **extra}), content_type="application/json")
+
+    def test_aborted_batch_reports_earlier_items_as_rolled_back(self):
+        resp = self._post([
+            {"op": "create", "data": {"title": "new", "owner": "o"}},
+            {"op": "update", "id": self.project.pk, "data": {"progress": 10}},
+            {"op": "update", "id": self.project.pk, "version": 99, "data": {"progress": 20}},
+            {"op": "delete", "id": self.project.pk},
+        ])
+        self.assertEqual(resp.status_code, 409)
+        body = resp.json()
+        self.assertFalse(body["committed"])
+        self.assertEqual(body["results"], [
+            {"index": 0, "op": "create", "status": 424},
+            {"index": 1, "op": "update", "status": 424},
+            {"index": 2, "op": "update", "id": self.project.pk, "status": 409, "current_version": 2},
+        ])
+        self.assertEqual(Project.objects.count(), 1)
+        self.project.refresh_from_db()
+        self.assertEqual((self.project.version, self.project.progress), (1, 0))
+
+    def test_committed_batch(self):
+        resp = self._post([
+            {"op": "create", "data": {"title": "new", "owner": "o"}},
+            {"op": "update", "id": self.project.pk, "version": 1, "data": {"progress": 10}},
+        ])
+        self.assertEqual(resp.status_code, 200)
+        created, updated = resp.json()["results"]
+        self.assertEqual((created["status"], updated["status"]), (201, 200))
+        self.assertEqual(updated["etag"], 'W/"2"')
+        self.assertEqual(Project.objects.get(pk=created["id"]).title, "new")
+
+    def test_non_atomic_batch_keeps_the_items_that_worked(self):
+        resp = self._post([
+            {"op": "update", "id": self.project.pk, "data": {"progress": 10}},
+            {"op": "update", "id": 0, "data": {"progress": 20}},
+        ], atomic=False)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual([r["status"] for r in resp.json()["results"]], [200, 404])
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.progress, 10)
+
+    def test_version_must_be_an_integer(self):
+        for version in ("1", True, 1.0, [1]):
+            with self.subTest(version=version):
+                resp = self._post([{"op": "update", "id": self.project.pk, "version": version,
+                                    "data": {"progress": 10}}], atomic=False)
+                result = resp.json()["results"][0]
+                self.assertEqual(result["status"], 400)
+                self.assertEqual(result["errors"], {"version": ["must be an integer"]})
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.version, 1)
+
+    def test_database_error_is_an_item_failure_in_both_modes(self):
+        for atomic in (True, False):
+            with self.subTest(atomic=atomic), \
+                    mock.patch.object(views, "_cas_update", side_effect=OperationalError("database is locked")):
+                resp = self._post([
+                    {"op": "create", "data": {"title": "new", "owner": "o"}},
+                    {"op": "update", "id": self.project.pk, "data": {"progress": 10}},
+                ], atomic=atomic)
+                self.assertEqual(resp.status_code, 409 if atomic else 200)
+                failed = resp.json()["results"][-1]
+                self.assertEqual((failed["status"], failed["errors"]), (409, {"detail": ["database is locked"]}))
+        # the atomic batch's create was rolled back, the other one's kept
+        self.assertEqual(Project.objects.filter(title="new").count(), 1)
@@ -0,0 +1,59 @@
+import json
+
+from django.test import TestCase
+
+from projects.models import Project, ProjectTag
+
+
+class BulkTests(TestCase):
+    def setUp(self):
+        self.tagged = Project.objects.create(title="a", owner="o", tags=["maintenance"])
+        self.plain = Project.objects.create(title="b", owner="o", tags=["web"])
+        self.trashed = Project.objects.create(title="c", owner="o")
+        self.trashed.soft_delete()
+
+    def _post(self, action, body):
+        return self.client.post(f"/api/v1/projects/{action}/", json.dumps(body), content_type="application/json")
+
+    def test_tag_is_added_once(self):
+        ids = [self.plain.pk, self.tagged.pk]
+        resp = self._post("bulk-update", {"ids": ids, "tag": "maintenance"})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json(), {"updated_count": 1, "requested_ids": ids, "found_ids": sorted(ids)})
+        self.plain.refresh_from_db()
+        self.tagged.refresh_from_db()
+        self.assertEqual((self.plain.tags, self.plain.version), (["web", "maintenance"], 2))
+        self.assertEqual((self.tagged.tags, self.tagged.version), (["maintenance"], 1))
+        self.assertEqual(set(ProjectTag.objects.filter(name="maintenance").values_list("project_id", flat=True)),
+                         set(ids))
+
+        rerun = self._post("bulk-update", {"ids": ids, "tag": "maintenance"})
+        self.assertEqual(rerun.json()["updated_count"], 0)
+        self.plain.refresh_from_db()
+        self.assertEqual(self.plain.version, 2)
+
+    def test_tag_with_other_changes(self):
+        resp = self._post("bulk-update", {"ids": [self.plain.pk, self.tagged.pk], "tag": "maintenance",
+                                          "status": "paused"})
+        self.assertEqual(resp.json()["updated_count"], 2)
+        for project in (self.plain, self.tagged):
+            project.refresh_from_db()
+            self.assertEqual((project.status, project.tags.count("maintenance"), project.version), ("paused", 1, 2))
+
+    def test_non_integer_ids_are_a_400(self):
+        for action in ("bulk-update", "bulk-recover"):
+            for ids in (["zz"], [], "1", [None], [{"id": 1}]):
+                with self.subTest(action=action, ids=ids):
+                    self.assertEqual(self._post(action, {"ids": ids, "tag": "x"}).status_code, 400)
+
+    def test_bulk_recover(self):
+        other = Project.objects.create(title="d", owner="o")
+        other.soft_delete()
+        ids = [other.pk, self.plain.pk, self.trashed.pk, 0]
+        resp = self._post("bulk-recover", {"ids": ids})
+        self.assertEqual(resp.json(), {"updated_count": 2, "requested_ids": ids,
+                                       "found_ids": sorted([other.pk, self.trashed.pk])})
+        for project in (other, self.trashed):
+            project.refresh_from_db()
+            self.assertEqual((project.is_deleted, project.version), (False, 3))
+        self.assertEqual(self._post("bulk-recover", {"ids": ids}).json()["updated_count"], 0)
@@ -0,0 +1,63 @@
+from django.test import TestCase
+
+from projects.models import Project
+from projects.views import TOMBSTONE_FIELDS
+
+URL = "/api/v1/projects/changes/"
+
+
+class ChangesFeedTests(TestCase):
+    def setUp(self):
+        self.kept, self.trashed, self.purged, self.edited = (
+            Project.objects.create(title=t, owner="o") for t in ("kept", "trashed", "purged", "edited"))
+        self.trashed.soft_delete()
+        purged_id = self.purged.pk
+        self.purged.delete()
+        self.purged.pk = purged_id
+        Project.objects.filter(pk=self.edited.pk).update(progress=50)
+        self.later = Project.objects.create(title="later", owner="o")
+
+    def _get(self, **params):
+        resp = self.client.get(URL, params)
+        self.assertEqual(resp.status_code, 200)
+        return resp.json()
+
+    def test_full_sync(self):
+        body = self._get()
+        results = body["results"]
+        self.assertEqual([r["id"] for r in results],
+                         [self.kept.pk, self.trashed.pk, self.purged.pk, self.edited.pk, self.later.pk])
+        seqs = [r["change_seq"] for r in results]
+        self.assertEqual(seqs, sorted(seqs))
+        self.assertEqual((body["next_since"], body["has_more"]), (seqs[-1], False))
+
+        trashed, purged, edited = results[1:4]
+        self.assertEqual(set(trashed), set(TOMBSTONE_FIELDS))
+        self.assertTrue(trashed["is_deleted"])
+        self.assertEqual(purged, {"id": self.purged.pk, "change_seq": purged["change_seq"],
+                                  "is_deleted": True, "purged": True})
+        self.assertEqual((edited["progress"], edited["title"]), (50, "edited"))
+
+    def test_pages_continue_across_both_streams(self):
+        everything = self._get()["results"]
+        for limit in range(1, len(everything) + 1):
+            with self.subTest(limit=limit):
+                since, seen, has_more = 0, [], True
+                while has_more:
+                    body = self._get(since=since, limit=limit)
+                    self.assertLessEqual(len(body["results"]), limit)
+                    seen += body["results"]
+                    since, has_more = body["next_since"], body["has_more"]
+                self.assertEqual(seen, everything)
+                self.assertEqual(self._get(since=since)["results"], [])
+
+    def test_since_a_change_skips_what_came_before(self):
+        everything = self._get()["results"]
+        after = everything[1]["change_seq"]
+        self.assertEqual(self._get(since=after)["results"], everything[2:])
+        self.assertEqual(self._get(since=after)["since"], after)
+
+    def test_bad_parameters_are_a_400(self):
+        for params in ({"since": "abc"}, {"since": "-1"}, {"limit": "0"}, {"limit": "x"}):
+            with self.subTest(params=params):
+                self.assertEqual(self.client.get(URL, params).status_code, 400)
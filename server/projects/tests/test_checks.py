@@ -0,0 +1,20 @@
+from django.core import checks
+from django.db import connection
+from django.test import TestCase
+
+from projects.checks import TRIGGERS, missing_triggers
+
+
+class TriggerCheckTests(TestCase):
+    def test_migrated_database_has_every_trigger(self):
+        self.assertEqual(missing_triggers(connection), [])
+        self.assertEqual(checks.run_checks(tags=[checks.Tags.database], databases=["default"]), [])
+
+    def test_dropped_trigger_is_an_error(self):
+        for names in TRIGGERS.values():
+            with self.subTest(trigger=names[0]):
+                with connection.cursor() as cur:
+                    cur.execute(f"DROP TRIGGER {names[0]}")  # rolled back with the test
+                errors = checks.run_checks(tags=[checks.Tags.database], databases=["default"])
+                self.assertIn(names[0], [e.msg.split()[1] for e in errors])
+                self.assertEqual({e.id for e in errors}, {"projects.E001"})
@@ -0,0 +1,37 @@
+from django.test import TestCase
+
+from projects.models import Project
+
+
+class CollectionValidatorTests(TestCase):
+    URL = "/api/v1/projects/?is_deleted=false&status=paused"
+
+    def setUp(self):
+        self.old, self.new = (Project.objects.create(title=t, owner="o", status="paused") for t in "ab")
+
+    def test_no_last_modified_on_collections(self):
+        resp = self.client.get(self.URL)
+        self.assertIn("ETag", resp)
+        self.assertNotIn("Last-Modified", resp)
+        self.assertNotIn("Last-Modified", self.client.get("/api/v1/projects/deleted/"))
+
+    def test_row_leaving_the_set_is_not_a_304(self):
+        first = self.client.get(self.URL)
+        self.old.soft_delete()  # not the newest row: max(last_updated) of the set is unchanged
+        by_etag = self.client.get(self.URL, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(by_etag.status_code, 200)
+        self.assertEqual(by_etag.json()["count"], 1)
+        by_date = self.client.get(self.URL, HTTP_IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT")
+        self.assertEqual(by_date.status_code, 200)
+
+    def test_unchanged_collection_is_a_304(self):
+        etag = self.client.get(self.URL)["ETag"]
+        self.assertEqual(self.client.get(self.URL, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_retrieve_keeps_last_modified(self):
+        resp = self.client.get(f"/api/v1/projects/{self.new.id}/")
+        self.assertEqual(resp["ETag"], f'W/"{self.new.version}"')
+        self.assertIn("Last-Modified", resp)
+        again = self.client.get(f"/api/v1/projects/{self.new.id}/",
+                                HTTP_IF_MODIFIED_SINCE=resp["Last-Modified"])
+        self.assertEqual(again.status_code, 304)
@@ -0,0 +1,129 @@
+import json
+import threading
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from projects import realtime
+from projects.models import Project
+
+
+class CoalescingTests(TestCase):
+    def setUp(self):
+        self.projects = [Project.objects.create(title=f"p{i}", owner="o") for i in range(5)]
+        self.published = []
+        self.sent = threading.Event()
+
+        def publish(event):
+            self.published.append(event)
+            self.sent.set()
+
+        patch = mock.patch.object(realtime, "publish", publish)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_bulk_update_sends_one_batch_event(self):
+        ids = [p.pk for p in self.projects]
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            resp = self.client.post("/api/v1/projects/bulk-update/", json.dumps({"ids": ids, "status": "paused"}),
+                                    content_type="application/json")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(callbacks), 1)
+        [event] = self.published
+        self.assertEqual(event["type"], "projects_batch")
+        self.assertEqual(sorted(event["ids"]), ids)
+        self.assertEqual(event["fields"], ["status"])
+        self.assertEqual({p["status"] for p in event["projects"]}, {"paused"})
+
+    def test_single_write_in_a_block_is_sent_as_itself(self):
+        with self.captureOnCommitCallbacks(execute=True), realtime.coalesce():
+            self.projects[0].soft_delete()
+        [event] = self.published
+        self.assertEqual((event["type"], event["project"]["id"]), ("project_updated", self.projects[0].pk))
+
+    def test_nothing_is_sent_for_a_rolled_back_block(self):
+        with self.captureOnCommitCallbacks(execute=True), self.assertRaises(RuntimeError), realtime.coalesce():
+            self.projects[0].soft_delete()
+            raise RuntimeError
+        self.assertEqual(self.published, [])
+
+    @override_settings(REALTIME_COALESCE_WINDOW_SECS=0.05)
+    def test_window_timer_flushes_separate_writes_as_one_batch(self):
+        for project in self.projects[:3]:
+            with self.captureOnCommitCallbacks(execute=True):
+                project.soft_delete()
+        self.assertTrue(self.sent.wait(5))
+        [event] = self.published
+        self.assertEqual(event["type"], "projects_batch")
+        self.assertEqual(event["ids"], [p.pk for p in self.projects[:3]])
+        self.assertEqual(event["fields"], ["is_deleted", "last_updated", "version"])
+
+        # the window closed with its flush; the next write opens a new one
+        self.sent.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.projects[3].restore()
+        self.assertTrue(self.sent.wait(5))
+        self.assertEqual(self.published[1]["project"]["id"], self.projects[3].pk)
+
+
+class FilteredSubscriberTests(TestCase):
+    """A subscriber with a ProjectFilter hears only about projects it could be showing."""
+
+    def setUp(self):
+        self.active = Project.objects.create(title="a", owner="Alex", status="active", tags=["react"])
+        self.paused = Project.objects.create(title="p", owner="Bob", status="paused")
+        realtime.get_backend()
+        self.q = realtime.subscribe(flt=realtime.ProjectFilter.from_params({"status": "active"}))
+        self.addCleanup(realtime.unsubscribe, self.q)
+
+    def _received(self):
+        events = []
+        while not self.q.empty():
+            events.append(json.loads(self.q.get_nowait()[1]))
+        return events
+
+    def _update(self, project, **fields):
+        with self.captureOnCommitCallbacks(execute=True):
+            for name, value in fields.items():
+                setattr(project, name, value)
+            project.save(update_fields=list(fields))
+
+    def test_only_matching_projects(self):
+        self._update(self.active, title="a2")
+        self._update(self.paused, title="p2")
+        with self.captureOnCommitCallbacks(execute=True):
+            Project.objects.create(title="new", owner="o", status="planning")
+        [event] = self._received()
+        self.assertEqual((event["type"], event["project"]["id"]), ("project_updated", self.active.pk))
+        with self.captureOnCommitCallbacks(execute=True):
+            created = Project.objects.create(title="new", owner="o", status="active")
+        [event] = self._received()
+        self.assertEqual((event["type"], event["project"]["id"]), ("project_created", created.pk))
+
+    def test_update_moving_a_project_out_of_the_filter(self):
+        self._update(self.active, status="paused")
+        [event] = self._received()
+        self.assertEqual((event["project"]["id"], event["project"]["status"]), (self.active.pk, "paused"))
+        # no longer matching, and the change cannot bring it back
+        self._update(self.active, title="gone")
+        self.assertEqual(self._received(), [])
+        self._update(self.paused, status="active")
+        self.assertEqual([e["project"]["id"] for e in self._received()], [self.paused.pk])
+
+    def test_batch_events_carry_only_matching_ids(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post("/api/v1/projects/bulk-update/",
+                             json.dumps({"ids": [self.active.pk, self.paused.pk], "owner": "Carol"}),
+                             content_type="application/json")
+        [event] = self._received()
+        self.assertEqual(event, {"type": "projects_batch", "ids": [self.active.pk], "fields": ["owner"]})
+
+    def test_owner_tags_and_ids_filters(self):
+        for params, matches in (({"owner": "ALE"}, True), ({"owner": "bob"}, False),
+                                ({"tags": "react"}, True), ({"tags": "react,vue", "tags_match": "all"}, False),
+                                ({"ids": f"{self.active.pk},999"}, True), ({"ids": "999"}, False),
+                                ({"is_deleted": "false", "status": "active"}, True)):
+            with self.subTest(params=params):
+                flt = realtime.ProjectFilter.from_params(params)
+                self.assertIs(flt.match({"id": self.active.pk, "owner": "Alex", "status": "active",
+                                         "tags": ["react"], "is_deleted": False}), matches)
@@ -0,0 +1,64 @@
+import io
+from unittest import mock
+
+from django.test import TestCase
+
+from projects import export, views
+from projects.importer import read_rows, validate_batch
+from projects.models import Project
+
+ROWS = 1000
+URL = "/api/v1/projects/export/"
+
+
+class ExportStreamingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Project.objects.bulk_create(Project(title=f"p{i}", owner="o", description="d" * 500) for i in range(ROWS))
+
+    def _counting_chunks(self):
+        produced = []
+
+        def counting(lines):
+            for chunk in export.chunked(lines):
+                produced.append(chunk)
+                yield chunk
+
+        return produced, mock.patch.object(views, "chunked", counting)
+
+    def test_wsgi_streams_lazily(self):
+        produced, patch = self._counting_chunks()
+        with patch:
+            resp = self.client.get(URL)
+            first = next(resp.streaming_content)
+            self.assertEqual(len(produced), 1)
+            body = first + b"".join(resp.streaming_content)
+        self.assertEqual(body.count(b"\n"), ROWS)
+
+    async def test_asgi_streams_without_buffering(self):
+        produced, patch = self._counting_chunks()
+        with patch:
+            resp = await self.async_client.get(URL)
+            self.assertTrue(resp.is_async)
+            content = aiter(resp)
+            first = await anext(content)
+            # Django collects a sync iterator whole before sending anything
+            self.assertEqual(len(produced), 1)
+            rest = [chunk async for chunk in content]
+        self.assertGreater(len(rest), 1)
+        self.assertEqual(b"".join([first, *rest]).count(b"\n"), ROWS)
+
+    async def test_asgi_csv_has_every_row(self):
+        body = b"".join([chunk async for chunk in aiter(await self.async_client.get(URL + "?format=csv"))])
+        self.assertEqual(body.count(b"\n"), ROWS + 1)
+
+
+class ExportRoundTripTests(TestCase):
+    def test_csv_reimports_the_same_tags(self):
+        tags = [["a,b", "c"], [], ['say "hi"', "ünï"]]
+        for t in tags:
+            Project.objects.create(title="t", owner="o", tags=t)
+        body = b"".join(self.client.get(URL + "?format=csv").streaming_content).decode()
+        valid, errors = validate_batch(list(read_rows(io.StringIO(body, newline=""), "csv")))
+        self.assertEqual(errors, [])
+        self.assertCountEqual([row["tags"] for row in valid], tags)
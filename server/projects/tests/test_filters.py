@@ -0,0 +1,86 @@
+from django.test import TestCase
+
+from projects.models import Project
+
+URL = "/api/v1/projects/?is_deleted=false"
+
+
+class TagFilterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.web = Project.objects.create(title="web", owner="o", tags=["react", "typescript"])
+        cls.mobile = Project.objects.create(title="mobile", owner="o", tags=["react-native", "typescript"])
+        cls.api = Project.objects.create(title="api", owner="o", tags=["python"])
+
+    def _ids(self, query):
+        resp = self.client.get(f"{URL}&{query}")
+        self.assertEqual(resp.status_code, 200)
+        return {r["id"] for r in resp.json()["results"]}
+
+    def test_tags_match_exactly(self):
+        self.assertEqual(self._ids("tags=react"), {self.web.pk})
+        self.assertEqual(self._ids("tags=react-native"), {self.mobile.pk})
+        self.assertEqual(self._ids("tags=reac"), set())
+
+    def test_any_and_all(self):
+        self.assertEqual(self._ids("tags=react,python"), {self.web.pk, self.api.pk})
+        self.assertEqual(self._ids("tags=react,typescript&tags_match=all"), {self.web.pk})
+        self.assertEqual(self._ids("tags=typescript&tags_match=all"), {self.web.pk, self.mobile.pk})
+        self.assertEqual(self._ids("tags=react,python&tags_match=all"), set())
+
+    def test_tag_index_follows_updates_and_deletes(self):
+        Project.objects.filter(pk=self.api.pk).update(tags=["react"])
+        self.assertEqual(self._ids("tags=react"), {self.web.pk, self.api.pk})
+        self.web.delete()
+        self.assertEqual(self._ids("tags=react"), {self.api.pk})
+
+
+class FacetTests(TestCase):
+    URL = "/api/v1/projects/facets/?is_deleted=false"
+
+    @classmethod
+    def setUpTestData(cls):
+        Project.objects.create(title="1", owner="Alex", status="active", health="good", tags=["react"])
+        Project.objects.create(title="2", owner="Alex", status="paused", health="warning", tags=["vue"])
+        Project.objects.create(title="3", owner="Bob", status="active", health="critical", tags=["react"])
+        Project.objects.create(title="4", owner="Carol", status="active", tags=["react"], is_deleted=True)
+
+    def _facets(self, query=""):
+        resp = self.client.get(f"{self.URL}&{query}")
+        self.assertEqual(resp.status_code, 200)
+        body = resp.json()
+        return {name: {o["value"]: o["count"] for o in body[name] if o["count"]} if name != "count" else body[name]
+                for name in ("count", "status", "health", "owner", "tags")}
+
+    def test_unfiltered(self):
+        self.assertEqual(self._facets(), {
+            "count": 3,
+            "status": {"active": 2, "paused": 1},
+            "health": {"good": 1, "warning": 1, "critical": 1},
+            "owner": {"Alex": 2, "Bob": 1},
+            "tags": {"react": 2, "vue": 1},
+        })
+
+    def test_each_dimension_ignores_only_its_own_filter(self):
+        self.assertEqual(self._facets("owner=alex&status=active"), {
+            "count": 1,
+            # owner=alex left out, status=active kept: Bob is still an option
+            "owner": {"Alex": 1, "Bob": 1},
+            # status=active left out, owner=alex kept
+            "status": {"active": 1, "paused": 1},
+            "health": {"good": 1},
+            "tags": {"react": 1},
+        })
+        self.assertEqual(self._facets("tags=react&owner=alex"), {
+            "count": 1,
+            "owner": {"Alex": 1, "Bob": 1},
+            "status": {"active": 1},
+            "health": {"good": 1},
+            "tags": {"react": 1, "vue": 1},
+        })
+
+    def test_every_choice_is_listed(self):
+        body = self.client.get(f"{self.URL}&owner=nobody").json()
+        self.assertEqual([o["value"] for o in body["status"]], [c[0] for c in Project.STATUS_CHOICES])
+        self.assertEqual({o["count"] for o in body["health"]}, {0})
+        self.assertEqual(body["count"], 0)
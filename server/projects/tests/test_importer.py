@@ -0,0 +1,38 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from django.test import SimpleTestCase
+
+from projects.importer import HEALTHS, STATUSES, clean_row, validate_batch
+from projects.models import Project
+
+
+class CleanRowTests(SimpleTestCase):
+    def test_non_string_fields_are_row_errors(self):
+        for field, value in (("title", 123), ("owner", ["o"]), ("description", {}),
+                             ("status", 1), ("health", True)):
+            row = {"title": "t", "owner": "o", field: value}
+            with self.subTest(field=field), self.assertRaisesMessage(ValueError, f"{field} must be a string"):
+                clean_row(row)
+
+    def test_batch_skips_bad_rows_and_keeps_going(self):
+        valid, errors = validate_batch([
+            (1, '{"title": 123, "owner": "o"}'),
+            (2, '{"title": "t", "owner": "o", "progress": [1]}'),
+            (3, '{"title": "t", "owner": "o", "tags": "a, b"}'),
+        ])
+        self.assertEqual([line for line, _ in errors], [1, 2])
+        self.assertEqual(valid[0]["tags"], ["a", "b"])
+        self.assertEqual((valid[0]["status"], valid[0]["health"]), (Project.STATUS_ACTIVE, Project.HEALTH_GOOD))
+
+    def test_choices_match_the_model(self):
+        self.assertEqual(STATUSES, {c[0] for c in Project.STATUS_CHOICES})
+        self.assertEqual(HEALTHS, {c[0] for c in Project.HEALTH_CHOICES})
+
+    def test_validates_in_spawned_workers(self):
+        # spawn (macOS, Windows) and forkserver (the default from Python 3.14)
+        # start workers without Django set up
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+            valid, errors = pool.submit(validate_batch, [(1, '{"title": "t", "owner": "o"}')]).result(timeout=60)
+        self.assertEqual((len(valid), errors), (1, []))
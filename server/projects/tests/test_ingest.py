@@ -0,0 +1,81 @@
+import json
+import sqlite3
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from projects import ingest
+from projects.models import Project
+
+URL = "/api/v1/projects/ingest/"
+
+
+class BufferTests(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(title="t", owner="o", progress=10)
+        self.buffer = ingest._Buffer()
+        self.buffer._ensure_thread = lambda: None  # flushed by hand
+
+    def test_latest_sample_wins(self):
+        self.buffer.add([(self.project.pk, {"progress": 20}), (self.project.pk, {"health": "warning"})])
+        self.buffer.add([(self.project.pk, {"progress": 30})])
+        self.assertEqual(self.buffer.flush(), 1)
+        self.project.refresh_from_db()
+        self.assertEqual((self.project.progress, self.project.health, self.project.version), (30, "warning", 2))
+
+    def test_no_op_sample_is_skipped(self):
+        self.buffer.add([(self.project.pk, {"progress": 10, "health": "good"})])
+        self.assertEqual(self.buffer.flush(), 0)
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.version, 1)
+
+    def test_failed_flush_puts_samples_back(self):
+        self.buffer.add([(self.project.pk, {"progress": 20, "health": "warning"})])
+        with mock.patch.object(ingest, "apply", side_effect=RuntimeError("locked")):
+            with self.assertRaises(RuntimeError):
+                self.buffer.flush()
+        self.buffer.add([(self.project.pk, {"progress": 40})])  # newer than the failed one
+        self.assertEqual(self.buffer.stats()["failed_flushes_total"], 1)
+        self.assertEqual(self.buffer.flush(), 1)
+        self.project.refresh_from_db()
+        self.assertEqual((self.project.progress, self.project.health), (40, "warning"))
+
+    def test_more_ids_than_sqlite_binds(self):
+        # the stock limit; some distributions build SQLite with a higher one
+        connection.ensure_connection()
+        limit = connection.connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 32766)
+        self.addCleanup(connection.connection.setlimit, sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, limit)
+        self.buffer.add([(pk, {"progress": 50}) for pk in range(10**6, 10**6 + 40000)])
+        self.buffer.add([(self.project.pk, {"progress": 50})])
+        self.assertEqual(self.buffer.flush(), 1)
+        self.assertEqual(self.buffer.stats()["buffered"], 0)
+
+
+@override_settings(INGEST_FLUSH_INTERVAL_SECS=0)  # written through before the answer
+class IngestViewTests(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(title="t", owner="o")
+
+    def _post(self, body, **headers):
+        return self.client.post(URL, json.dumps(body), content_type="application/json", **headers)
+
+    def test_accepts_and_writes(self):
+        resp = self._post({"samples": [{"id": self.project.pk, "progress": 5},
+                                       {"id": self.project.pk, "progress": 7.5},
+                                       {"id": self.project.pk, "health": "nope"}]})
+        self.assertEqual(resp.status_code, 202)
+        self.assertEqual((resp.json()["accepted"], resp.json()["rejected"]), (2, 1))
+        self.project.refresh_from_db()
+        self.assertEqual((self.project.progress, self.project.version), (7.5, 2))
+
+    def test_rejects_bad_bodies(self):
+        self.assertEqual(self._post({"samples": []}).status_code, 400)
+        self.assertEqual(self._post({"samples": [{"id": "x", "progress": 1}]}).status_code, 400)
+        self.assertEqual(self._post({"samples": [{"id": 1, "progress": 101}]}).status_code, 400)
+
+    @override_settings(INGEST_TOKEN="s3cret")
+    def test_token(self):
+        body = {"samples": [{"id": self.project.pk, "progress": 1}]}
+        self.assertEqual(self._post(body).status_code, 401)
+        self.assertEqual(self._post(body, HTTP_AUTHORIZATION="Bearer s3cret").status_code, 202)
@@ -0,0 +1,64 @@
+import multiprocessing
+import os
+import tempfile
+
+from django.test import SimpleTestCase
+
+WORKERS = 3
+
+
+def _worker(path, index, ready, go, results):
+    """One 'gunicorn worker': serve index + 1 requests, flush, and answer the scrape if it is worker 0."""
+    os.environ.update(METRICS_BACKEND="sqlite", METRICS_SQLITE_PATH=path)
+    import django
+
+    django.setup()
+    from projects import metrics
+
+    for _ in range(index + 1):
+        metrics.record("list", metrics.RequestStats(), 0.02)
+    metrics.get_store().flush(*metrics._collect())
+    ready.put(index)
+    if index == 0:
+        go.wait(30)
+        results.put(metrics.render())
+
+
+class SQLiteMetricsStoreTests(SimpleTestCase):
+    def test_scrape_reports_every_worker(self):
+        ctx = multiprocessing.get_context("spawn")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "metrics.sqlite3")
+            ready, results, go = ctx.Queue(), ctx.Queue(), ctx.Event()
+            procs = [ctx.Process(target=_worker, args=(path, i, ready, go, results)) for i in range(WORKERS)]
+            for proc in procs:
+                proc.start()
+            try:
+                for _ in procs:
+                    ready.get(timeout=60)
+                go.set()
+                text = results.get(timeout=30)
+            finally:
+                for proc in procs:
+                    proc.join(10)
+                    if proc.is_alive():
+                        proc.kill()
+
+        requests = sum(range(1, WORKERS + 1))
+        self.assertIn(f'projects_request_duration_seconds_count{{action="list"}} {requests}\n', text)
+        self.assertIn(f'projects_request_duration_seconds_bucket{{action="list",le="0.025"}} {requests}\n', text)
+        self.assertIn(f'projects_request_duration_seconds_bucket{{action="list",le="0.01"}} 0\n', text)
+        self.assertIn('projects_sse_subscribers{kind="sync"} 0\n', text)
+
+    def test_increments_are_added_once(self):
+        from projects.metrics import SQLiteMetricsStore
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "metrics.sqlite3")
+            first, second = SQLiteMetricsStore(path, 5), SQLiteMetricsStore(path, 5)
+            first.flush({"c\t": 2}, {"g\t": 1})
+            first.flush({"c\t": 5}, {"g\t": 4})  # 3 more, gauge replaced
+            second.flush({"c\t": 1}, {"g\t": 2})
+            totals, gauges = first.read()
+        self.assertEqual(totals, {"c\t": 6})
+        self.assertEqual(sorted(g["g\t"] for g in gauges), [2, 4])
@@ -0,0 +1,41 @@
+import io
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase
+
+from projects.management.commands import check_query_plans
+from projects.management.commands.check_query_plans import plan_problems
+from projects.models import Project
+
+
+class QueryPlanTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # more rows than a page, so cursor endpoints fetch a second one
+        for i in range(40):
+            Project.objects.create(title=f"Dashboard {i}", owner=f"owner{i % 7}", tags=["react"],
+                                   status=("active", "paused")[i % 2], progress=i % 10 * 10,
+                                   is_deleted=i % 5 == 0)
+
+    def test_hot_endpoints_use_indexed_plans(self):
+        out = io.StringIO()
+        call_command("check_query_plans", stdout=out)
+        self.assertIn(f"{len(check_query_plans.ENDPOINTS)} endpoints use indexed plans", out.getvalue())
+
+    def test_unindexed_ordering_fails_the_check(self):
+        endpoints = [("/api/v1/projects/?is_deleted=false&ordering=-version", ())]
+        with mock.patch.object(check_query_plans, "ENDPOINTS", endpoints), \
+                self.assertRaisesMessage(CommandError, "regressed to a full scan or temp sort"):
+            call_command("check_query_plans", stdout=io.StringIO(), stderr=io.StringIO())
+
+    def test_unindexed_scans_are_flagged_under_any_name(self):
+        with connection.cursor() as cur:
+            self.assertEqual(plan_problems(cur, 'SELECT id FROM "projects_project" WHERE description = %s' % "'x'"),
+                             ["SCAN projects_project"])
+            self.assertEqual(plan_problems(
+                cur, 'SELECT name FROM projects_projecttag WHERE project_id IN '
+                     '(SELECT U0."id" FROM "projects_project" U0 WHERE U0."description" = \'x\')'), ["SCAN U0"])
+            self.assertEqual(plan_problems(cur, 'SELECT id FROM "projects_project" ORDER BY last_updated, id'), [])
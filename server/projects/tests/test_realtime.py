@@ -0,0 +1,54 @@
+import json
+import multiprocessing
+import os
+import queue
+import tempfile
+
+from django.test import SimpleTestCase
+
+WORKERS = 4
+
+
+def _worker(path, index, ready, go, results):
+    """One 'gunicorn worker': subscribe, and publish if it is worker 0."""
+    os.environ.update(REALTIME_BACKEND="sqlite", REALTIME_SQLITE_PATH=path)
+    import django
+
+    django.setup()
+    from projects import realtime
+
+    subscription = realtime.subscribe()
+    ready.put(index)
+    if index == 0:
+        go.wait(30)
+        realtime.publish({"type": "ping", "from": index})
+    try:
+        _event_id, data = subscription.get(timeout=10)
+        results.put((index, json.loads(data)))
+    except queue.Empty:
+        results.put((index, None))
+
+
+class SQLiteLogBackendTests(SimpleTestCase):
+    """The sqlite backend carries an event published in one process to every other one."""
+
+    def test_publish_reaches_every_worker(self):
+        ctx = multiprocessing.get_context("spawn")  # fresh interpreters, nothing shared
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "realtime.sqlite3")
+            ready, results, go = ctx.Queue(), ctx.Queue(), ctx.Event()
+            procs = [ctx.Process(target=_worker, args=(path, i, ready, go, results)) for i in range(WORKERS)]
+            for proc in procs:
+                proc.start()
+            try:
+                for _ in procs:
+                    ready.get(timeout=60)
+                go.set()
+                received = dict(results.get(timeout=30) for _ in procs)
+            finally:
+                for proc in procs:
+                    proc.join(10)
+                    if proc.is_alive():
+                        proc.kill()
+
+        self.assertEqual(received, {i: {"type": "ping", "from": 0} for i in range(WORKERS)})
@@ -0,0 +1,74 @@
+import json
+import time
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from projects import routing, vocab
+from projects.models import Project
+
+LIST = "/api/v1/projects/"
+
+
+@override_settings(DATABASE_READ_ALIAS="replica", READ_AFTER_WRITE_SECS=5)
+class ReadReplicaTests(TestCase):
+    """Which alias each read is routed to; the queries themselves still run on the test database."""
+
+    def setUp(self):
+        self.project = Project.objects.create(title="t", owner="o")
+        self.reads = []
+
+        def db_for_read(router, model, **hints):
+            self.reads.append(routing.read_alias())
+            return routing.PRIMARY
+
+        patch = mock.patch.object(routing.ReadReplicaRouter, "db_for_read", db_for_read)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def _reads(self, method, url, **kwargs):
+        self.reads.clear()
+        resp = getattr(self.client, method)(url, **kwargs)
+        self.assertEqual(routing.read_alias(), routing.PRIMARY, "read alias leaked out of the request")
+        return resp, set(self.reads)
+
+    def test_safe_requests_read_from_the_replica(self):
+        resp, reads = self._reads("get", LIST)
+        self.assertEqual((resp.status_code, reads), (200, {"replica"}))
+        resp, reads = self._reads("get", f"{LIST}{self.project.pk}/")
+        self.assertEqual((resp.status_code, reads), (200, {"replica"}))
+
+    def test_writes_use_the_primary_and_make_the_client_sticky(self):
+        resp, reads = self._reads("patch", f"{LIST}{self.project.pk}/", data=json.dumps({"progress": 5}),
+                                  content_type="application/json")
+        self.assertEqual((resp.status_code, reads), (200, {"default"}))
+        self.assertGreater(float(resp.cookies[routing.STICKY_COOKIE].value), time.time())
+        self.assertEqual(routing.ReadReplicaRouter().db_for_write(Project), routing.PRIMARY)
+
+        _resp, reads = self._reads("get", f"{LIST}{self.project.pk}/")
+        self.assertEqual(reads, {"default"})
+        self.client.cookies[routing.STICKY_COOKIE] = str(time.time() - 1)
+        _resp, reads = self._reads("get", f"{LIST}{self.project.pk}/")
+        self.assertEqual(reads, {"replica"})
+
+    def test_failed_write_is_not_sticky(self):
+        resp, reads = self._reads("patch", f"{LIST}{self.project.pk}/", data=json.dumps({"progress": "x"}),
+                                  content_type="application/json")
+        self.assertEqual((resp.status_code, reads), (400, {"default"}))
+        self.assertNotIn(routing.STICKY_COOKIE, resp.cookies)
+
+    def test_alias_is_reset_after_errors(self):
+        resp, reads = self._reads("get", f"{LIST}0/")
+        self.assertEqual((resp.status_code, reads), (404, {"replica"}))
+        resp, _reads = self._reads("get", f"{LIST}?pagination=cursor&cursor=zzz")
+        self.assertEqual(resp.status_code, 400)
+
+    def test_vocabularies_read_from_the_primary(self):
+        vocab._cache.clear()
+        _resp, reads = self._reads("get", f"{LIST}filters/owners/")
+        self.assertEqual(reads, {"default"})
+
+    @override_settings(DATABASE_READ_ALIAS=None)
+    def test_no_replica_configured(self):
+        _resp, reads = self._reads("get", LIST)
+        self.assertEqual(reads, {"default"})
@@ -0,0 +1,74 @@
+import datetime
+import json
+
+from django.test import TestCase, override_settings
+from rest_framework.renderers import JSONRenderer
+
+from projects.export import EXPORT_FIELDS, ndjson_lines
+from projects.models import Project
+from projects.rows import PROJECT_FIELDS, instance_dict, to_dicts
+from projects.serializers import ProjectSerializer
+
+AWKWARD = [
+    dict(title="Ünïcødé ✓ 项目", description="line\u2028sep\u2029para \"quoted\" \\ back\x00", owner="Zoë",
+         tags=[], progress=33.333333333333336),
+    dict(title="Emoji 🚀", description="x" * 20000, owner="O'Brien", tags=["a,b", "ä"], progress=0.1),
+    dict(title="Zero", description="", owner="n", tags=["t"] * 3, progress=0.0, is_deleted=True),
+    dict(title="Tiny", owner="<script>", tags=["</script>"], progress=1e-07, status="paused"),
+]
+# a whole second, microseconds, and a DST edge in Europe/Athens
+TIMESTAMPS = [
+    datetime.datetime(2024, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc),
+    datetime.datetime(2024, 6, 30, 23, 59, 59, 123456, tzinfo=datetime.timezone.utc),
+    datetime.datetime(2024, 10, 27, 0, 30, 0, 1, tzinfo=datetime.timezone.utc),
+    datetime.datetime(1999, 12, 31, 23, 0, 0, 500000, tzinfo=datetime.timezone.utc),
+]
+
+
+class RowPathTests(TestCase):
+    """The values_list() read path renders exactly the bytes ProjectSerializer does."""
+
+    @classmethod
+    def setUpTestData(cls):
+        for fields, stamp in zip(AWKWARD, TIMESTAMPS):
+            project = Project.objects.create(**fields)
+            Project.objects.filter(pk=project.pk).update(last_updated=stamp)
+
+    def setUp(self):
+        self.renderer = JSONRenderer()
+        self.qs = Project.objects.order_by("-last_updated", "-id")
+
+    def assertSameBytes(self):
+        old = self.renderer.render(ProjectSerializer(self.qs, many=True).data)
+        new = self.renderer.render(to_dicts(self.qs.values_list(*PROJECT_FIELDS)))
+        self.assertEqual(old, new)
+        for obj in self.qs:
+            self.assertEqual(instance_dict(obj), ProjectSerializer(obj).data)
+
+    def test_identical_bytes_in_utc(self):
+        self.assertSameBytes()
+
+    @override_settings(TIME_ZONE="Europe/Athens")
+    def test_identical_bytes_in_local_time(self):
+        self.assertSameBytes()
+
+    def test_sparse_fields(self):
+        output = ("title", "last_updated")
+        old = self.renderer.render(ProjectSerializer(self.qs, many=True, fields=output).data)
+        new = self.renderer.render(to_dicts(self.qs.values_list("id", *output), ("id", *output), output))
+        self.assertEqual(old, new)
+
+    def test_list_endpoint_matches_serializer(self):
+        for url in ("/api/v1/projects/?limit=200", "/api/v1/projects/deleted/?limit=200"):
+            body = self.client.get(url).content
+            payload = json.loads(body)
+            ids = [r["id"] for r in payload["results"]]
+            objs = sorted(Project.objects.filter(id__in=ids), key=lambda p: ids.index(p.id))
+            payload["results"] = ProjectSerializer(objs, many=True).data
+            self.assertEqual(self.renderer.render(payload), body, url)
+
+    def test_export_lines_match_serializer(self):
+        lines = list(ndjson_lines(self.qs.values_list(*EXPORT_FIELDS)))
+        self.assertEqual(len(lines), len(AWKWARD))
+        for obj, line in zip(self.qs, lines):
+            self.assertEqual(self.renderer.render(ProjectSerializer(obj).data) + b"\n", line.encode())
@@ -0,0 +1,54 @@
+import datetime
+from unittest import mock
+
+from django.test import TestCase
+
+from projects import search
+from projects.models import Project
+
+URL = "/api/v1/projects/?is_deleted=false&q="
+
+
+class SearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.dashboard = Project.objects.create(title="Dashboard rewrite", owner="alex")
+        cls.mobile = Project.objects.create(title="App", owner="bob", tags=["react-native", "ios"])
+        cls.billing = Project.objects.create(title="Billing", owner="carol", description="Stripe and invoices")
+
+    def _ids(self, q):
+        resp = self.client.get(URL + q)
+        self.assertEqual(resp.status_code, 200, q)
+        return [r["id"] for r in resp.json()["results"]]
+
+    def test_words_match_as_prefixes(self):
+        self.assertTrue(search.fts_available())
+        self.assertEqual(self._ids("dash"), [self.dashboard.pk])
+        self.assertEqual(self._ids("dash%20rew"), [self.dashboard.pk])
+        self.assertEqual(self._ids("dash%20billing"), [])
+
+    def test_matches_tags_and_description(self):
+        self.assertEqual(self._ids("native"), [self.mobile.pk])
+        self.assertEqual(self._ids("ios"), [self.mobile.pk])
+        self.assertEqual(self._ids("invoice"), [self.billing.pk])
+
+    def test_fts_syntax_is_matched_as_words(self):
+        self.assertEqual(self._ids("stripe%20AND"), [self.billing.pk])
+        for q in ("NEAR(", "%22", "c%2B%2B", "*", "billing%20OR%20app", "-app", "title:app", "(^app)"):
+            with self.subTest(q=q):
+                self._ids(q)
+        self.assertEqual(self._ids("billing%20OR%20app"), [])
+
+    def test_equal_ranks_have_a_stable_order(self):
+        stamp = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+        twins = [Project.objects.create(title="Twin", owner="o").pk for _ in range(5)]
+        Project.objects.filter(pk__in=twins).update(last_updated=stamp)
+        self.assertEqual(self._ids("twin"), sorted(twins, reverse=True))
+        pages = [self.client.get(f"{URL}twin&limit=2&offset={o}").json()["results"] for o in (0, 2, 4)]
+        self.assertEqual([r["id"] for page in pages for r in page], sorted(twins, reverse=True))
+
+    def test_like_fallback_without_fts(self):
+        with mock.patch.object(search, "_fts_available", False):
+            self.assertEqual(self._ids("hboard"), [self.dashboard.pk])
+            self.assertEqual(self._ids("react-nat"), [self.mobile.pk])
+            self.assertEqual(self._ids("NEAR("), [])
@@ -0,0 +1,45 @@
+from django.test import TestCase
+
+from projects.models import Project
+from projects.rows import PROJECT_FIELDS
+
+LIST = "/api/v1/projects/?is_deleted=false"
+
+
+class SparseFieldsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.projects = [Project.objects.create(title=f"p{i}", owner="o", progress=i * 10) for i in range(4)]
+        cls.detail = f"/api/v1/projects/{cls.projects[0].pk}/"
+
+    def test_list(self):
+        results = self.client.get(f"{LIST}&fields=owner,title").json()["results"]
+        self.assertEqual(len(results), 4)
+        # serializer order, not the order asked for
+        self.assertEqual([list(r) for r in results], [["title", "owner"]] * 4)
+
+        results = self.client.get(f"{LIST}&exclude=description,tags").json()["results"]
+        self.assertEqual(list(results[0]), [f for f in PROJECT_FIELDS if f not in ("description", "tags")])
+
+        results = self.client.get(f"{LIST}&fields=title,owner&exclude=owner").json()["results"]
+        self.assertEqual(list(results[0]), ["title"])
+
+    def test_cursor_pages_without_the_ordering_field(self):
+        url = f"{LIST}&pagination=cursor&limit=2&ordering=progress&fields=title"
+        first = self.client.get(url).json()
+        second = self.client.get(f"{url}&cursor={first['next_cursor']}").json()
+        self.assertEqual(first["results"] + second["results"],
+                         [{"title": p.title} for p in self.projects])
+
+    def test_retrieve(self):
+        resp = self.client.get(f"{self.detail}?fields=title,version")
+        self.assertEqual(resp.json(), {"title": "p0", "version": 1})
+        self.assertEqual(resp["ETag"], 'W/"1"')
+        self.assertIn("Last-Modified", resp)
+        self.assertNotIn("description", self.client.get(f"{self.detail}?exclude=description").json())
+
+    def test_unknown_or_empty_field_sets_are_a_400(self):
+        for query in ("fields=title,secret", "exclude=nope", "fields=title&exclude=title", "fields=,"):
+            for url in (f"{LIST}&{query}", f"{self.detail}?{query}"):
+                with self.subTest(url=url):
+                    self.assertEqual(self.client.get(url).status_code, 400)
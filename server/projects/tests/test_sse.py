@@ -0,0 +1,75 @@
+import json
+
+from django.test import RequestFactory, SimpleTestCase
+
+from projects import realtime, views_sse
+
+
+class ReplayTests(SimpleTestCase):
+    """Reconnecting with Last-Event-ID replays what was missed, or asks for a resync."""
+
+    def setUp(self):
+        self.hub = realtime._Hub(replay_events=3)
+        self.hub.reset(100)
+        for event_id in range(101, 106):
+            self.hub.deliver(event_id, json.dumps({"type": "ping", "n": event_id}))
+
+    def _drain(self, q):
+        events = []
+        while not q.empty():
+            event_id, data = q.get_nowait()
+            events.append((event_id, json.loads(data)))
+        return events
+
+    def test_replays_events_after_the_last_id(self):
+        events = self._drain(self.hub.subscribe(last_event_id=103))
+        self.assertEqual(events, [(104, {"type": "ping", "n": 104}), (105, {"type": "ping", "n": 105})])
+        self.assertEqual(self._drain(self.hub.subscribe(last_event_id=105)), [])
+        self.assertEqual(self._drain(self.hub.subscribe()), [])
+
+    def test_evicted_or_unknown_id_gets_a_resync(self):
+        # the buffer holds 103-105; 101 is gone, 200 was never seen here
+        for last_event_id in (101, 99, 200):
+            with self.subTest(last_event_id=last_event_id):
+                self.assertEqual(self._drain(self.hub.subscribe(last_event_id=last_event_id)),
+                                 [(105, {"type": "resync"})])
+        self.assertEqual(len(self._drain(self.hub.subscribe(last_event_id=102))), 3)
+
+    async def test_async_subscribers_replay_too(self):
+        sub = self.hub.subscribe_async(last_event_id=104)
+        self.assertEqual(await sub.get(), (105, json.dumps({"type": "ping", "n": 105})))
+        self.hub.unsubscribe_async(sub)
+
+
+class StreamReconnectTests(SimpleTestCase):
+    URL = "/api/v1/projects/stream/"
+
+    def _frames(self, count, **extra):
+        resp = self.client.get(self.URL, **extra)
+        try:
+            content = iter(resp.streaming_content)
+            return [next(content).decode() for _ in range(count)]
+        finally:
+            resp.close()
+
+    def test_last_event_id_header_and_query_param(self):
+        realtime.get_backend()
+        before = realtime._hub.last_id
+        realtime.publish({"type": "ping", "n": 1})
+        realtime.publish({"type": "ping", "n": 2})
+        for extra in ({"HTTP_LAST_EVENT_ID": str(before)}, {"QUERY_STRING": f"last_event_id={before}"}):
+            with self.subTest(extra=extra):
+                hello, first, second = self._frames(3, **extra)
+                self.assertIn('"hello"', hello)
+                self.assertEqual(first, f'id: {before + 1}\ndata: {{"type": "ping", "n": 1}}\n\n')
+                self.assertEqual(second, f'id: {before + 2}\ndata: {{"type": "ping", "n": 2}}\n\n')
+
+    def test_unknown_last_event_id_resyncs(self):
+        realtime.publish({"type": "ping"})
+        _hello, resync = self._frames(2, HTTP_LAST_EVENT_ID="1")
+        self.assertEqual(resync, f'id: {realtime._hub.last_id}\ndata: {{"type": "resync"}}\n\n')
+
+    def test_bad_last_event_id_is_ignored(self):
+        request = RequestFactory().get(self.URL, {"last_event_id": "abc"}, HTTP_LAST_EVENT_ID="12")
+        self.assertEqual(views_sse._last_event_id(request), 12)
+        self.assertIsNone(views_sse._last_event_id(RequestFactory().get(self.URL, {"last_event_id": "abc"})))
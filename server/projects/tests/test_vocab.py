@@ -0,0 +1,53 @@
+import tempfile
+import threading
+from pathlib import Path
+from unittest import mock
+
+from django.test import TestCase
+
+from projects import vocab
+from projects.models import Project
+
+
+class VocabularyETagTests(TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.generation = vocab.Generation(Path(tmp.name) / "vocab.generation")
+        patch = mock.patch.object(vocab, "generation", self.generation)
+        patch.start()
+        self.addCleanup(patch.stop)
+        Project.objects.create(title="t", owner="alex", tags=["react"])
+
+    def test_write_changes_the_etag(self):
+        for url, fields, new in (("/api/v1/projects/filters/owners/", {"owner": "bob"}, "bob"),
+                                 ("/api/v1/projects/filters/tags/", {"owner": "o", "tags": ["vue"]}, "vue")):
+            with self.subTest(url=url):
+                etag = self.client.get(url)["ETag"]
+                self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+                with self.captureOnCommitCallbacks(execute=True):
+                    Project.objects.create(title="new", **fields)
+                resp = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(resp.status_code, 200)
+                self.assertNotEqual(resp["ETag"], etag)
+                self.assertIn(new, resp.json())
+
+    def test_readers_never_see_a_half_written_file(self):
+        seen, done = [], threading.Event()
+
+        def read():
+            while not done.is_set():
+                seen.append(self.generation.current())
+
+        self.generation.bump()
+        reader = threading.Thread(target=read)
+        reader.start()
+        try:
+            for _ in range(300):
+                self.generation.bump()
+        finally:
+            done.set()
+            reader.join()
+        self.assertEqual(seen.count(0), 0)
+        self.assertEqual(seen, sorted(seen))
+        self.assertEqual(self.generation.current(), 301)
@@ -1,13 +1,18 @@
+from django.conf import settings
 from django.urls import path
 from rest_framework.routers import DefaultRouter
 from .views import ProjectViewSet
-from .views_sse import project_stream
+from .views_sse import project_stream, project_stream_async
 from .views_csrf import csrf
+from .views_ingest import ingest
+from .views_metrics import metrics
 
 router = DefaultRouter()
 router.register(r'projects', ProjectViewSet, basename='project')
 
 urlpatterns = [
     path("csrf/", csrf),
-    path("projects/stream/", project_stream),
+    path("metrics", metrics),
+    path("projects/ingest/", ingest),
+    path("projects/stream/", project_stream_async if settings.SSE_ASYNC else project_stream),
 ] + router.urls
@@ -1,16 +1,36 @@
-from django.db import transaction
-from django.db.models import Q
+import hashlib
+import json
+from contextlib import nullcontext
+
+from django.core.handlers.asgi import ASGIRequest
+from django.db import DatabaseError, connection, transaction
+from django.db.models import BooleanField, Case, Count, F, Func, JSONField, Max, Value, When
+from django.db.models.expressions import RawSQL
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.parsers import JSONParser
 from rest_framework.permissions import AllowAny
-from rest_framework.exceptions import NotFound, ParseError
+from rest_framework.exceptions import NotFound, ParseError, ValidationError
 from django.utils.http import parse_etags
 
-from .models import Project
+from .models import Project, ProjectTag, ProjectTombstone
 from .serializers import ProjectSerializer
-from .pagination import LimitOffsetPaginationWithCount
+from .pagination import DEFAULT_ORDERING, KeysetPagination, LimitOffsetPaginationWithCount, with_tiebreak
+from .export import EXPORT_FIELDS, chunked, csv_lines, ndjson_lines, streamed
+from .metrics import serializing
+from .realtime import coalesce
+from .renderers import CSVRenderer, NDJSONRenderer
+from .routing import ReadReplicaMixin, primary
+from .rows import PROJECT_FIELDS, instance_dict, row_converter, to_dicts
+from .search import search
+from . import vocab
+from .signals import emit_instance_updated, emit_rows_changed
+from .sqlite import write_transaction
 
 def _base_qs():
     return Project.objects.all()
@@ -21,69 +41,404 @@ def _status_choices():
 def _health_choices():
     return [c[0] for c in Project._meta.get_field("health").choices]
 
+def _split_tags(raw):
+    return [t.strip() for t in raw.split(',') if t.strip()]
+
+def _filter_tags(qs, raw, mode=None):
+    """
+    Exact tag match through the ProjectTag index. `tags=a,b` matches projects
+    with any of the tags; `tags_match=all` requires every one of them.
+    """
+    names = _split_tags(raw)
+    if not names:
+        return qs
+    if mode == 'all':
+        for name in names:
+            qs = qs.filter(id__in=ProjectTag.objects.filter(name=name).values('project_id'))
+        return qs
+    return qs.filter(id__in=ProjectTag.objects.filter(name__in=names).values('project_id'))
+
+def filter_projects(qs, params, exclude=(), rank=False):
+    """
+    Apply the list filters and q/search from params to qs. Names in exclude
+    are ignored, which facets use to count a dimension without its own filter.
+    """
+    def param(name):
+        return None if name in exclude else params.get(name)
+
+    status_val = param('status')
+    owner = param('owner')
+    tags = param('tags')
+    health = param('health')
+    min_health = param('health_min')
+    is_deleted_val = param('is_deleted')
+    q = param('q') or param('search')
+
+    if status_val:
+        qs = qs.filter(status=status_val)
+    if owner:
+        qs = qs.filter(owner__icontains=owner)
+    if health:
+        qs = qs.filter(health=health)
+    if tags:
+        qs = _filter_tags(qs, tags, params.get('tags_match'))
+    if is_deleted_val:
+        if is_deleted_val == 'true':
+            qs = qs.filter(is_deleted=True)
+        else:
+            qs = qs.filter(is_deleted=False)
+    if min_health:
+        try:
+            mh = float(min_health)
+            qs = qs.filter(progress__gte=mh)
+        except (TypeError, ValueError):
+            pass
+    if q:
+        qs = search(qs, q, rank=rank)
+    return qs
+
+def _if_match_versions(request):
+    """Versions named by If-Match, or None when the header is absent."""
+    if_match = request.headers.get('If-Match')
+    if not if_match:
+        return None
+    versions = set()
+    for token in parse_etags(if_match):
+        token_clean = token.replace('W/', '').strip().strip('"')
+        try:
+            versions.add(int(token_clean))
+        except ValueError:
+            continue
+    return versions
+
+def _conflict(current_version):
+    return Response({
+        'detail': 'ETag mismatch. Resource has been modified.',
+        'current_version': current_version
+    }, status=status.HTTP_409_CONFLICT)
+
+def _vocabulary_response(request, name, compute):
+    """
+    Cached vocabulary with a strong ETag from the shared generation; a
+    matching If-None-Match gets a 304 without touching the database.
+    """
+    gen = vocab.generation.current()
+    etag = f'"{name}-{gen}"'
+    if etag in parse_etags(request.headers.get('If-None-Match', '')):
+        resp = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        # a lagging replica would cache old values under the new generation
+        with primary():
+            resp = Response(vocab.cached(name, gen, compute))
+    resp['ETag'] = etag
+    resp['Cache-Control'] = 'no-cache'  # always revalidate, usually a 304
+    return resp
+
+def _sparse_fields(params):
+    """
+    Output fields from ?fields= / ?exclude= in serializer order, or None when
+    neither is given. Unknown names are a 400.
+    """
+    include, exclude = params.get('fields'), params.get('exclude')
+    if not include and not exclude:
+        return None
+    names = set(_split_tags(include)) if include else set(PROJECT_FIELDS)
+    dropped = set(_split_tags(exclude or ''))
+    unknown = (names | dropped) - set(PROJECT_FIELDS)
+    if unknown:
+        raise ParseError(f"Unknown field(s): {', '.join(sorted(unknown))}.")
+    output = tuple(f for f in PROJECT_FIELDS if f in names and f not in dropped)
+    if not output:
+        raise ParseError("`fields`/`exclude` leave no fields to return.")
+    return output
+
+def _not_modified(request, etag, last_modified):
+    """304 (or 412) response when the request's validators still match, else None."""
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    resp = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if resp is not None:
+        _set_validators(resp, etag, last_modified)
+    return resp
+
+def _set_validators(resp, etag, last_modified):
+    resp['ETag'] = etag
+    if last_modified:
+        resp['Last-Modified'] = http_date(last_modified.timestamp())
+    resp['Cache-Control'] = 'private, no-cache'
+    return resp
+
+def _collection_validator(request, qs):
+    """
+    Weak ETag for a filtered collection: newest last_updated and row count,
+    hashed with the path and query string. Two queries in one snapshot:
+    MAX is a seek on a (…, last_updated) index and COUNT scans the narrowest
+    one, while a combined aggregate makes SQLite walk a non-covering index
+    and fetch every row for last_updated.
+    Any write stamps last_updated, so edits inside the set move the max and
+    rows leaving it move the count; edits elsewhere leave it unchanged.
+    No Last-Modified: the newest row left in the set does not change when
+    an older row leaves it, so If-Modified-Since would answer a wrong 304.
+    """
+    qs = qs.order_by()
+    with transaction.atomic(using=qs.db):
+        latest = qs.aggregate(latest=Max('last_updated'))['latest']
+        count = qs.count()
+    query = sorted(request.query_params.lists())
+    digest = hashlib.sha1(
+        f"{request.path}|{query}|{latest.isoformat() if latest else ''}|{count}".encode()
+    ).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+def _cas_update(instance, changes):
+    """
+    Compare-and-swap: write only the changed columns, and only if the row
+    still has instance.version; on success instance is updated in memory (no
+    re-read) and the event is emitted. Returns None, or the row's current
+    version on a conflict.
+    """
+    now = timezone.now()
+    swapped = Project.objects.filter(pk=instance.pk, version=instance.version).update(
+        **changes, version=F('version') + 1, last_updated=now,
+    )
+    if not swapped:
+        return Project.objects.filter(pk=instance.pk).values_list('version', flat=True).first()
+    for k, v in changes.items():
+        setattr(instance, k, v)
+    instance.version += 1
+    instance.last_updated = now
+    emit_instance_updated(instance, list(changes))
+    return None
+
+# unconditional PATCHes swap again this often before giving up with a 409
+PATCH_RETRIES = 5
+
+# ---------------- batch ---------------------------------------------------
+BATCH_MAX_OPERATIONS = 1000
+BATCH_OPS = ('create', 'update', 'delete', 'restore')
+
+class _BatchAborted(Exception):
+    """Raised to roll back an atomic batch at its first failed item."""
+
+def _batch_targets(operations):
+    """Projects named by the non-create operations, fetched in one query."""
+    ids = set()
+    for op in operations:
+        if isinstance(op, dict) and op.get('op') != 'create':
+            try:
+                ids.add(int(op.get('id')))
+            except (TypeError, ValueError):
+                continue
+    return Project.objects.in_bulk(ids) if ids else {}
+
+def _batch_validators():
+    """
+    One serializer per kind of write, reused for every item in a batch:
+    building a ModelSerializer's fields costs more than validating a row.
+    """
+    return {'create': ProjectSerializer(), 'update': ProjectSerializer(partial=True)}
+
+def _batch_item(index, op, targets, validators):
+    """
+    Run one batch operation; returns its result with an HTTP-style status.
+    Updates, deletes and restores go through the same compare-and-swap as
+    PATCH, against the item's `version` when it gives one.
+    """
+    if not isinstance(op, dict) or op.get('op') not in BATCH_OPS:
+        return {'index': index, 'status': 400, 'errors': {'op': [f"must be one of {list(BATCH_OPS)}"]}}
+    name = op['op']
+    result = {'index': index, 'op': name}
+    data = op.get('data', {})
+    if not isinstance(data, dict):
+        return {**result, 'status': 400, 'errors': {'data': ['must be an object']}}
+
+    if name == 'create':
+        try:
+            fields = validators['create'].run_validation(data)
+        except ValidationError as exc:
+            return {**result, 'status': 400, 'errors': exc.detail}
+        instance = Project.objects.create(**fields)
+        return {**result, 'status': 201, 'id': instance.pk,
+                'etag': f'W/"{instance.version}"', 'project': instance_dict(instance)}
+
+    try:
+        pk = int(op.get('id'))
+    except (TypeError, ValueError):
+        return {**result, 'status': 400, 'errors': {'id': ['must be an integer']}}
+    result['id'] = pk
+    instance = targets.get(pk)
+    if instance is None:
+        return {**result, 'status': 404, 'errors': {'id': ['not found']}}
+    expected = op.get('version')
+    if expected is not None and (not isinstance(expected, int) or isinstance(expected, bool)):
+        return {**result, 'status': 400, 'errors': {'version': ['must be an integer']}}
+    if expected is not None and expected != instance.version:
+        return {**result, 'status': 409, 'current_version': instance.version}
+
+    if name == 'update':
+        try:
+            changes = validators['update'].run_validation(data)
+        except ValidationError as exc:
+            return {**result, 'status': 400, 'errors': exc.detail}
+    else:
+        changes = {'is_deleted': name == 'delete'}
+    current = _cas_update(instance, changes)
+    if current is not None:
+        return {**result, 'status': 409, 'current_version': current}
+    result.update(status=204 if name == 'delete' else 200, etag=f'W/"{instance.version}"')
+    if name != 'delete':
+        result['project'] = instance_dict(instance)
+    return result
+
+# ---------------- changes feed ------------------------------------------
+CHANGES_MAX_LIMIT = 1000
+CHANGE_FIELDS = PROJECT_FIELDS + ('change_seq',)
+# what a soft-deleted project looks like in the feed
+TOMBSTONE_FIELDS = ('id', 'change_seq', 'version', 'last_updated', 'is_deleted')
+
+def _int_param(params, name, default, minimum=0):
+    raw = params.get(name)
+    if raw in (None, ''):
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ParseError(f"`{name}` must be an integer.")
+    if value < minimum:
+        raise ParseError(f"`{name}` must be at least {minimum}.")
+    return value
+
+def _parse_ids(ids):
+    if not ids or not isinstance(ids, (list, tuple)):
+        raise ParseError(detail="`ids` must be a non-empty list of project IDs.")
+    try:
+        return [int(i) for i in ids]
+    except (TypeError, ValueError):
+        raise ParseError(detail="`ids` must be a non-empty list of project IDs.")
+
+def _id_in(ids):
+    """Right-hand side for id__in. On SQLite the whole set is one JSON parameter,
+    which keeps large id lists clear of the bound-variable limit."""
+    if connection.vendor == "sqlite":
+        return RawSQL("SELECT value FROM json_each(%s)", [json.dumps(ids)])
+    return ids
+
+def _lacks_tag(tag):
+    qn = connection.ops.quote_name
+    column = f"{qn(Project._meta.db_table)}.{qn(Project._meta.get_field('tags').column)}"
+    return RawSQL(
+        f"NOT EXISTS (SELECT 1 FROM json_each({column}) WHERE value = %s)",
+        [tag], output_field=BooleanField(),
+    )
+
+def _append_tag(tag):
+    return Func(F("tags"), Value("$[#]"), Value(tag), function="json_insert", output_field=JSONField())
+
+def _append_tag_in_chunks(qs, tag, bump_version, now, chunk_size=500):
+    """Portable fallback for backends without SQLite's JSON functions."""
+    changed, batch = 0, []
+    fields = ["tags", "last_updated"] + (["version"] if bump_version else [])
+    for proj in qs.only("id", "tags", "version").iterator(chunk_size=chunk_size):
+        tags = proj.tags or []
+        if tag in tags:
+            continue
+        proj.tags = tags + [tag]
+        proj.last_updated = now
+        if bump_version:
+            proj.version = (proj.version or 0) + 1
+        batch.append(proj)
+        if len(batch) >= chunk_size:
+            changed += Project.objects.bulk_update(batch, fields)
+            batch = []
+    if batch:
+        changed += Project.objects.bulk_update(batch, fields)
+    return changed
+
 # ---------------- Project ViewSet --------------------------------------
-class ProjectViewSet(viewsets.ModelViewSet):
+class ProjectViewSet(ReadReplicaMixin, viewsets.ModelViewSet):
     """
     Implements:
-     - GET /api/v1/projects  (list)
+     - GET /api/v1/projects  (list, conditional GET via ETag;
+       limit/offset pages by default, keyset pages with ?cursor=)
      - POST /api/v1/projects (create)
-     - GET /api/v1/projects/{id} (retrieve)
+     - GET /api/v1/projects/{id} (retrieve, conditional GET via ETag/Last-Modified)
+       list, retrieve and deleted accept ?fields= / ?exclude= (sparse fieldsets)
      - PATCH /api/v1/projects/{id} (partial_update) with If-Match ETag
      - DELETE /api/v1/projects/{id} (soft delete)
      - POST /api/v1/projects/bulk-update (custom action)
+     - POST /api/v1/projects/batch (mixed create/update/delete/restore, per-item versions)
+     - GET /api/v1/projects/facets (counts per status/health/owner/tag)
+     - GET /api/v1/projects/export?format=ndjson|csv (streamed, list filters apply)
+     - GET /api/v1/projects/changes?since=N (changes feed in change_seq order)
+    Safe methods read from the read replica when one is configured.
     """
     serializer_class = ProjectSerializer
     permission_classes = [AllowAny]
     parser_classes = [JSONParser]
     pagination_class = LimitOffsetPaginationWithCount
 
+    @property
+    def paginator(self):
+        # limit/offset stays the default; ?cursor= opts into keyset pages
+        if not hasattr(self, '_paginator'):
+            params = self.request.query_params
+            if 'cursor' in params or params.get('pagination') == 'cursor':
+                self._paginator = KeysetPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
     # ---------------- list (with filters/search/sort) --------------------------
     def get_queryset(self):
-        qs = _base_qs().all()
         params = self.request.query_params
+        ordering = params.get('ordering')
+        # relevance order for q unless the client asked for one (keyset
+        # pages cannot be keyed on rank)
+        rank = not ordering and not isinstance(self.paginator, KeysetPagination)
+        qs = filter_projects(_base_qs().all(), params, rank=rank)
+        if ordering:
+            qs = qs.order_by(*with_tiebreak(ordering))
+        if self.action == 'retrieve':
+            fields = _sparse_fields(params)
+            if fields:
+                # validators need version and last_updated
+                qs = qs.only(*{*fields, 'id', 'version', 'last_updated'})
+        return qs
 
-        status_val = params.get('status')
-        owner = params.get('owner')
-        tags = params.get('tags')
-        health = params.get('health')
-        min_health = params.get('health_min')
-        is_deleted_val = params.get('is_deleted')
-        q = params.get('q') or params.get('search')
-
-        if status_val:
-            qs = qs.filter(status=status_val)
-        if owner:
-            qs = qs.filter(owner__icontains=owner)
-        if health:
-            qs = qs.filter(health=health)
-        if tags:
-            qs = qs.filter(tags__icontains=tags)
-        if is_deleted_val:
-            if is_deleted_val == 'true':
-                qs = qs.filter(is_deleted=True)
-            else:
-                qs = qs.filter(is_deleted=False)
-        if min_health:
-            try:
-                mh = float(min_health)
-                qs = qs.filter(progress__gte=mh)
-            except (TypeError, ValueError):
-                pass
+    def list(self, request, *args, **kwargs):
+        qs = self.filter_queryset(self.get_queryset())
+        etag = _collection_validator(request, qs)
+        not_modified = _not_modified(request, etag, None)
+        if not_modified is not None:
+            return not_modified
+        return _set_validators(self._page_response(qs), etag, None)
 
-        if q:
-            qs = qs.filter(
-                Q(title__icontains=q) |
-                Q(description__icontains=q) |
-                Q(tags__icontains=q)
-            )
+    def _page_response(self, qs):
+        # read path without ModelSerializer: tuples -> serializer-shaped dicts,
+        # selecting only the requested fields plus what keyset pages key on
+        params = self.request.query_params
+        output = _sparse_fields(params) or PROJECT_FIELDS
+        keys = ('id',)
+        if isinstance(self.paginator, KeysetPagination):
+            keys += ((params.get('ordering') or DEFAULT_ORDERING).lstrip('-'),)
+        selected = output + tuple(k for k in keys if k in PROJECT_FIELDS and k not in output)
+        rows = qs.values_list(*selected)
+        page = self.paginate_queryset(rows)
+        with serializing():
+            data = to_dicts(page if page is not None else rows, selected, output)
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
 
-        ordering = params.get('ordering')
-        if ordering:
-            qs = qs.order_by(ordering)
+    # ---------------- retrieve (conditional GET) -----------------------------
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        etag = f'W/"{instance.version}"'
+        not_modified = _not_modified(request, etag, instance.last_updated)
+        if not_modified is not None:
+            return not_modified
+        serializer = self.get_serializer(instance, fields=_sparse_fields(request.query_params))
+        return _set_validators(Response(serializer.data), etag, instance.last_updated)
 
-        print("Ordering by:", qs)
-        return qs
-    
     # ---------------- create -------------------------------------------------
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -99,32 +454,27 @@ class ProjectViewSet(viewsets.ModelViewSet):
     def partial_update(self, request, *args, **kwargs):
         instance = self.get_object()
 
-        if_match = request.headers.get('If-Match')
-        if if_match:
-            provided = parse_etags(if_match)
-            ok = False
-            for token in provided:
-                token_clean = token.replace('W/', '').strip().strip('"')
-                try:
-                    ver = int(token_clean)
-                    if ver == instance.version:
-                        ok = True
-                        break
-                except Exception:
-                    continue
-            if not ok:
-                return Response({
-                    'detail': 'ETag mismatch. Resource has been modified.',
-                    'current_version': instance.version
-                }, status=status.HTTP_409_CONFLICT)
-
-        partial = kwargs.pop('partial', True)
-        serializer = self.get_serializer(instance, data=request.data, partial=partial)
+        expected = _if_match_versions(request)
+        if expected is not None and instance.version not in expected:
+            return _conflict(instance.version)
+
+        serializer = self.get_serializer(instance, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
-        self.perform_update(serializer)
+        changes = serializer.validated_data
+
+        current = _cas_update(instance, changes)
+        retries = PATCH_RETRIES
+        while current is not None and expected is None and retries:
+            # no If-Match: the client did not ask for a version, so a write
+            # that landed in between (e.g. an ingest flush) is not a conflict
+            # for it; swap again over the fresh row
+            instance.refresh_from_db()
+            current = _cas_update(instance, changes)
+            retries -= 1
+        if current is not None:
+            return _conflict(current)
 
-        instance.refresh_from_db()
-        resp = Response(serializer.data)
+        resp = Response(self.get_serializer(instance).data)
         resp['ETag'] = f'W/"{instance.version}"'
         return resp
 
@@ -150,8 +500,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
         }
         """
         ids = request.data.get('ids')
-        if not ids or not isinstance(ids, (list, tuple)):
-            raise ParseError(detail="`ids` must be a non-empty list of project IDs.")
+        id_list = _parse_ids(ids)
 
         status_value = request.data.get('status')
         owner_value = request.data.get('owner')
@@ -164,35 +513,46 @@ class ProjectViewSet(viewsets.ModelViewSet):
         if health_value and health_value not in _health_choices():
             raise ParseError(detail=f"`health` must be one of {_health_choices()}")
 
-        with transaction.atomic():
-            qs = Project.objects.select_for_update().filter(id__in=ids, is_deleted=False)
-            found_ids = list(qs.values_list('id', flat=True))
+        changes = {}
+        if status_value:
+            changes['status'] = status_value
+        if owner_value:
+            changes['owner'] = owner_value
+        if health_value:
+            changes['health'] = health_value
+
+        # set-based: one UPDATE over the id set, version bumped in SQL;
+        # one projects_batch event for the whole update, sent after commit
+        with coalesce(), write_transaction():
+            qs = Project.objects.select_for_update().filter(id__in=_id_in(id_list), is_deleted=False)
+            found_ids = list(qs.order_by('id').values_list('id', flat=True))
             if not found_ids:
                 raise NotFound(detail="No matching projects found for provided ids.")
 
             updated_count = 0
-            for proj in qs:
-                changed = False
-                if status_value:
-                    proj.status = status_value
-                    changed = True
-                if owner_value:
-                    proj.owner = owner_value
-                    changed = True
-                if health_value:
-                    proj.health = health_value
-                    changed = True
-                if tag_value:
-                    tags = proj.tags or []
-                    if tag_value not in tags:
-                        tags.append(tag_value)
-                        proj.tags = tags
-                        changed = True
-
-                if changed:
-                    proj.version = (proj.version or 0) + 1
-                    proj.save()
-                    updated_count += 1
+            now = timezone.now()
+            sqlite = connection.vendor == "sqlite"
+            found = Project.objects.filter(id__in=_id_in(found_ids))
+            if changes:
+                if tag_value and sqlite:
+                    changes['tags'] = Case(
+                        When(_lacks_tag(tag_value), then=_append_tag(tag_value)),
+                        default=F('tags'),
+                    )
+                updated_count = found.update(**changes, version=F('version') + 1, last_updated=now)
+                if tag_value and not sqlite:
+                    _append_tag_in_chunks(found, tag_value, False, now)
+            elif tag_value:
+                if sqlite:
+                    updated_count = found.filter(_lacks_tag(tag_value)).update(
+                        tags=_append_tag(tag_value), version=F('version') + 1, last_updated=now,
+                    )
+                else:
+                    updated_count = _append_tag_in_chunks(found, tag_value, True, now)
+
+            if updated_count:
+                fields = list(changes) + (['tags'] if tag_value else [])
+                emit_rows_changed(found.filter(last_updated=now), fields)
 
         return Response({
             "updated_count": updated_count,
@@ -200,23 +560,174 @@ class ProjectViewSet(viewsets.ModelViewSet):
             "found_ids": found_ids
         }, status=status.HTTP_200_OK)
 
+    # ---------------- batch ---------------------------------------------------
+
+    @action(detail=False, methods=['post'], url_path='batch')
+    def batch(self, request):
+        """
+        Payload:
+        {
+          "atomic": true,            # optional; false runs each item in its own savepoint
+          "operations": [
+            {"op": "create", "data": {...}},
+            {"op": "update", "id": 1, "version": 3, "data": {...}},   # version optional
+            {"op": "delete", "id": 2, "version": 5},
+            {"op": "restore", "id": 4}
+          ]
+        }
+        Every item gets a status, and the new ETag when it succeeded. An
+        atomic batch stops at its first failure, rolls back and answers with
+        that item's status; the items before it are reported as 424 (rolled
+        back) with no id, etag or project. Otherwise the response is 200 and
+        failed items leave the rest in place. One projects_batch event is
+        sent on commit.
+        """
+        operations = request.data.get('operations')
+        if not isinstance(operations, list) or not operations:
+            raise ParseError("`operations` must be a non-empty list.")
+        if len(operations) > BATCH_MAX_OPERATIONS:
+            raise ParseError(f"At most {BATCH_MAX_OPERATIONS} operations per batch.")
+        atomic = request.data.get('atomic', True)
+        if not isinstance(atomic, bool):
+            raise ParseError("`atomic` must be a boolean.")
+
+        results = []
+        try:
+            with coalesce(), write_transaction():
+                targets = _batch_targets(operations)
+                validators = _batch_validators()
+                for index, op in enumerate(operations):
+                    try:
+                        # an atomic batch rolls back whole on failure, so it
+                        # needs no savepoint per item
+                        with nullcontext() if atomic else transaction.atomic():
+                            result = _batch_item(index, op, targets, validators)
+                    except DatabaseError as exc:
+                        result = {'index': index, 'op': op.get('op'), 'id': op.get('id'),
+                                  'status': 409, 'errors': {'detail': [str(exc)]}}
+                    results.append(result)
+                    if atomic and result['status'] >= 400:
+                        raise _BatchAborted
+        except _BatchAborted:
+            # what the earlier items did is gone, ids handed to creates included
+            failed = results[-1]
+            rolled_back = [{'index': r['index'], 'op': r['op'], 'status': 424} for r in results[:-1]]
+            return Response({'committed': False, 'results': rolled_back + [failed]}, status=failed['status'])
+        return Response({'committed': True, 'results': results}, status=status.HTTP_200_OK)
+
     # ---------------- filter endpoints (robust) ------------------------------
 
     @action(detail=False, methods=['get'], url_path='filters/owners')
-    def filter_owners(self, _):
-        owners = _base_qs().values_list('owner', flat=True)
-        return Response(sorted({o for o in owners if o}))
+    def filter_owners(self, request):
+        def owners():
+            # order_by: the default ordering's columns would join the DISTINCT
+            rows = _base_qs().filter(is_deleted=False).order_by('owner').values_list('owner', flat=True).distinct()
+            return sorted({o for o in rows if o})
+        return _vocabulary_response(request, 'owners', owners)
 
     @action(detail=False, methods=['get'], url_path='filters/tags')
-    def filter_tags(self, _):
-        all_tags = _base_qs().values_list('tags', flat=True)
-        tags_set = set()
-        for t in all_tags:
-            if isinstance(t, (list, tuple)):
-                tags_set.update([str(x).strip() for x in t if str(x).strip()])
-            elif isinstance(t, str):
-                tags_set.update([s.strip() for s in t.split(',') if s.strip()])
-        return Response(sorted(tags_set))
+    def filter_tags(self, request):
+        def tags():
+            # served from the (name, project) index
+            names = (ProjectTag.objects.filter(project__is_deleted=False)
+                     .order_by('name').values_list('name', flat=True).distinct())
+            return [n for n in names if n.strip()]
+        return _vocabulary_response(request, 'tags', tags)
+
+    @action(detail=False, methods=['get'], url_path='export',
+            renderer_classes=[NDJSONRenderer, CSVRenderer])
+    def export(self, request):
+        """
+        Every project matching the list filters, streamed as NDJSON (default)
+        or CSV (?format=csv). One SELECT over values(), read in chunks inside a
+        transaction: flat memory and a single consistent snapshot. Under ASGI
+        the chunks go out through an async iterator (export.streamed), which
+        Django streams instead of buffering.
+        """
+        qs = self.get_queryset().values_list(*EXPORT_FIELDS)
+        qs = qs.using(qs.db)  # streamed after the view returns: pin the read alias now
+        renderer = request.accepted_renderer
+        encode = csv_lines if renderer.format == 'csv' else ndjson_lines
+
+        def content():
+            with transaction.atomic(using=qs.db):
+                yield from chunked(encode(qs.iterator(chunk_size=2000)))
+
+        chunks = content()
+        if isinstance(request._request, ASGIRequest):
+            chunks = streamed(chunks)
+        resp = StreamingHttpResponse(chunks, content_type=f'{renderer.media_type}; charset=utf-8')
+        resp['Content-Disposition'] = f'attachment; filename="projects.{renderer.format}"'
+        return resp
+
+    @action(detail=False, methods=['get'], url_path='changes')
+    def changes(self, request):
+        """
+        Projects changed after ?since= (a change_seq; 0 or absent syncs
+        everything), oldest change first, at most ?limit= entries. Each
+        project appears once, at its latest change. Soft-deleted projects
+        come as tombstones (id, change_seq, version, last_updated,
+        is_deleted); hard-deleted ones as {id, change_seq, is_deleted,
+        purged}. Pass next_since back as since until has_more is false.
+        """
+        params = request.query_params
+        since = _int_param(params, 'since', 0)
+        limit = min(_int_param(params, 'limit', 200, minimum=1), CHANGES_MAX_LIMIT)
+
+        rows = Project.objects.filter(change_seq__gt=since).order_by('change_seq')
+        purged = ProjectTombstone.objects.filter(change_seq__gt=since).order_by('change_seq')
+        # both reads from one snapshot, or a write between them could be skipped
+        with transaction.atomic(using=rows.db):
+            rows = list(rows.values_list(*CHANGE_FIELDS)[:limit + 1])
+            purged = list(purged.values_list('project_id', 'change_seq')[:limit + 1])
+
+        live, dead = row_converter(CHANGE_FIELDS), row_converter(CHANGE_FIELDS, TOMBSTONE_FIELDS)
+        seq, deleted = CHANGE_FIELDS.index('change_seq'), CHANGE_FIELDS.index('is_deleted')
+        with serializing():
+            entries = [(row[seq], dead(row) if row[deleted] else live(row)) for row in rows]
+            entries += [(change_seq, {'id': pk, 'change_seq': change_seq, 'is_deleted': True, 'purged': True})
+                        for pk, change_seq in purged]
+        entries.sort(key=lambda entry: entry[0])
+        page = entries[:limit]
+        return Response({
+            'since': since,
+            'next_since': page[-1][0] if page else since,
+            'has_more': len(entries) > limit,
+            'results': [entry for _, entry in page],
+        })
+
+    @action(detail=False, methods=['get'], url_path='facets')
+    def facets(self, request):
+        """
+        Counts per status, health, owner and tag for the projects matching the
+        list filters, in one round-trip. Each dimension is counted with every
+        filter except its own, so the options stay selectable.
+        """
+        params = request.query_params
+
+        def grouped(field, exclude):
+            qs = filter_projects(_base_qs(), params, exclude=(exclude,)).order_by()
+            return dict(qs.values_list(field).annotate(n=Count('id')))
+
+        def choice_counts(field, choices):
+            counts = grouped(field, field)
+            return [{'value': c, 'count': counts.get(c, 0)} for c in choices]
+
+        owners = grouped('owner', 'owner')
+        tag_rows = (
+            ProjectTag.objects
+            .filter(project__in=filter_projects(_base_qs(), params, exclude=('tags',)).values('id'))
+            .values_list('name')
+            .annotate(n=Count('id'))
+            .order_by('name')
+        )
+        return Response({
+            'count': filter_projects(_base_qs(), params).count(),
+            'status': choice_counts('status', _status_choices()),
+            'health': choice_counts('health', _health_choices()),
+            'owner': [{'value': o, 'count': n} for o, n in sorted(owners.items()) if o],
+            'tags': [{'value': t, 'count': n} for t, n in tag_rows if t.strip()],
+        })
 
     @action(detail=False, methods=['get'], url_path='filters/status')
     def filter_status(self, _):
@@ -227,30 +738,29 @@ class ProjectViewSet(viewsets.ModelViewSet):
         return Response(_health_choices())
    
     @action(detail=False, methods=['get'], url_path='deleted')
-    def list_deleted(self, _):
-        qs = Project.objects.filter(is_deleted=True).order_by('-last_updated')
-        page = self.paginate_queryset(qs)
-        print("Deleted projects queryset:", self.request.query_params)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = self.get_serializer(qs, many=True)
-        return Response(serializer.data)
+    def list_deleted(self, request):
+        qs = Project.objects.filter(is_deleted=True).order_by('-last_updated', '-id')
+        etag = _collection_validator(request, qs)
+        not_modified = _not_modified(request, etag, None)
+        if not_modified is not None:
+            return not_modified
+        return _set_validators(self._page_response(qs), etag, None)
 
     # Bulk recover deleted projects
     @action(detail=False, methods=['post'], url_path='bulk-recover')
     def bulk_recover(self, request):
         ids = request.data.get('ids')
-        if not ids or not isinstance(ids, (list, tuple)):
-            raise ParseError("`ids` must be a non-empty list of project IDs.")
-        qs = Project.objects.filter(id__in=ids, is_deleted=True)
-        found = list(qs.values_list('id', flat=True))
-        if not found:
-            return Response({"updated_count": 0, "requested_ids": ids, "found_ids": []})
-        updated_count = 0
-        for p in qs:
-            p.restore()
-            updated_count += 1
+        id_list = _parse_ids(ids)
+        # set-based, like bulk_update: one UPDATE and one projects_batch event
+        with coalesce(), write_transaction():
+            qs = Project.objects.filter(id__in=_id_in(id_list), is_deleted=True)
+            found = list(qs.order_by('id').values_list('id', flat=True))
+            if not found:
+                return Response({"updated_count": 0, "requested_ids": ids, "found_ids": []})
+            now = timezone.now()
+            restored = Project.objects.filter(id__in=_id_in(found))
+            updated_count = restored.update(is_deleted=False, version=F('version') + 1, last_updated=now)
+            emit_rows_changed(restored.filter(last_updated=now), ['is_deleted', 'version', 'last_updated'])
         return Response({
             "updated_count": updated_count,
             "requested_ids": ids,
@@ -0,0 +1,53 @@
+import hmac
+import json
+
+from django.conf import settings
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+
+from . import ingest as _ingest
+
+MAX_SAMPLES = 10000
+MAX_REPORTED_ERRORS = 20
+
+@csrf_exempt
+@require_POST
+def ingest(request):
+    """
+    POST /api/v1/projects/ingest/ — progress/health samples from CI agents:
+      {"samples": [{"id": 1, "progress": 42.5, "health": "warning"}, ...]}
+    A plain view, skipping DRF and ProjectSerializer. Samples are buffered
+    (latest per project wins) and written every INGEST_FLUSH_INTERVAL_SECS,
+    so the answer is 202. Set INGEST_TOKEN to require
+    `Authorization: Bearer <token>`; the endpoint is csrf-exempt for agents.
+    """
+    token = getattr(settings, "INGEST_TOKEN", None)
+    if token:
+        given = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+        if not hmac.compare_digest(given, token):
+            return JsonResponse({"detail": "Invalid ingest token."}, status=401)
+    try:
+        body = json.loads(request.body)
+    except ValueError:
+        return JsonResponse({"detail": "Body must be JSON."}, status=400)
+    raw = body.get("samples") if isinstance(body, dict) else body
+    if not isinstance(raw, list) or not raw:
+        return JsonResponse({"detail": "`samples` must be a non-empty list."}, status=400)
+    if len(raw) > MAX_SAMPLES:
+        return JsonResponse({"detail": f"At most {MAX_SAMPLES} samples per request."}, status=400)
+
+    samples, errors = [], []
+    for index, item in enumerate(raw):
+        try:
+            samples.append(_ingest.clean_sample(item))
+        except ValueError as exc:
+            errors.append({"index": index, "error": str(exc)})
+    buffered = _ingest.submit(samples) if samples else 0
+    return JsonResponse({
+        "accepted": len(samples),
+        "rejected": len(errors),
+        "errors": errors[:MAX_REPORTED_ERRORS],
+        "buffered": buffered,
+        "flush_interval": _ingest.interval(),
+    }, status=202 if samples else 400)
@@ -0,0 +1,16 @@
+from django.http import HttpResponse
+from django.views.decorators.http import require_GET
+
+from . import metrics as _metrics
+
+@require_GET
+def metrics(request):
+    """
+    Prometheus text endpoint: /api/v1/metrics
+    - request latency, SQL and serialization histograms per view action
+    - SSE subscribers, queue depths and dropped-subscriber totals
+    - ingest buffer and flush counters
+    With METRICS_BACKEND = "sqlite" the numbers cover every worker (each
+    flushes every METRICS_FLUSH_SECS); otherwise only the one answering.
+    """
+    return HttpResponse(_metrics.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
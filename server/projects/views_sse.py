@@ -1,24 +1,39 @@
+import asyncio
 import json
 import time
 from django.http import StreamingHttpResponse
 from django.views.decorators.http import require_GET
 from django.utils.timezone import now
-from .realtime import subscribe, unsubscribe
+from .realtime import ProjectFilter, subscribe, subscribe_async, unsubscribe, unsubscribe_async
 
 HEARTBEAT_SECS = 15
 
-def _sse(data: str) -> bytes:
-    # minimal SSE framing
+def _sse(data: str, event_id=None) -> bytes:
+    # minimal SSE framing; the id lets EventSource resume via Last-Event-ID
+    if event_id is not None:
+        return f"id: {event_id}\ndata: {data}\n\n".encode("utf-8")
     return f"data: {data}\n\n".encode("utf-8")
 
+def _last_event_id(request):
+    # EventSource sends the header on its own reconnects; clients that
+    # reconnect manually can pass ?last_event_id= instead
+    raw = request.headers.get("Last-Event-ID") or request.GET.get("last_event_id")
+    try:
+        return int(raw) if raw else None
+    except ValueError:
+        return None
+
 @require_GET
 def project_stream(request):
     """
     SSE endpoint: /api/v1/projects/stream/
     - sync generator, safe with thread-based runserver
     - heartbeats every HEARTBEAT_SECS
+    - replays missed events after Last-Event-ID, or sends a single resync
+    - accepts the list filters (status, owner, health, tags, ids, is_deleted)
+      and only sends events for matching projects
     """
-    q = subscribe()
+    q = subscribe(_last_event_id(request), ProjectFilter.from_params(request.GET))
 
     def gen():
         try:
@@ -28,8 +43,8 @@ def project_stream(request):
             while True:
                 try:
                     # poll with timeout for heartbeat
-                    item = q.get(timeout=1.0)
-                    yield _sse(item)
+                    event_id, data = q.get(timeout=1.0)
+                    yield _sse(data, event_id)
                     last = time.time()
                 except Exception:
                     # timeout -> maybe send heartbeat
@@ -39,7 +54,40 @@ def project_stream(request):
         finally:
             unsubscribe(q)
 
-    resp = StreamingHttpResponse(gen(), content_type="text/event-stream")
+    return _stream_response(gen())
+
+
+@require_GET
+async def project_stream_async(request):
+    """
+    ASGI variant of /api/v1/projects/stream/
+    - one asyncio task per connection, no worker thread held
+    - idle connections only wake for events or the heartbeat timer
+    """
+    sub = subscribe_async(_last_event_id(request), ProjectFilter.from_params(request.GET))
+
+    async def gen():
+        try:
+            yield _sse(json.dumps({"type": "hello", "ts": now().isoformat()}))
+            while True:
+                try:
+                    item = await asyncio.wait_for(sub.get(), timeout=HEARTBEAT_SECS)
+                except asyncio.TimeoutError:
+                    yield _sse(json.dumps({"type": "heartbeat"}))
+                    continue
+                if item is None:
+                    # dropped for falling behind; the client will reconnect
+                    break
+                event_id, data = item
+                yield _sse(data, event_id)
+        finally:
+            unsubscribe_async(sub)
+
+    return _stream_response(gen())
+
+
+def _stream_response(gen):
+    resp = StreamingHttpResponse(gen, content_type="text/event-stream")
     resp["Cache-Control"] = "no-cache"
     resp["X-Accel-Buffering"] = "no"  # helpful if later behind nginx
     return resp
@@ -0,0 +1,78 @@
+import os
+import tempfile
+import threading
+from typing import Callable, Dict, Tuple
+
+from django.conf import settings
+from django.db import transaction
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX dev machines run one process
+    fcntl = None
+
+# fields whose changes can alter the owner/tag vocabularies
+VOCAB_FIELDS = frozenset({"owner", "tags", "is_deleted"})
+
+
+class Generation:
+    """
+    Counter shared by every worker through a small file. Bumping it marks all
+    cached vocabularies stale; reading it costs one small read, no DB work.
+    The file is replaced whole, so a reader never sees it half written.
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+
+    def current(self) -> int:
+        try:
+            with open(self.path, "rb") as f:
+                return int(f.read() or 0)
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def bump(self) -> int:
+        # the lock only serialises bumps; readers go straight to self.path
+        lock = os.open(self.path + ".lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            value = self.current() + 1
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path) or ".", prefix=".vocab-")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(str(value).encode())
+                os.chmod(tmp, 0o644)
+                os.replace(tmp, self.path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+            return value
+        finally:
+            os.close(lock)  # releases the lock
+
+
+generation = Generation(settings.VOCAB_GENERATION_PATH)
+
+_cache: Dict[str, Tuple[int, object]] = {}
+_lock = threading.Lock()
+
+
+def cached(name: str, gen: int, compute: Callable[[], object]):
+    """Per-process value for name, recomputed only when the generation moved."""
+    with _lock:
+        hit = _cache.get(name)
+    if hit is not None and hit[0] == gen:
+        return hit[1]
+    value = compute()
+    with _lock:
+        _cache[name] = (gen, value)
+    return value
+
+
+def invalidate(fields=None):
+    """Bump the generation after commit if a write touched vocabulary fields."""
+    if fields is not None and VOCAB_FIELDS.isdisjoint(fields):
+        return
+    transaction.on_commit(generation.bump)
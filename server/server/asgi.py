@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'server.settings')
+# Hold SSE connections as asyncio tasks instead of worker threads
+os.environ.setdefault('SSE_ASYNC', '1')
 
 application = get_asgi_application()
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -44,6 +45,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'projects.middleware.PerformanceMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.security.SecurityMiddleware',
@@ -61,6 +63,14 @@ CORS_ALLOWED_ORIGINS = [
 
 CORS_ALLOW_CREDENTIALS = True
 
+# JSON rendering is timed as serialization in Server-Timing and /api/v1/metrics
+REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": [
+        "projects.renderers.TimedJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+}
+
 CSRF_TRUSTED_ORIGINS = [
     "http://localhost:5173",
     "http://127.0.0.1:5173",
@@ -95,11 +105,83 @@ WSGI_APPLICATION = 'server.wsgi.application'
 
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
+        # Django's SQLite backend plus BEGIN IMMEDIATE for write_transaction()
+        'ENGINE': 'projects.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': int(os.environ.get("CONN_MAX_AGE", 60)),
+        'CONN_HEALTH_CHECKS': True,
+        # a file, not :memory:, so tests see WAL, the busy timeout and
+        # concurrent connections the way the server does
+        'TEST': {'NAME': BASE_DIR / 'test_db.sqlite3'},
     }
 }
 
+# Applied to every new SQLite connection (projects.sqlite.configure_connection).
+# WAL lets readers run during a write and survives restarts; NORMAL sync is
+# safe under WAL (a power loss may drop the last commits, never corrupts).
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'busy_timeout': int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", 5000)),
+    'synchronous': 'NORMAL',
+    'cache_size': -64000,       # KiB, per connection
+    'mmap_size': 268435456,
+    'temp_store': 'MEMORY',
+}
+# write_transaction() retries BEGIN IMMEDIATE this often when the busy timeout runs out
+SQLITE_BEGIN_RETRIES = 3
+SQLITE_BEGIN_BACKOFF_SECS = 0.05
+
+# Optional read replica: safe-method requests on the projects API read from
+# it (see projects/routing.py). Locally, a second SQLite file kept current by
+# `manage.py replicate_sqlite`.
+DATABASE_REPLICA_PATH = os.environ.get("DATABASE_REPLICA_PATH")
+if DATABASE_REPLICA_PATH:
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'NAME': DATABASE_REPLICA_PATH,
+        'TEST': {'MIRROR': 'default'},
+    }
+DATABASE_READ_ALIAS = os.environ.get("DATABASE_READ_ALIAS", "replica" if DATABASE_REPLICA_PATH else None)
+DATABASE_ROUTERS = ['projects.routing.ReadReplicaRouter']
+# After a write, that client reads from the primary for this many seconds
+READ_AFTER_WRITE_SECS = int(os.environ.get("READ_AFTER_WRITE_SECS", 5))
+
+
+# Realtime (SSE) event bus
+# "inprocess" only reaches subscribers of the worker that published;
+# use "sqlite" when running more than one gunicorn worker.
+
+REALTIME_BACKEND = os.environ.get("REALTIME_BACKEND", "inprocess")
+REALTIME_SQLITE_PATH = os.environ.get("REALTIME_SQLITE_PATH", BASE_DIR / "realtime.sqlite3")
+REALTIME_SQLITE_POLL_SECS = 0.1
+# Ring buffer of recent events replayed to clients reconnecting with Last-Event-ID
+REALTIME_REPLAY_EVENTS = 1000
+REALTIME_REPLAY_BYTES = 1024 * 1024
+# Merge single-project events published within this window into one
+# projects_batch event (0 = send each event right after its commit)
+REALTIME_COALESCE_WINDOW_SECS = 0
+
+# /api/v1/metrics: "inprocess" reports the worker that answers the scrape;
+# "sqlite" has every worker flush into one file, so any worker reports all
+METRICS_BACKEND = os.environ.get("METRICS_BACKEND", "inprocess")
+METRICS_SQLITE_PATH = os.environ.get("METRICS_SQLITE_PATH", BASE_DIR / "metrics.sqlite3")
+METRICS_FLUSH_SECS = 5
+
+# Serve /projects/stream/ from the asyncio view; server/asgi.py turns this on
+SSE_ASYNC = os.environ.get("SSE_ASYNC") == "1"
+
+# Write-behind ingestion (POST /api/v1/projects/ingest/): samples are buffered
+# per worker and flushed this often. Unflushed samples are lost if the worker
+# dies; 0 writes each request through before it is answered.
+INGEST_FLUSH_INTERVAL_SECS = float(os.environ.get("INGEST_FLUSH_INTERVAL_SECS", 2))
+# Flush early once this many projects are buffered
+INGEST_MAX_BUFFERED = 10000
+# When set, ingest requests need "Authorization: Bearer <token>"
+INGEST_TOKEN = os.environ.get("INGEST_TOKEN")
+
+# Generation counter shared by all workers; bumped when owner/tag vocabularies change
+VOCAB_GENERATION_PATH = os.environ.get("VOCAB_GENERATION_PATH", BASE_DIR / "vocab.generation")
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators